@@ -0,0 +1,12 @@
+from beanie import init_beanie
+from mongomock_motor import AsyncMongoMockClient
+
+from bot.db import DOCUMENT_MODELS
+
+
+async def init_models():
+    """Bind documents to an in-memory database to build them offline."""
+    await init_beanie(
+        database=AsyncMongoMockClient()['benchmarks'],
+        document_models=list(DOCUMENT_MODELS),
+    )
@@ -0,0 +1,78 @@
+"""Measure photo normalization throughput, in a single process and a pool.
+
+Run from the project root with `PYTHONPATH=src`:
+`python -m benchmarks.images --photos 40 --workers 2`.
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from itertools import repeat
+
+from PIL import Image
+
+from bot.images import ImageProfile, normalize_image
+from config import config
+
+
+def run(count: int, workers: int, width: int, height: int):
+    """Report images per second, overall and per worker process."""
+    photos = build_photos(count, width, height)
+    profile = ImageProfile(
+        format=config.images.format,
+        max_side=config.images.max_side,
+        max_bytes=config.images.max_bytes,
+        quality=config.images.quality,
+        thumbnail_side=config.images.thumbnail_side,
+    )
+
+    started = time.perf_counter()
+    normalized = [normalize_image(photo, profile) for photo in photos]
+    single = count / (time.perf_counter() - started)
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(normalize_image, photos[:workers], repeat(profile)))
+        started = time.perf_counter()
+        list(pool.map(normalize_image, photos, repeat(profile)))
+        pooled = count / (time.perf_counter() - started)
+
+    source = sum(map(len, photos)) / count
+    stored = sum(
+        len(image.image) + len(image.thumbnail) for image in normalized
+    ) / count
+    print(f'photos: {count} of {width}x{height}, cpus: {os.cpu_count()}')
+    print(f'size: {source / 1024:.0f} KiB in, {stored / 1024:.0f} KiB out')
+    print(f'single process: {single:.1f} images/s')
+    print(
+        f'pool of {workers}: {pooled:.1f} images/s, '
+        f'{pooled / workers:.1f} per worker'
+    )
+
+
+def build_photos(count: int, width: int, height: int) -> list[bytes]:
+    """Build JPEG photos of smooth content with grain and EXIF."""
+    photos = []
+    for index in range(count):
+        grain = Image.effect_noise((width, height), 8 + index % 8)
+        gradient = Image.linear_gradient('L').resize((width, height))
+        image = Image.merge(
+            'RGB', (gradient, grain, gradient.rotate(index * 15))
+        )
+        buffer = BytesIO()
+        image.save(
+            buffer, format='JPEG', quality=95, exif=Image.Exif().tobytes()
+        )
+        photos.append(buffer.getvalue())
+    return photos
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--photos', type=int, default=40)
+    parser.add_argument('--workers', type=int, default=config.images.workers)
+    parser.add_argument('--width', type=int, default=1280)
+    parser.add_argument('--height', type=int, default=960)
+    args = parser.parse_args()
+    run(args.photos, args.workers, args.width, args.height)
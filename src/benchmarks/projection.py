@@ -0,0 +1,70 @@
+"""Compare full plant documents with the list summary projection.
+
+Run from the project root with `PYTHONPATH=src`:
+`python -m benchmarks.projection --rows 1000`.
+"""
+
+import argparse
+import asyncio
+import time
+
+import bson
+from beanie.odm.utils.encoder import Encoder
+
+from benchmarks.common import init_models
+from benchmarks.render import build_detailed_plants
+from bot.models import Plant, PlantSummary
+
+SUMMARY_FIELDS = tuple(
+    field.alias or name for name, field in PlantSummary.model_fields.items()
+)
+MS_PER_THOUSAND_ROWS = 1_000_000
+
+
+def run(rows: int, repeat: int, seed: int):
+    """Time validation of stored rows and report their encoded size."""
+    encoder = Encoder(to_db=True)
+    documents = [
+        encoder.encode(plant) for plant in build_detailed_plants(rows, seed)
+    ]
+    summaries = [
+        {key: document[key] for key in SUMMARY_FIELDS}
+        for document in documents
+    ]
+
+    full_time = _best(repeat, Plant, documents)
+    summary_time = _best(repeat, PlantSummary, summaries)
+    full_size = sum(len(bson.encode(document)) for document in documents)
+    summary_size = sum(len(bson.encode(summary)) for summary in summaries)
+
+    scale = MS_PER_THOUSAND_ROWS / rows
+    print(f'rows: {rows}, best of {repeat}')
+    print(
+        f'full:    {full_time * scale:.2f} ms per 1k rows, '
+        f'{full_size / rows:.0f} bytes per row'
+    )
+    print(
+        f'summary: {summary_time * scale:.2f} ms per 1k rows, '
+        f'{summary_size / rows:.0f} bytes per row'
+    )
+    print(f'speedup: {full_time / summary_time:.1f}x')
+
+
+def _best(repeat: int, model, documents: list[dict]) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for document in documents:
+            model.model_validate(document)
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=1000)
+    parser.add_argument('--repeat', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    asyncio.run(init_models())
+    run(args.rows, args.repeat, args.seed)
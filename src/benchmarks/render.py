@@ -0,0 +1,70 @@
+"""Measure the cost of rendering plant cards with and without the cache.
+
+Run from the project root with `PYTHONPATH=src`:
+`python -m benchmarks.render --plants 1000`.
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import date, datetime
+
+from beanie import PydanticObjectId
+
+from benchmarks.common import init_models
+from benchmarks.schedule import build_plants
+from bot.models import Plant
+from bot.view import format_plant_message_html, render_cache, render_plant_card
+
+
+def run(count: int, views: int, seed: int):
+    """Time full renders against repeated views served from the cache."""
+    plants = build_detailed_plants(count, seed)
+    render_cache.maxsize = max(render_cache.maxsize, count)
+
+    render_time = _best(
+        views, lambda: [render_plant_card(plant) for plant in plants]
+    )
+    for plant in plants:
+        format_plant_message_html(plant)
+    cached_time = _best(
+        views, lambda: [format_plant_message_html(warm) for warm in plants]
+    )
+
+    print(f'plants: {count}, best of {views} views')
+    print(f'render: {render_time / count * 1e6:.2f} us per card')
+    print(f'cached: {cached_time / count * 1e6:.2f} us per card')
+
+
+def build_detailed_plants(count: int, seed: int) -> list[Plant]:
+    """Build stored-looking plants with full schedules and dates."""
+    plants = build_plants(count, count, seed)
+    for plant in plants:
+        plant.id = PydanticObjectId()
+        plant.updated_at = datetime(2024, 1, 1)
+        plant.scientific_name = 'Plantae benchmarkii'
+        plant.description = 'A plant with a long description. ' * 5
+        plant.last_watered_at = date(2024, 1, 1)
+        plant.last_fertilized_at = plant.last_watered_at
+        plant.next_watering_at = date(2024, 2, 1)
+        plant.next_fertilizing_at = plant.next_watering_at
+    return plants
+
+
+def _best(repeat: int, func) -> float:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--plants', type=int, default=1000)
+    parser.add_argument('--views', type=int, default=5)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    asyncio.run(init_models())
+    run(args.plants, args.views, args.seed)
@@ -0,0 +1,111 @@
+"""Compare per-plant and batch schedule calculation.
+
+Run from the project root with `PYTHONPATH=src`:
+`python -m benchmarks.schedule --plants 100000`.
+"""
+
+import argparse
+import asyncio
+import random
+import time
+
+from benchmarks.common import init_models
+from bot.models import (
+    FertilizingPeriod,
+    FertilizingType,
+    FrequencyType,
+    MonthDay,
+    Plant,
+    WateringPeriod,
+    WateringSchedule,
+)
+from bot.models.schedule import next_fertilizing_dates, next_watering_dates
+
+
+def build_plants(count: int, shapes: int, seed: int) -> list[Plant]:
+    """Build plants drawing schedules from a limited set of shapes."""
+    rng = random.Random(seed)
+    pool = [_random_plant(rng) for _ in range(shapes)]
+    return [
+        plant.model_copy(deep=True)
+        for plant in rng.choices(pool, k=count)
+    ]
+
+
+def run(count: int, shapes: int, seed: int):
+    """Time both implementations and check that they agree."""
+    plants = build_plants(count, shapes, seed)
+
+    started = time.perf_counter()
+    scalar = [
+        (
+            _scalar(plant.next_watering_date),
+            _scalar(plant.next_fertilizing_date),
+        )
+        for plant in plants
+    ]
+    scalar_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    batch = list(
+        zip(next_watering_dates(plants), next_fertilizing_dates(plants))
+    )
+    batch_time = time.perf_counter() - started
+
+    assert batch == scalar, 'batch engine disagrees with Plant methods'
+    print(f'plants: {count}, schedule shapes: {shapes}')
+    print(f'per plant: {scalar_time:.3f} s')
+    print(f'batch:     {batch_time:.3f} s')
+    print(f'speedup:   {scalar_time / batch_time:.1f}x')
+
+
+def _scalar(method):
+    try:
+        return method()
+    except ValueError:
+        return None
+
+
+def _random_plant(rng: random.Random) -> Plant:
+    return Plant(
+        user_id=rng.randint(1, 10000),
+        name='Benchmark',
+        warm_period=_random_period(rng),
+        cold_period=_random_period(rng),
+        fertilizing=FertilizingPeriod(
+            start=_random_day(rng),
+            end=_random_day(rng),
+            frequency=rng.randint(1, 6),
+            type=rng.choice(list(FertilizingType)),
+        ),
+    )
+
+
+def _random_period(rng: random.Random) -> WateringPeriod:
+    schedule_type = rng.choice(list(FrequencyType))
+    if schedule_type == FrequencyType.monthly:
+        schedule = WateringSchedule(
+            type=schedule_type, monthday=rng.randint(1, 31)
+        )
+    else:
+        schedule = WateringSchedule(
+            type=schedule_type,
+            weekday=set(rng.sample(range(7), rng.randint(1, 3))),
+        )
+    return WateringPeriod(
+        start=_random_day(rng), end=_random_day(rng), schedule=schedule
+    )
+
+
+def _random_day(rng: random.Random) -> MonthDay:
+    return MonthDay(day=rng.randint(1, 28), month=rng.randint(1, 12))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--plants', type=int, default=100000)
+    parser.add_argument('--shapes', type=int, default=1000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+    asyncio.run(init_models())
+    run(args.plants, args.shapes, args.seed)
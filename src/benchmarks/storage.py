@@ -0,0 +1,111 @@
+"""Compare per-upload latency of a fresh and a long-lived S3 client.
+
+By default the uploads go to an in-process moto S3 server, which needs
+`pip install 'moto[server]'`. Pass `--endpoint` to use a real S3
+compatible endpoint instead, for example a local MinIO:
+`docker run -p 9000:9000 minio/minio server /data`.
+Run from the project root with `PYTHONPATH=src`:
+`python -m benchmarks.storage --uploads 100`.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import time
+from contextlib import contextmanager, suppress
+from functools import partial
+
+from bot.utils.storage import S3StorageService
+
+LOCAL_HOST = '127.0.0.1'
+MS_IN_SECOND = 1000
+
+
+async def run(endpoint: str, uploads: int, size: int):
+    """Upload the same payload with both client lifecycles."""
+    service = S3StorageService()
+    service.endpoint_url = endpoint
+    service.bucket = 'benchmarks'
+    payload = os.urandom(size)
+    s3 = await service._s3_client()
+    with suppress(s3.exceptions.BucketAlreadyOwnedByYou):
+        await s3.create_bucket(Bucket=service.bucket)
+
+    lifecycles = (
+        ('fresh', partial(_fresh_client_upload, service, payload)),
+        ('shared', partial(_shared_client_upload, service, payload)),
+    )
+    for name, upload in lifecycles:
+        timings = await _measure(upload, uploads, name)
+        print(
+            f'{name:>6}: mean {statistics.mean(timings):.1f} ms, '
+            f'p50 {statistics.median(timings):.1f} ms, '
+            f'max {max(timings):.1f} ms'
+        )
+    await service.stop()
+
+
+@contextmanager
+def moto_endpoint():
+    """Serve S3 from moto in a background thread for the benchmark."""
+    from moto.server import ThreadedMotoServer
+
+    logging.getLogger('werkzeug').setLevel(logging.WARNING)
+    server = ThreadedMotoServer(ip_address=LOCAL_HOST, port=0, verbose=False)
+    server.start()
+    try:
+        host, port = server.get_host_and_port()
+        yield f'http://{host}:{port}'
+    finally:
+        server.stop()
+
+
+async def _fresh_client_upload(
+    service: S3StorageService, payload: bytes, key: str
+):
+    async with service.session.client(
+        's3',
+        endpoint_url=service.endpoint_url,
+        aws_secret_access_key=service.aws_secret_key,
+        aws_access_key_id=service.aws_access_key,
+    ) as client:
+        await client.put_object(Bucket=service.bucket, Key=key, Body=payload)
+
+
+async def _shared_client_upload(
+    service: S3StorageService, payload: bytes, key: str
+):
+    await service.upload_file(key, payload)
+
+
+async def _measure(upload, uploads: int, prefix: str) -> list[float]:
+    timings = []
+    for index in range(uploads):
+        started = time.perf_counter()
+        await upload(f'{prefix}/{index}.jpg')
+        timings.append((time.perf_counter() - started) * MS_IN_SECOND)
+    return timings
+
+
+def main(args: argparse.Namespace):
+    """Run against the given endpoint or a local moto server."""
+    if args.endpoint:
+        _report(args.endpoint, args)
+        return
+    with moto_endpoint() as endpoint:
+        _report(endpoint, args)
+
+
+def _report(endpoint: str, args: argparse.Namespace):
+    print(f'uploads: {args.uploads} x {args.size} bytes to {endpoint}')
+    asyncio.run(run(endpoint, args.uploads, args.size))
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--endpoint', default=os.environ.get('S3_ENDPOINT'))
+    parser.add_argument('--uploads', type=int, default=100)
+    parser.add_argument('--size', type=int, default=200_000)
+    main(parser.parse_args())
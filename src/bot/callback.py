@@ -1,6 +1,10 @@
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as DecodeError
 from enum import StrEnum, auto
 
 from aiogram.filters.callback_data import CallbackData
+from beanie import PydanticObjectId
+from bson.errors import InvalidId
 
 
 class DayCallback(CallbackData, prefix='day'):
@@ -13,6 +17,11 @@ class PlantActionCallback(CallbackData, prefix='plant'):
     is_fertilized: bool
 
 
+class DigestCallback(CallbackData, prefix='digest'):
+    idx: str | None
+    is_fertilized: bool
+
+
 class Action(StrEnum):
     next = auto()
     prev = auto()
@@ -23,4 +32,25 @@ class Action(StrEnum):
 
 class ChoicePlantCallback(CallbackData, prefix='choice'):
     action: Action
-    name: str | None
+    idx: str | None = None
+
+
+def pack_id(idx: PydanticObjectId | str) -> str:
+    """Encode the 12 ObjectId bytes as 16 base64url characters."""
+    return urlsafe_b64encode(PydanticObjectId(idx).binary).decode()
+
+
+def unpack_id(packed: str | None) -> PydanticObjectId | None:
+    """Decode an id packed into callback data, None if it is malformed.
+
+    Keyboards sent before ids were packed carry the 24 hex characters, so
+    those are still accepted.
+    """
+    if not packed:
+        return None
+    if PydanticObjectId.is_valid(packed):
+        return PydanticObjectId(packed)
+    try:
+        return PydanticObjectId(urlsafe_b64decode(packed))
+    except (DecodeError, InvalidId, TypeError):
+        return None
@@ -1,6 +1,16 @@
 from bot.constants.constants import (
     JOB_ID,
     PLANT_DELETED_MESSAGE,
+    PLANT_WATERED_ALERT,
+    PLANTS_WATERED_ALERT,
+    WATER_ALL_BUTTON,
+    WATER_FERTILIZE_ALL_BUTTON,
+    WATER_ONE_BUTTON,
+    WATERING_DIGEST_FERT,
+    WATERING_DIGEST_LINE,
+    WATERING_DIGEST_MESSAGE,
+    WATERING_DIGEST_OVERDUE,
+    WATERING_OVERDUE_MESSAGE,
     WATERING_SCHEDULED_MESSAGE,
 )
 from bot.constants.error import (
@@ -74,6 +84,16 @@ __all__ = [
     'NO_USER_MSG',
     'NOT_REGISTERED_MSG',
     'WATERING_SCHEDULED_MESSAGE',
+    'WATERING_DIGEST_MESSAGE',
+    'WATERING_DIGEST_LINE',
+    'WATERING_DIGEST_FERT',
+    'WATERING_DIGEST_OVERDUE',
+    'WATERING_OVERDUE_MESSAGE',
+    'WATER_ALL_BUTTON',
+    'WATER_FERTILIZE_ALL_BUTTON',
+    'WATER_ONE_BUTTON',
+    'PLANT_WATERED_ALERT',
+    'PLANTS_WATERED_ALERT',
     'WEEKDAY_MAP',
     'STATE_MESSAGES',
     'ALL_STATES',
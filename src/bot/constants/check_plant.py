@@ -1,3 +1,3 @@
 PLANT_INFO_LINE = '{pos}. {name}\n🚿: {watering}. 🌿: {fertilizing}'
 NO_PLANTS_MESSAGE = 'Пока ничего не отслеживается.'
-PLANT_NOT_FOUND_MESSAGE = '⚠️ Растение с именем «{plant_name}» не найдено.'
+PLANT_NOT_FOUND_MESSAGE = '⚠️ Растение не найдено.'
@@ -70,5 +70,17 @@ PRICE_INFO_MESSAGE = (
 )
 
 WATERING_SCHEDULED_MESSAGE = 'Пришло время полить{fert} растение <b>{name}</b>'
+WATERING_DIGEST_MESSAGE = 'Пришло время полить растения:\n{lines}'
+WATERING_DIGEST_LINE = '• <b>{name}</b>{fert}'
+WATERING_DIGEST_FERT = ' (и удобрить)'
+WATERING_OVERDUE_MESSAGE = (
+    '⏰ Растение <b>{name}</b> ждёт полива{fert} уже {days} дн.'
+)
+WATERING_DIGEST_OVERDUE = ' ⏰ {days} дн.'
+WATER_ALL_BUTTON = '💧 Полить все'
+WATER_FERTILIZE_ALL_BUTTON = '✅ Полить и удобрить все'
+WATER_ONE_BUTTON = '💧 {name}'
+PLANT_WATERED_ALERT = 'Растение {name} полито'
+PLANTS_WATERED_ALERT = 'Полито растений: {count}'
 DELETE_CANCELED_MSG = 'Удаление отменено'
 CHECK_CANCELED_MSG = 'Просмотр информации отменен.'
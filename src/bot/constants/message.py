@@ -5,3 +5,16 @@ FERTILIZING_SKIP_MSG = (
 )
 FIRST_STEP_MSG = 'Это первый шаг!'
 BACK_TO_PREV_STEP_MSG = '⬅️ Возврат к предыдущему шагу.'
+DELIVERY_STATS_MSG = (
+    '📤 Очередь отправки: {depth}\n'
+    '⏱ Скорость отправки: {rate:.2f} сообщ./с\n'
+    '✅ Отправлено: {sent}\n'
+    '❌ Не доставлено: {failed}\n'
+    '🔁 Повторов: {retried}'
+)
+CACHE_STATS_MSG = (
+    '🗄 Кэш {name}: {hits} попаданий ({rate:.0%}), {misses} промахов, '
+    '{currsize}/{maxsize}'
+)
+EXPLAIN_PLAN_MSG = '🔎 {name}: {plan}'
+EXPLAIN_COLLSCAN_MSG = '⚠️ {name}: {plan}'
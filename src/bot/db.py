@@ -1,13 +1,112 @@
-from beanie import init_beanie
-from pymongo import AsyncMongoClient
+import asyncio
+from collections import defaultdict
+from collections.abc import Sequence
+from logging import getLogger
 
-from bot.models import Plant, User
+from beanie import Document, init_beanie
+from pymongo import AsyncMongoClient, UpdateOne
+from pymongo.asynchronous.collection import AsyncCollection
+
+from bot.log_message import (
+    INDEX_MISSING_LOG,
+    INDEXES_VERIFIED_LOG,
+    PLANT_RENAMED_LOG,
+)
+from bot.models import (
+    FSMRecord,
+    JobCheckpoint,
+    NotificationOutbox,
+    PhotoUpload,
+    Plant,
+    SchedulerLease,
+    StoredPhoto,
+    User,
+)
 from config import config
 
+USER_NAME_INDEX = 'user_name'
+
+log = getLogger(__name__)
+
 client: AsyncMongoClient = AsyncMongoClient(config.mongo_url)
 
+DOCUMENT_MODELS: tuple[type[Document], ...] = (
+    User,
+    Plant,
+    JobCheckpoint,
+    SchedulerLease,
+    NotificationOutbox,
+    FSMRecord,
+    PhotoUpload,
+    StoredPhoto,
+)
+
 
 async def init_db():
+    database = client[config.mongodb.db]
+    await dedupe_plant_names(database[Plant.Settings.name])
     await init_beanie(
-        database=client[config.mongodb.db], document_models=[User, Plant]
+        database=database, document_models=list(DOCUMENT_MODELS)
     )
+    await verify_indexes(DOCUMENT_MODELS)
+
+
+async def verify_indexes(models: Sequence[type[Document]]) -> list[str]:
+    """Check that every declared index exists and log the missing ones."""
+    reports = await asyncio.gather(*map(_missing_indexes, models))
+    missing = [name for report in reports for name in report]
+    if not missing:
+        log.info(INDEXES_VERIFIED_LOG)
+    return missing
+
+
+async def _missing_indexes(model: type[Document]) -> list[str]:
+    declared = getattr(model.Settings, 'indexes', [])
+    existing = await model.get_pymongo_collection().index_information()
+    missing = [
+        index.document['name']
+        for index in declared
+        if index.document['name'] not in existing
+    ]
+    for name in missing:
+        log.error(INDEX_MISSING_LOG, model.__name__, name)
+    return missing
+
+
+async def dedupe_plant_names(collection: AsyncCollection) -> int:
+    """Rename plants sharing a name with another plant of the same user.
+
+    Older releases checked names before inserting without a unique index,
+    so duplicates may exist and would stop the `user_name` index from being
+    built. Runs only while that index is missing. The oldest plant keeps
+    the name, the others get a numbered suffix. Returns the number of
+    renamed plants.
+    """
+    if USER_NAME_INDEX in await collection.index_information():
+        return 0
+    taken: dict[int, set[str]] = defaultdict(set)
+    duplicates = []
+    projection = {'user_id': 1, 'name': 1}
+    async for plant in collection.find({}, projection).sort('_id', 1):
+        names = taken[plant['user_id']]
+        if plant['name'] in names:
+            duplicates.append(plant)
+        names.add(plant['name'])
+    updates = []
+    for plant in duplicates:
+        names = taken[plant['user_id']]
+        new_name = _free_name(plant['name'], names)
+        names.add(new_name)
+        rename = {'$set': {'name': new_name}}
+        updates.append(UpdateOne({'_id': plant['_id']}, rename))
+        log.warning(PLANT_RENAMED_LOG, plant['_id'], plant['name'], new_name)
+    if updates:
+        await collection.bulk_write(updates, ordered=False)
+    return len(updates)
+
+
+def _free_name(name: str, taken: set[str]) -> str:
+    suffix = 2
+    while f'{name} ({suffix})' in taken:
+        suffix += 1
+    return f'{name} ({suffix})'
@@ -6,9 +6,11 @@ from bot.handlers.check_plants import router as check_plants
 from bot.handlers.cmd import router as cmd_router
 from bot.handlers.delete_plant import router as delete_plant
 from bot.handlers.notifications import router as notification_router
+from bot.handlers.stats import router as stats_router
 
 main_router = Router(name='main_router')
 main_router.include_router(cmd_router)
+main_router.include_router(stats_router)
 main_router.include_router(add_plant_router)
 main_router.include_router(notification_router)
 main_router.include_router(check_plants)
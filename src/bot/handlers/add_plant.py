@@ -9,27 +9,25 @@ from bot.constants import (
     NO_POSITIVE_INT_MSG,
     add_plant,
 )
-from bot.keyboard import (
-    DayCallback,
-    frequency_type_kb,
-    get_cancel_kb,
-    get_main_kb,
-)
+from bot.constants.constants import PLANT_ADDED_MSG
+from bot.keyboard import DayCallback, frequency_type_kb, get_cancel_kb
 from bot.models import FertilizingType, FrequencyType, Plant
 from bot.states import AddPlant, set_next_state
 from bot.utils import (
+    PENDING_SAVE_KEY,
     DateFilter,
     PhotoRequiredFilter,
     TextRequiredFilter,
+    finish_plant,
     handle_biweekly_day,
     handle_day_of_month,
     handle_frequency_choice,
     handle_weekly_days,
     handle_weekly_done,
-    save_plant,
-    storage_service,
+    photo_ingestion,
 )
 from bot.utils.telegram import (
+    require_bot,
     require_callback_data,
     require_message,
     require_text,
@@ -54,13 +52,18 @@ async def process_plant_name(message: Message, state: FSMContext) -> None:
     """Process the plant name sent by the user."""
     user = require_user(message.from_user)
     name = require_text(message)
-    if await Plant.find_one(Plant.user_id == user.id, Plant.name == name):
+    if await Plant.has_name(user.id, name):
         await message.answer(
             add_plant.NOT_UNIQUE_NAME_MSG,
             reply_markup=get_cancel_kb(back=True),
         )
         return
     await state.update_data({'name': name})
+    state_data = await state.get_data()
+    is_fert = state_data.get(PENDING_SAVE_KEY)
+    if is_fert is not None:
+        await finish_plant(message, state, is_fert, PLANT_ADDED_MSG)
+        return
 
     await message.answer(
         add_plant.ASK_DESCRIPTION_MSG,
@@ -89,12 +92,10 @@ async def process_plant_photo(message: Message, state: FSMContext):
     if not photos:
         raise ValueError('Photo is required for this state.')
     file_id = photos[-1].file_id
-    file = await message.bot.get_file(file_id)
-
-    key = await storage_service.upload_telegram_file(
-        file.file_path, message.from_user.id
+    await photo_ingestion.submit(
+        require_bot(message), require_user(message.from_user).id, file_id
     )
-    await state.update_data({'image': file_id, 'storage_key': key})
+    await state.update_data({'image': file_id})
     await message.answer(
         add_plant.ASK_WARM_PERIOD_START_MSG,
         reply_markup=get_cancel_kb(back=True),
@@ -302,10 +303,5 @@ async def process_fertilizing_interval(message: Message, state: FSMContext):
         await message.answer(NO_POSITIVE_INT_MSG)
         return
 
-    state_data = await state.get_data()
-    state_data['user_id'] = require_user(message.from_user).id
-    state_data['fertilizing_frequency'] = value
-    await save_plant(plant_data=state_data, is_fert=True)
-    await message.answer('Растение добавлено.', reply_markup=get_main_kb())
-
-    await state.clear()
+    await state.update_data({'fertilizing_frequency': value})
+    await finish_plant(message, state, True, PLANT_ADDED_MSG)
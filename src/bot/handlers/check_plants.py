@@ -1,11 +1,15 @@
+from collections.abc import AsyncIterator
+
 from aiogram import F, Router
 from aiogram.types import Message
 
 from bot.constants import CHECK_PLANTS
 from bot.constants.check_plant import PLANT_INFO_LINE
 from bot.keyboard import get_main_kb
-from bot.models import Plant
+from bot.utils import plant_summaries
+from bot.utils.streaming import pack_lines, send_chunks
 from bot.utils.telegram import require_user
+from config import config
 
 router = Router(name='check_plants_router')
 
@@ -14,20 +18,26 @@ router = Router(name='check_plants_router')
 async def cmd_check_all(message: Message) -> None:
     """Check all plants handler."""
     user = require_user(message.from_user)
-    plants = await Plant.find_many(Plant.user_id == user.id).to_list()
-    if not plants:
+    sent = await send_chunks(
+        message,
+        pack_lines(_plant_lines(user.id)),
+        reply_markup=get_main_kb(),
+    )
+    if not sent:
         await message.answer(
             'Растения не отслеживаются', reply_markup=get_main_kb()
         )
-        return
 
-    lines = '\n'.join(
-        PLANT_INFO_LINE.format(
-            pos=index,
+
+async def _plant_lines(user_id: int) -> AsyncIterator[str]:
+    position = 0
+    async for plant in plant_summaries.iter(
+        user_id, config.service.list_batch_size
+    ):
+        position += 1
+        yield PLANT_INFO_LINE.format(
+            pos=position,
             name=plant.name,
             watering=plant.last_watered_at,
             fertilizing=plant.last_fertilized_at,
         )
-        for index, plant in enumerate(plants, start=1)
-    )
-    await message.answer(lines, reply_markup=get_main_kb())
@@ -1,7 +1,7 @@
 from logging import getLogger
 
 from aiogram import F, Router
-from aiogram.filters import CommandStart, Command
+from aiogram.filters import Command, CommandStart
 from aiogram.fsm.context import FSMContext
 from aiogram.types import Message
 from aiogram.utils.markdown import hbold
@@ -19,7 +19,7 @@ from bot.keyboard import get_cancel_kb, get_main_kb
 from bot.log_message import BACK_ERROR_LOG
 from bot.models import User
 from bot.states import AddPlant
-from bot.utils import save_plant, storage_service
+from bot.utils import finish_plant, photo_ingestion, registered_users
 from bot.utils.telegram import require_user
 
 router = Router(name='cmd_router')
@@ -50,6 +50,7 @@ async def command_start_handler(message: Message) -> None:
         user.language_code = tg_user.language_code
         user.is_premium = getattr(tg_user, 'is_premium', None)
         await user.save()
+    registered_users.remember(tg_user.id)
     await message.answer(
         f'Привет, {hbold(tg_user.full_name)}!',
         reply_markup=get_main_kb(),
@@ -60,8 +61,10 @@ async def command_start_handler(message: Message) -> None:
 async def cancel_handler(message: Message, state: FSMContext):
     """Cancel handler."""
     state_data = await state.get_data()
-    if 'storage_key' in state_data:
-        await storage_service.delete_file(state_data.get('storage_key'))
+    if state_data.get('image'):
+        await photo_ingestion.discard(
+            require_user(message.from_user).id, state_data['image']
+        )
     await state.clear()
     await message.answer(CANCEL, reply_markup=get_main_kb())
 
@@ -87,14 +90,7 @@ async def skip_handler(message: Message, state: FSMContext):
         await state.set_state(AddPlant.warm_start)
 
     elif current_state == AddPlant.fertilizing_start:
-        state_data = await state.get_data()
-        state_data['user_id'] = require_user(message.from_user).id
-        await save_plant(plant_data=state_data, is_fert=False)
-        await message.answer(
-            FERTILIZING_SKIP_MSG,
-            reply_markup=get_main_kb(),
-        )
-        await state.clear()
+        await finish_plant(message, state, False, FERTILIZING_SKIP_MSG)
 
 
 @router.message(F.text == BACK)
@@ -136,7 +132,7 @@ async def back_handler(message: Message, state: FSMContext):
 
 @router.message(Command('send_notifications'))
 async def send_notifications_handler(message: Message):
-    """Send notifications command handler."""
+    """Send today's notifications that were not delivered yet."""
     await message.answer("Запуск отправки уведомлений...")
     from bot.scheduler import watering_notifications
 
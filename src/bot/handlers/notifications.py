@@ -1,32 +1,85 @@
-from datetime import date
-
 from aiogram import Router
-from aiogram.types import CallbackQuery
-from beanie import PydanticObjectId
+from aiogram.types import CallbackQuery, InlineKeyboardMarkup
 
-from bot.keyboard import PlantActionCallback
+from bot.callback import DigestCallback, PlantActionCallback, unpack_id
+from bot.constants import PLANT_WATERED_ALERT, PLANTS_WATERED_ALERT
 from bot.models import Plant
-from bot.utils.telegram import require_message
+from bot.utils import plant_summaries
+from bot.utils.telegram import require_message, require_user
 
 router = Router(name='notification_router')
 
+PLANT_NOT_FOUND_ALERT = "❌ Растение не найдено"
+
 
 @router.callback_query(PlantActionCallback.filter())
 async def handle_watering_callback(
     callback: CallbackQuery, callback_data: PlantActionCallback
 ):
-    plant = await Plant.get(PydanticObjectId(callback_data.idx))
+    plant = await Plant.get_for_user(
+        unpack_id(callback_data.idx), require_user(callback.from_user).id
+    )
     if not plant:
-        await callback.answer("❌ Растение не найдено", show_alert=True)
+        await callback.answer(PLANT_NOT_FOUND_ALERT, show_alert=True)
         return
-    plant.last_watered_at = date.today()
-    plant.next_watering_date()
-    if callback_data.is_fertilized:
-        plant.last_fertilized_at = date.today()
-        plant.next_fertilizing_date()
-    await plant.save()
+    await plant.acknowledge_watering(callback_data.is_fertilized)
+    plant_summaries.invalidate(plant.user_id)
     message = require_message(callback)
     await message.edit_caption(
         caption=f'Растение {plant.name} полито', reply_markup=None
     )
     await callback.answer()
+
+
+@router.callback_query(DigestCallback.filter())
+async def handle_digest_callback(
+    callback: CallbackQuery, callback_data: DigestCallback
+):
+    user_id = require_user(callback.from_user).id
+    message = require_message(callback)
+
+    if callback_data.idx is None:
+        count = await Plant.acknowledge_due(
+            user_id, callback_data.is_fertilized
+        )
+        plant_summaries.invalidate(user_id)
+        await message.edit_reply_markup(reply_markup=None)
+        await callback.answer(PLANTS_WATERED_ALERT.format(count=count))
+        return
+
+    plant = await Plant.get_for_user(unpack_id(callback_data.idx), user_id)
+    if not plant:
+        await callback.answer(PLANT_NOT_FOUND_ALERT, show_alert=True)
+        return
+    await plant.acknowledge_watering(callback_data.is_fertilized)
+    plant_summaries.invalidate(plant.user_id)
+    await message.edit_reply_markup(
+        reply_markup=_without_button(message.reply_markup, callback.data)
+    )
+    await callback.answer(PLANT_WATERED_ALERT.format(name=plant.name))
+
+
+def _without_button(
+    markup: InlineKeyboardMarkup | None, callback_data: str | None
+) -> InlineKeyboardMarkup | None:
+    """Drop the pressed plant button, or the whole keyboard at the end."""
+    if markup is None:
+        return None
+    rows = [
+        [
+            button
+            for button in row
+            if button.callback_data != callback_data
+        ]
+        for row in markup.inline_keyboard
+    ]
+    rows = [row for row in rows if row]
+    water_all = {
+        DigestCallback(idx=None, is_fertilized=is_fertilized).pack()
+        for is_fertilized in (False, True)
+    }
+    if all(
+        button.callback_data in water_all for row in rows for button in row
+    ):
+        return None
+    return InlineKeyboardMarkup(inline_keyboard=rows)
@@ -0,0 +1,60 @@
+from aiogram import Router
+from aiogram.filters import Command
+from aiogram.types import Message
+
+from bot.constants.message import (
+    CACHE_STATS_MSG,
+    DELIVERY_STATS_MSG,
+    EXPLAIN_COLLSCAN_MSG,
+    EXPLAIN_PLAN_MSG,
+)
+from bot.models import schedule_cache_info
+from bot.utils import delivery_queue, registered_users
+from bot.utils.cache import hit_rate
+from bot.utils.diagnostics import explain_hot_queries, is_collection_scan
+from bot.utils.telegram import require_user
+from bot.view import render_cache
+
+router = Router(name='stats_router')
+
+
+@router.message(Command('stats'))
+async def stats_handler(message: Message):
+    """Outbound delivery and cache statistics command handler."""
+    lines = [
+        DELIVERY_STATS_MSG.format(
+            depth=delivery_queue.depth,
+            rate=delivery_queue.drain_rate,
+            sent=delivery_queue.sent,
+            failed=delivery_queue.failed,
+            retried=delivery_queue.retried,
+        )
+    ]
+    caches = schedule_cache_info()
+    caches['users'] = registered_users.cache.cache_info()
+    caches['cards'] = render_cache.cache_info()
+    lines.extend(
+        CACHE_STATS_MSG.format(
+            name=name,
+            rate=hit_rate(cache_info),
+            **cache_info._asdict(),
+        )
+        for name, cache_info in caches.items()
+    )
+    await message.answer('\n'.join(lines))
+
+
+@router.message(Command('explain'))
+async def explain_handler(message: Message):
+    """Report the query plans of the hot plant queries."""
+    plans = await explain_hot_queries(require_user(message.from_user).id)
+    await message.answer(
+        '\n'.join(
+            (
+                EXPLAIN_COLLSCAN_MSG
+                if is_collection_scan(plan)
+                else EXPLAIN_PLAN_MSG
+            ).format(name=name, plan=plan)
+            for name, plan in plans.items()
+        )
+    )
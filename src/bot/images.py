@@ -0,0 +1,85 @@
+from dataclasses import dataclass
+from io import BytesIO
+from types import MappingProxyType
+
+from PIL import Image, ImageOps
+
+EXTENSIONS = MappingProxyType({'WEBP': 'webp', 'JPEG': 'jpg'})
+QUALITY_STEP = 10
+MIN_QUALITY = 40
+
+
+@dataclass(frozen=True)
+class ImageProfile:
+    """How photos are re-encoded before they are stored."""
+
+    format: str
+    max_side: int
+    max_bytes: int
+    quality: int
+    thumbnail_side: int
+
+    @property
+    def extension(self) -> str:
+        """File extension of the encoded images."""
+        return EXTENSIONS[self.format]
+
+
+@dataclass(frozen=True)
+class NormalizedImage:
+    """Re-encoded photo together with its thumbnail."""
+
+    image: bytes
+    thumbnail: bytes
+
+
+def normalize_image(photo: bytes, profile: ImageProfile) -> NormalizedImage:
+    """Decode a photo and re-encode it without metadata.
+
+    JPEG photos are decoded straight at a reduced scale where possible.
+    The orientation stored in EXIF is applied to the pixels, then the
+    photo is shrunk to `max_side` and encoded with lower quality until it
+    fits `max_bytes`. Runs in worker processes, so it takes and returns
+    only picklable values, and this module imports nothing from the bot
+    that would have to be loaded in every worker.
+    """
+    with Image.open(BytesIO(photo)) as source:
+        source.draft('RGB', (profile.max_side, profile.max_side))
+        image = ImageOps.exif_transpose(source)
+    image = _flatten(image, profile.format)
+    image.info = {}
+    image.thumbnail((profile.max_side, profile.max_side))
+    thumbnail = image.copy()
+    thumbnail.thumbnail((profile.thumbnail_side, profile.thumbnail_side))
+    return NormalizedImage(
+        image=_encode_capped(image, profile),
+        thumbnail=_encode(thumbnail, profile.format, profile.quality),
+    )
+
+
+def thumbnail_key(storage_key: str) -> str:
+    """Storage key of the thumbnail kept next to the photo."""
+    stem, _, extension = storage_key.rpartition('.')
+    return f'{stem}.thumb.{extension}'
+
+
+def _flatten(image: Image.Image, image_format: str) -> Image.Image:
+    has_alpha = 'A' in image.getbands() or 'transparency' in image.info
+    if has_alpha and image_format != 'JPEG':
+        return image.convert('RGBA')
+    return image.convert('RGB')
+
+
+def _encode_capped(image: Image.Image, profile: ImageProfile) -> bytes:
+    quality = profile.quality
+    encoded = _encode(image, profile.format, quality)
+    while len(encoded) > profile.max_bytes and quality > MIN_QUALITY:
+        quality = max(quality - QUALITY_STEP, MIN_QUALITY)
+        encoded = _encode(image, profile.format, quality)
+    return encoded
+
+
+def _encode(image: Image.Image, image_format: str, quality: int) -> bytes:
+    buffer = BytesIO()
+    image.save(buffer, format=image_format, quality=quality)
+    return buffer.getvalue()
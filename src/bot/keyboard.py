@@ -1,4 +1,7 @@
+from collections.abc import Sequence
+
 from aiogram.types import (
+    InlineKeyboardButton,
     InlineKeyboardMarkup,
     KeyboardButton,
     ReplyKeyboardMarkup,
@@ -10,7 +13,9 @@ from bot.callback import (
     Action,
     ChoicePlantCallback,
     DayCallback,
+    DigestCallback,
     PlantActionCallback,
+    pack_id,
 )
 from bot.constants import (
     ADD_PLANT,
@@ -24,8 +29,11 @@ from bot.constants import (
     NEXT_PAGE_BUTTON,
     PREV_PAGE_BUTTON,
     SKIP,
+    WATER_ALL_BUTTON,
+    WATER_FERTILIZE_ALL_BUTTON,
+    WATER_ONE_BUTTON,
 )
-from bot.models import Plant
+from bot.models import PlantNotification, PlantSummary
 
 
 def days_kb(selected: list[int] | None = None, single_choice=False):
@@ -94,20 +102,56 @@ def watering_kb(is_fertilized: bool, idx: PydanticObjectId):
     builder = InlineKeyboardBuilder()
     builder.button(
         text='Растение полито',
-        callback_data=PlantActionCallback(idx=str(idx), is_fertilized=False),
+        callback_data=PlantActionCallback(
+            idx=pack_id(idx), is_fertilized=False
+        ),
     )
     if is_fertilized:
         builder.button(
             text='Растение полито и удобрено',
             callback_data=PlantActionCallback(
-                idx=str(idx), is_fertilized=True
+                idx=pack_id(idx), is_fertilized=True
+            ),
+        )
+    return builder.as_markup()
+
+
+def digest_kb(plants: list[PlantNotification]):
+    """Digest buttons, fertilizing along only from the dedicated button."""
+    builder = InlineKeyboardBuilder()
+    fertilizing = False
+    for plant in plants:
+        is_fertilized = plant.sync_watering_and_fertilizing()
+        fertilizing = fertilizing or is_fertilized
+        builder.button(
+            text=WATER_ONE_BUTTON.format(name=plant.name),
+            callback_data=DigestCallback(
+                idx=pack_id(plant.id), is_fertilized=is_fertilized
             ),
         )
+    builder.adjust(2)
+    builder.row(_water_all_button(WATER_ALL_BUTTON, is_fertilized=False))
+    if fertilizing:
+        builder.row(
+            _water_all_button(WATER_FERTILIZE_ALL_BUTTON, is_fertilized=True)
+        )
     return builder.as_markup()
 
 
+def _water_all_button(text: str, is_fertilized: bool) -> InlineKeyboardButton:
+    return InlineKeyboardButton(
+        text=text,
+        callback_data=DigestCallback(
+            idx=None, is_fertilized=is_fertilized
+        ).pack(),
+    )
+
+
 def get_keyboard_with_navigation(
-    plants: list[Plant], page: int, total_pages: int, action_for_item: Action
+    plants: Sequence[PlantSummary],
+    has_prev: bool,
+    has_next: bool,
+    action_for_item: Action,
 ) -> InlineKeyboardMarkup:
     kb = InlineKeyboardBuilder()
 
@@ -115,7 +159,7 @@ def get_keyboard_with_navigation(
         kb.button(
             text=plant.name,
             callback_data=ChoicePlantCallback(
-                action=action_for_item, name=plant.name
+                action=action_for_item, idx=pack_id(plant.id)
             ).pack(),
         )
 
@@ -123,20 +167,16 @@ def get_keyboard_with_navigation(
 
     nav = InlineKeyboardBuilder()
 
-    if page > 0:
+    if has_prev:
         nav.button(
             text=PREV_PAGE_BUTTON,
-            callback_data=ChoicePlantCallback(
-                action=Action.prev, name=None
-            ).pack(),
+            callback_data=ChoicePlantCallback(action=Action.prev).pack(),
         )
 
-    if page < total_pages - 1:
+    if has_next:
         nav.button(
             text=NEXT_PAGE_BUTTON,
-            callback_data=ChoicePlantCallback(
-                action=Action.next, name=None
-            ).pack(),
+            callback_data=ChoicePlantCallback(action=Action.next).pack(),
         )
 
     if nav.buttons:
@@ -145,9 +185,7 @@ def get_keyboard_with_navigation(
 
     kb.button(
         text=CANCEL,
-        callback_data=ChoicePlantCallback(
-            action=Action.cancel, name=None
-        ).pack(),
+        callback_data=ChoicePlantCallback(action=Action.cancel).pack(),
     )
 
     return kb.as_markup()
@@ -21,9 +21,12 @@ PLANT_LIST_NOT_RECEIVED_LOG = 'Plant list did not received from the database.'
 WATERING_NOTIFICATIONS_SEND_RESULT = (
     'Notifications were sent. Result %s/%s notifications.'
 )
+USER_CACHE_WARMED_LOG = 'Registered-user cache warmed with %s users.'
 SCHEDULER_START_LOG = 'Scheduler started successfully.'
 JOB_EXISTS_LOG = 'Job %s exists.'
 JOB_ADDED_LOG = 'Job %s added to scheduler.'
+JOB_CATCH_UP_LOG = 'Job %s missed its run at %s, running now.'
+SCHEDULER_JOBS_REMOVED_LOG = 'Scheduled jobs removed.'
 SCHEDULER_START_FAILED_LOG = 'Failed to start scheduler: %s'
 XML_ERROR_LOG = 'XML error for %s'
 CURRENCY_NOT_FOUND_LOG = 'Currency rate not found for %s.'
@@ -33,3 +36,21 @@ NO_USER_LOG = 'No user in update — skipped.'
 BACK_ERROR_LOG = 'Back action error: %s'
 STORAGE_UTIL_STARTED_LOG = 'Storage util started'
 FILE_DOWNLOAD_ERROR_LOG = 'File download error for user %s'
+PHOTO_INGESTION_RETRY_LOG = 'Photo %s ingestion failed, retrying: %s'
+PHOTO_INGESTION_FAILED_LOG = 'Photo %s ingestion failed: %s'
+PHOTO_INGESTION_DROPPED_LOG = '%s photos left unprocessed on shutdown'
+EXPIRED_UPLOADS_RELEASED_LOG = 'Released %s photos of abandoned uploads'
+IMAGE_NORMALIZE_ERROR_LOG = 'Photo of user %s stored as received: %s'
+STORAGE_CLIENT_OPENED_LOG = 'S3 client opened with %s pooled connections'
+DELIVERY_RETRY_AFTER_LOG = 'Flood control for chat %s, retry in %s s'
+DELIVERY_RETRY_LOG = 'Delivery to chat %s failed, retrying: %s'
+DELIVERY_FAILED_LOG = 'Delivery to chat %s failed: %s'
+LEADER_ELECTED_LOG = 'Replica %s became scheduler leader.'
+LEADER_DEMOTED_LOG = 'Replica %s lost scheduler leadership.'
+LEASE_RENEW_ERROR_LOG = 'Scheduler lease renewal failed: %s'
+INDEX_MISSING_LOG = 'Index missing for %s: %s'
+INDEXES_VERIFIED_LOG = 'All declared indexes are present.'
+PLANT_RENAMED_LOG = 'Plant %s renamed from %r to %r to keep names unique.'
+OVERDUE_NOTIFICATIONS_RESULT_LOG = (
+    'Overdue reminders delivered: %s of %s, rescheduled: %s'
+)
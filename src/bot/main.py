@@ -14,16 +14,28 @@ from aiohttp import web
 from bot.db import init_db
 from bot.handlers import main_router
 from bot.log_message import BOT_STOPPED_LOG
-from bot.middleware import UserOnlyMiddleware
-from bot.scheduler import set_bot, start_scheduler
+from bot.middleware import FSMScopeMiddleware, UserOnlyMiddleware
+from bot.scheduler import leader_elector, set_bot
+from bot.utils import (
+    delivery_queue,
+    fsm_storage,
+    photo_ingestion,
+    registered_users,
+    storage_service,
+)
 from config import config
 
 
 def setup_bot_and_dispatcher() -> tuple[Bot, Dispatcher]:
     """Bot and Dispatcher setup."""
-    dp = Dispatcher()
+    dp = Dispatcher(storage=fsm_storage)
+    dp.update.outer_middleware(FSMScopeMiddleware())
     dp.message.middleware(UserOnlyMiddleware())
     dp.include_router(main_router)
+    dp.shutdown.register(leader_elector.stop)
+    dp.shutdown.register(delivery_queue.stop)
+    dp.shutdown.register(photo_ingestion.stop)
+    dp.shutdown.register(storage_service.stop)
 
     bot = Bot(
         token=config.secrets.bot_token.get_secret_value(),
@@ -69,22 +81,35 @@ async def start_polling():
     await dp.start_polling(bot)
 
 
+async def start_webhook():
+    """Serve the webhook application until the process is stopped.
+
+    Cleaning up the runner fires the dispatcher shutdown hooks, which
+    release the scheduler lease and drain the background queues.
+    """
+    runner = web.AppRunner(await create_app())
+    await runner.setup()
+    try:
+        await web.TCPSite(
+            runner,
+            host=config.service.web_server_host,
+            port=config.service.web_server_port,
+        ).start()
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+
 async def main():
     """Main function to start the bot."""
     logging.basicConfig(level=logging.INFO, stream=sys.stdout)
     await init_db()
-    await start_scheduler()
+    if config.user_cache.warm:
+        await registered_users.warm()
+    await storage_service.start()
+    await leader_elector.start()
     if config.service.webhook:
-        app = await create_app()
-        runner = web.AppRunner(app)
-        await runner.setup()
-        site = web.TCPSite(
-            runner,
-            host=config.service.web_server_host,
-            port=config.service.web_server_port,
-        )
-        await site.start()
-        await asyncio.Event().wait()
+        await start_webhook()
     else:
         await start_polling()
 
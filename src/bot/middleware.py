@@ -11,7 +11,17 @@ from bot.log_message import (
     NOT_PRIVATE_CHAT_LOG,
     UNAUTHORIZED_ACCESS_LOG,
 )
-from bot.models import User
+from bot.utils import fsm_storage, registered_users
+
+
+class FSMScopeMiddleware(BaseMiddleware):
+    """Cache conversation state only while one update is handled."""
+
+    async def __call__(
+        self, handler, event: TelegramObject, data: dict
+    ) -> Any:
+        with fsm_storage.update_scope():
+            return await handler(event, data)
 
 
 class UserOnlyMiddleware(BaseMiddleware):
@@ -53,6 +63,6 @@ class UserOnlyMiddleware(BaseMiddleware):
 
     async def _is_registered(self, user_id: int) -> bool:
         try:
-            return (await User.find_one(User.user_id == user_id)) is not None
+            return await registered_users.is_registered(user_id)
         except Exception:
             return False
@@ -1,21 +1,40 @@
+from bot.models.fsm import FSMRecord
+from bot.models.job import JobCheckpoint
+from bot.models.lease import SchedulerLease
+from bot.models.outbox import NotificationOutbox, OutboxStatus
+from bot.models.photo import PhotoUpload, StoredPhoto
 from bot.models.plant import (
     FertilizingPeriod,
     FertilizingType,
     FrequencyType,
     MonthDay,
     Plant,
+    PlantNotification,
+    PlantSummary,
     WateringPeriod,
     WateringSchedule,
+    schedule_cache_info,
 )
-from bot.models.user import User
+from bot.models.user import User, UserIdItem
 
 __all__ = [
     'Plant',
+    'PlantNotification',
+    'PlantSummary',
     'User',
+    'UserIdItem',
     'FrequencyType',
     'FertilizingType',
     'WateringSchedule',
     'FertilizingPeriod',
     'MonthDay',
     'WateringPeriod',
+    'JobCheckpoint',
+    'FSMRecord',
+    'SchedulerLease',
+    'NotificationOutbox',
+    'OutboxStatus',
+    'PhotoUpload',
+    'StoredPhoto',
+    'schedule_cache_info',
 ]
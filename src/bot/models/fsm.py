@@ -0,0 +1,86 @@
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import Any
+
+from beanie import Document
+from pydantic import Field
+from pymongo import IndexModel, ReturnDocument
+
+StateAndData = tuple[str | None, dict[str, Any]]
+RECORD_FIELDS = MappingProxyType({'_id': 0, 'state': 1, 'data': 1})
+
+
+class FSMRecord(Document):
+    """FSM state and data of one conversation."""
+
+    id: str  # type: ignore[assignment]
+    state: str | None = None
+    data: dict[str, Any] = Field(default_factory=dict)
+    expires_at: datetime
+
+    @classmethod
+    async def load(cls, key: str) -> StateAndData:
+        """Receive state and data stored under the key."""
+        document = await cls.get_pymongo_collection().find_one(
+            {'_id': key}, RECORD_FIELDS
+        )
+        return _unpack(document)
+
+    @classmethod
+    async def store(
+        cls, key: str, fields: dict[str, Any], ttl: int
+    ) -> StateAndData:
+        """Set or unset fields and push the expiry of the conversation.
+
+        Empty fields are unset, and a record left without state and data
+        is removed, so finished conversations take no space.
+        """
+        update, upsert = _record_update(fields, ttl)
+        document = await cls.get_pymongo_collection().find_one_and_update(
+            {'_id': key},
+            update,
+            projection=RECORD_FIELDS,
+            upsert=upsert,
+            return_document=ReturnDocument.AFTER,
+        )
+        state, data = _unpack(document)
+        if document is not None and state is None and not data:
+            await cls.get_pymongo_collection().delete_one(
+                {
+                    '_id': key,
+                    'state': {'$exists': False},
+                    'data': {'$exists': False},
+                }
+            )
+        return state, data
+
+    class Settings:
+        name = 'fsm_records'
+        indexes = [IndexModel('expires_at', expireAfterSeconds=0)]
+
+
+def _unpack(document: dict | None) -> StateAndData:
+    if document is None:
+        return None, {}
+    return document.get('state'), document.get('data') or {}
+
+
+def _record_update(
+    fields: dict[str, Any], ttl: int
+) -> tuple[dict[str, Any], bool]:
+    """Update setting filled fields and unsetting empty ones.
+
+    The flag tells whether anything is left to store, so empty updates
+    never create a record.
+    """
+    filled = {name: field for name, field in fields.items() if field}
+    update: dict[str, Any] = {
+        '$set': {
+            **filled,
+            'expires_at': datetime.now(timezone.utc) + timedelta(seconds=ttl),
+        }
+    }
+    unset = {name: 1 for name in fields if name not in filled}
+    if unset:
+        update['$unset'] = unset
+    return update, bool(filled)
@@ -0,0 +1,32 @@
+from datetime import datetime, timezone
+
+from beanie import Document, Indexed
+
+
+class JobCheckpoint(Document):
+    """Last successful run of a scheduled job."""
+
+    job_id: Indexed(str, unique=True)  # type: ignore[valid-type]
+    last_run_at: datetime
+
+    @classmethod
+    async def get_last_run(cls, job_id: str) -> datetime | None:
+        """Receive last run time of the job."""
+        checkpoint = await cls.find_one(cls.job_id == job_id)
+        if checkpoint is None:
+            return None
+        last_run_at = checkpoint.last_run_at
+        if last_run_at.tzinfo is None:
+            last_run_at = last_run_at.replace(tzinfo=timezone.utc)
+        return last_run_at
+
+    @classmethod
+    async def record_run(cls, job_id: str, run_at: datetime):
+        """Store last run time of the job."""
+        await cls.find_one(cls.job_id == job_id).upsert(
+            {'$set': {'last_run_at': run_at}},
+            on_insert=cls(job_id=job_id, last_run_at=run_at),
+        )
+
+    class Settings:
+        name = 'job_checkpoints'
@@ -0,0 +1,44 @@
+from datetime import datetime, timedelta, timezone
+
+from beanie import Document, Indexed
+from beanie.operators import Or, Set
+from pymongo import IndexModel
+from pymongo.errors import DuplicateKeyError
+
+
+class SchedulerLease(Document):
+    """Lease granting one replica the right to run scheduled jobs."""
+
+    name: Indexed(str, unique=True)  # type: ignore[valid-type]
+    owner: str
+    expires_at: datetime
+
+    @classmethod
+    async def acquire(cls, name: str, owner: str, ttl: int) -> bool:
+        """Take a free or expired lease, or extend the owned one."""
+        now = datetime.now(timezone.utc)
+        expires_at = now + timedelta(seconds=ttl)
+        try:
+            await cls.find_one(
+                cls.name == name,
+                Or(
+                    cls.owner == owner,
+                    cls.expires_at < now,  # type: ignore[operator]
+                ),
+            ).upsert(
+                Set({cls.owner: owner, cls.expires_at: expires_at}),
+                on_insert=cls(name=name, owner=owner, expires_at=expires_at),
+            )
+        except DuplicateKeyError:
+            return False
+        return True
+
+    @classmethod
+    async def release(cls, name: str, owner: str):
+        """Give the lease up so another replica can take it at once."""
+        lease = cls.find_one(cls.name == name, cls.owner == owner)
+        await lease.delete()
+
+    class Settings:
+        name = 'scheduler_leases'
+        indexes = [IndexModel('expires_at', expireAfterSeconds=0)]
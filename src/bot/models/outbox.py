@@ -0,0 +1,132 @@
+from datetime import date, datetime, timezone
+from enum import StrEnum, auto
+
+from beanie import Document, PydanticObjectId
+from beanie.operators import In
+from pymongo import IndexModel, UpdateOne
+
+from bot.models.plant import PlantNotification, _as_datetime
+
+OUTBOX_RETENTION = 7 * 24 * 60 * 60
+
+
+class OutboxStatus(StrEnum):
+    """Notification delivery status."""
+
+    queued = auto()
+    sending = auto()
+    sent = auto()
+    failed = auto()
+
+
+class NotificationOutbox(Document):
+    """Delivery record of one plant notification for one due date."""
+
+    plant_id: PydanticObjectId
+    due_date: datetime
+    user_id: int
+    status: OutboxStatus = OutboxStatus.queued
+    attempts: int = 0
+    owner: str | None = None
+    claimed_at: datetime | None = None
+    updated_at: datetime | None = None
+
+    @classmethod
+    async def register(
+        cls, plants: list[PlantNotification], due_date: date, owner: str
+    ) -> list[PlantNotification]:
+        """Queue plants for the due date and claim the undelivered ones.
+
+        Every record not sent yet is moved to `sending` for the owner in
+        one update, including records claimed by an earlier run. Runs are
+        serialized by the scheduler lease, so such a run has died, and the
+        new one resumes with the plants it left undelivered. Results of
+        the earlier owner are ignored by `record` afterwards. Only the
+        plants claimed by this owner are returned.
+        """
+        if not plants:
+            return []
+        due = _as_datetime(due_date)
+        plant_ids = [plant.id for plant in plants]
+        await cls.get_pymongo_collection().bulk_write(
+            [
+                UpdateOne(
+                    {'plant_id': plant.id, 'due_date': due},
+                    {
+                        '$setOnInsert': {
+                            'user_id': plant.user_id,
+                            'status': OutboxStatus.queued.value,
+                            'attempts': 0,
+                        }
+                    },
+                    upsert=True,
+                )
+                for plant in plants
+            ],
+            ordered=False,
+        )
+        await cls.get_pymongo_collection().update_many(
+            {
+                'plant_id': {'$in': plant_ids},
+                'due_date': due,
+                'status': {'$ne': OutboxStatus.sent.value},
+            },
+            {
+                '$set': {
+                    'status': OutboxStatus.sending.value,
+                    'owner': owner,
+                    'claimed_at': datetime.now(timezone.utc),
+                }
+            },
+        )
+        claimed = await cls.find(
+            In(cls.plant_id, plant_ids),
+            cls.due_date == due,
+            cls.status == OutboxStatus.sending,
+            cls.owner == owner,
+        ).to_list()
+        claimed_ids = {record.plant_id for record in claimed}
+        return [plant for plant in plants if plant.id in claimed_ids]
+
+    @classmethod
+    async def record(
+        cls,
+        deliveries: list[tuple[PydanticObjectId, bool]],
+        due_date: date,
+        owner: str,
+    ):
+        """Store delivery results of the plants claimed by the owner."""
+        if not deliveries:
+            return
+        due = _as_datetime(due_date)
+        now = datetime.now(timezone.utc)
+        await cls.get_pymongo_collection().bulk_write(
+            [
+                UpdateOne(
+                    {'plant_id': plant_id, 'due_date': due, 'owner': owner},
+                    {
+                        '$set': {
+                            'status': (
+                                OutboxStatus.sent
+                                if delivered
+                                else OutboxStatus.failed
+                            ).value,
+                            'updated_at': now,
+                        },
+                        '$inc': {'attempts': 1},
+                    },
+                )
+                for plant_id, delivered in deliveries
+            ],
+            ordered=False,
+        )
+
+    class Settings:
+        name = 'notification_outbox'
+        indexes = [
+            IndexModel(
+                [('plant_id', 1), ('due_date', 1)],
+                unique=True,
+            ),
+            IndexModel('due_date', expireAfterSeconds=OUTBOX_RETENTION),
+        ]
@@ -0,0 +1,158 @@
+from collections.abc import AsyncIterator
+from datetime import datetime, timedelta, timezone
+
+from beanie import Document, Indexed
+from pymongo import IndexModel, ReturnDocument
+from pymongo.errors import DuplicateKeyError
+
+
+class PhotoUpload(Document):
+    """Stored object of a Telegram photo not yet attached to a plant.
+
+    A photo abandoned before its upload finished is marked discarded, so
+    whichever replica completes the upload drops the object. Expired
+    records are swept by the bot rather than a TTL index, as each one
+    holds a reference on its stored object.
+    """
+
+    file_id: Indexed(str, unique=True)  # type: ignore[valid-type]
+    user_id: int
+    storage_key: str | None = None
+    discarded: bool = False
+    expires_at: datetime
+
+    @classmethod
+    async def record(
+        cls, file_id: str, user_id: int, storage_key: str, ttl: int
+    ) -> bool:
+        """Remember the object uploaded for the photo.
+
+        Returns False when the caller should drop its reference instead:
+        the photo was discarded meanwhile or an object is already recorded
+        for it. A recorded key is never replaced, the upsert of a second
+        one fails on the unique file id.
+        """
+        collection = cls.get_pymongo_collection()
+        try:
+            previous = await collection.find_one_and_update(
+                {'file_id': file_id, 'storage_key': None},
+                {
+                    '$set': {
+                        'storage_key': storage_key,
+                        'expires_at': _expires_at(ttl),
+                    },
+                    '$setOnInsert': {'user_id': user_id, 'discarded': False},
+                },
+                upsert=True,
+            )
+        except DuplicateKeyError:
+            return False
+        if previous is not None and previous.get('discarded'):
+            await collection.delete_one({'file_id': file_id})
+            return False
+        return True
+
+    @classmethod
+    async def discard(
+        cls, file_id: str, user_id: int, ttl: int
+    ) -> str | None:
+        """Mark the photo abandoned and take its object if it is stored."""
+        collection = cls.get_pymongo_collection()
+        previous = await collection.find_one_and_update(
+            {'file_id': file_id},
+            {
+                '$set': {'discarded': True},
+                '$setOnInsert': {
+                    'user_id': user_id,
+                    'expires_at': _expires_at(ttl),
+                },
+            },
+            upsert=True,
+        )
+        if previous is None or previous.get('storage_key') is None:
+            return None
+        return await cls.claim(file_id)
+
+    @classmethod
+    async def forget_discard(cls, file_id: str):
+        """Drop the discard mark when the same photo is sent again."""
+        await cls.get_pymongo_collection().delete_one(
+            {'file_id': file_id, 'discarded': True}
+        )
+
+    @classmethod
+    async def claim(cls, file_id: str) -> str | None:
+        """Take the recorded object away, once, for attaching or removal."""
+        document = await cls.get_pymongo_collection().find_one_and_delete(
+            {'file_id': file_id, 'storage_key': {'$ne': None}}
+        )
+        return None if document is None else document['storage_key']
+
+    @classmethod
+    async def claim_expired(cls, now: datetime) -> AsyncIterator[str]:
+        """Remove expired records and yield the objects they referenced.
+
+        Every record is deleted on its own, so concurrent sweeps yield
+        each object once.
+        """
+        collection = cls.get_pymongo_collection()
+        expired = {'expires_at': {'$lte': now}}
+        documents = await collection.find(expired, {'_id': 1}).to_list(None)
+        for document in documents:
+            claimed = await collection.find_one_and_delete(
+                {'_id': document['_id'], **expired}
+            )
+            if claimed is not None and claimed.get('storage_key'):
+                yield claimed['storage_key']
+
+    class Settings:
+        name = 'photo_uploads'
+        indexes = [IndexModel('expires_at')]
+
+
+class StoredPhoto(Document):
+    """Reference count of a content-addressed object in storage.
+
+    Every plant and unclaimed upload holding the key owns one reference.
+    Objects stored before content addressing have no record and a single
+    owner.
+    """
+
+    id: str  # type: ignore[assignment]
+    refs: int = 0
+
+    @classmethod
+    async def acquire(cls, storage_key: str) -> int:
+        """Add a reference to the object and return the new count."""
+        document = await cls.get_pymongo_collection().find_one_and_update(
+            {'_id': storage_key},
+            {'$inc': {'refs': 1}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+        )
+        return document['refs']
+
+    @classmethod
+    async def release(cls, storage_key: str) -> bool:
+        """Drop a reference and tell whether the object may be deleted."""
+        collection = cls.get_pymongo_collection()
+        document = await collection.find_one_and_update(
+            {'_id': storage_key},
+            {'$inc': {'refs': -1}},
+            return_document=ReturnDocument.AFTER,
+        )
+        if document is None:
+            return True
+        if document['refs'] > 0:
+            return False
+        result = await collection.delete_one(
+            {'_id': storage_key, 'refs': {'$lte': 0}}
+        )
+        return result.deleted_count == 1
+
+    class Settings:
+        name = 'stored_photos'
+
+
+def _expires_at(ttl: int) -> datetime:
+    return datetime.now(timezone.utc) + timedelta(seconds=ttl)
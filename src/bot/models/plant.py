@@ -1,5 +1,7 @@
-from datetime import date, datetime, timezone
+from datetime import date, datetime, timedelta, timezone
 from enum import StrEnum, auto
+from functools import lru_cache
+from typing import TYPE_CHECKING
 
 from beanie import (
     Document,
@@ -9,9 +11,12 @@ from beanie import (
     SaveChanges,
     before_event,
 )
+from beanie.odm.queries.find import FindMany
+from beanie.operators import In
 from dateutil.relativedelta import relativedelta
 from dateutil.rrule import MONTHLY, WEEKLY, rrule
 from pydantic import BaseModel, Field
+from pymongo import ASCENDING, IndexModel, UpdateOne
 
 from bot.constants import (
     NO_DAYS_ERROR,
@@ -21,6 +26,11 @@ from bot.constants import (
     WEEKDAY_MAP,
 )
 
+if TYPE_CHECKING:
+    from bot.utils.cache import CacheInfo
+
+SCHEDULE_CACHE_SIZE = 1024
+
 
 class MonthDay(BaseModel):
     """Class for date data."""
@@ -33,6 +43,30 @@ class MonthDay(BaseModel):
         return date(year, self.month, self.day)
 
 
+def period_dates(
+    start_day: MonthDay, end_day: MonthDay, today: date
+) -> tuple[date, date]:
+    """Place a yearly period around today, wrapping over New Year."""
+    return _period_dates(
+        (start_day.month, start_day.day), (end_day.month, end_day.day), today
+    )
+
+
+@lru_cache(maxsize=SCHEDULE_CACHE_SIZE)
+def _period_dates(
+    start_day: tuple[int, int], end_day: tuple[int, int], today: date
+) -> tuple[date, date]:
+    start = date(today.year, *start_day)
+    end = date(today.year, *end_day)
+    if start < end:
+        return start, end
+    if start < today:
+        end += relativedelta(years=1)
+    else:
+        start -= relativedelta(years=1)
+    return start, end
+
+
 class FrequencyType(StrEnum):
     """Frequency type enum."""
 
@@ -87,18 +121,9 @@ class WateringPeriod(BaseModel):
 
     def as_period(self) -> tuple[date, date]:
         """Convert values to dates."""
-        current_year = date.today().year
         if self.start is None or self.end is None:
             raise ValueError()
-        start = self.start.as_date(current_year)
-        end = self.end.as_date(current_year)
-        if start < end:
-            return start, end
-        if start < date.today():
-            end += relativedelta(years=1)
-        else:
-            start -= relativedelta(years=1)
-        return start, end
+        return period_dates(self.start, self.end, date.today())
 
 
 class FertilizingType(StrEnum):
@@ -142,18 +167,46 @@ class FertilizingPeriod(BaseModel):
 
     def as_period(self) -> tuple[date, date]:
         """Convert values to dates."""
-        current_year = date.today().year
         if not self.start or not self.end:
             raise ValueError('No start or end for period')
-        start = self.start.as_date(current_year)
-        end = self.end.as_date(current_year)
-        if start < end:
-            return start, end
-        if start < date.today():
-            end += relativedelta(years=1)
-        else:
-            start -= relativedelta(years=1)
-        return start, end
+        return period_dates(self.start, self.end, date.today())
+
+
+class PlantNotification(BaseModel):
+    """Projection with the fields required for a watering notification."""
+
+    id: PydanticObjectId = Field(alias='_id')
+    user_id: int
+    name: str
+    image: str | None = None
+    fertilizing: FertilizingPeriod | None = None
+    next_watering_at: date | None = None
+    next_fertilizing_at: date | None = None
+
+    def sync_watering_and_fertilizing(self):
+        """Check synchronization for watering and fertilizing."""
+        return _is_fertilizing_due(
+            self.fertilizing, self.next_watering_at, self.next_fertilizing_at
+        )
+
+    def overdue_days(self) -> int:
+        """Days passed since the missed watering date."""
+        return _overdue_days(self.next_watering_at)
+
+
+class PlantSummary(BaseModel):
+    """Projection with the fields shown in plant lists.
+
+    Every list and pager reads plants through it, skipping descriptions
+    and nested periods that only the plant card needs.
+    """
+
+    id: PydanticObjectId = Field(alias='_id')
+    name: str
+    last_watered_at: date | None = None
+    next_watering_at: date | None = None
+    last_fertilized_at: date | None = None
+    next_fertilizing_at: date | None = None
 
 
 class Plant(Document):
@@ -185,6 +238,7 @@ class Plant(Document):
     def on_insert_set_timestamps(self):
         now = datetime.now(timezone.utc)
         self.created_at = now
+        self.updated_at = now
 
     @before_event([Replace, SaveChanges])
     def on_update_set_timestamps(self):
@@ -193,33 +247,251 @@ class Plant(Document):
     @classmethod
     async def find_to_water_today(cls) -> list["Plant"]:
         """Find plants to water today."""
+        return await cls.find(*cls._to_water_today_filter()).to_list()
+
+    @classmethod
+    def iter_to_water_today(
+        cls, batch_size: int
+    ) -> FindMany[PlantNotification]:
+        """Stream projected plants to water today in cursor batches."""
+        return cls.find(
+            *cls._to_water_today_filter(),
+            projection_model=PlantNotification,
+            sort='+user_id',
+            batch_size=batch_size,
+        )
+
+    @classmethod
+    async def find_due_for_user(cls, user_id: int) -> list['Plant']:
+        """Find user plants due for watering today or earlier."""
+        today = datetime.combine(date.today(), datetime.min.time())
+        return await cls.find(
+            cls.user_id == user_id,
+            (cls.next_watering_at <= today),  # type: ignore[operator]
+            (cls.last_watered_at < today),  # type: ignore[operator]
+        ).to_list()
+
+    @classmethod
+    def iter_overdue(
+        cls, days: list[int], batch_size: int
+    ) -> FindMany[PlantNotification]:
+        """Stream plants overdue by exactly one of the given day counts.
+
+        Acknowledging a reminder always moves `next_watering_at` forward,
+        so a date in the past means the plant was never watered.
+        """
+        today = date.today()
+        return cls.find(
+            In(
+                cls.next_watering_at,
+                [_as_datetime(today - timedelta(days=day)) for day in days],
+            ),
+            projection_model=PlantNotification,
+            sort='+user_id',
+            batch_size=batch_size,
+        )
+
+    @classmethod
+    async def reschedule_overdue(cls, before: date, batch_size: int) -> int:
+        """Move the schedule of plants overdue since before the given date.
+
+        Schedules of a batch are calculated together and written back with
+        one unordered bulk write.
+        """
+        rescheduled = 0
+        batch: list[Plant] = []
+        async for plant in cls.find(
+            (cls.next_watering_at < _as_datetime(before)),  # type: ignore
+            batch_size=batch_size,
+        ):
+            batch.append(plant)
+            if len(batch) >= batch_size:
+                rescheduled += await cls._reschedule(batch)
+                batch = []
+        return rescheduled + await cls._reschedule(batch)
+
+    @classmethod
+    async def _reschedule(cls, plants: list['Plant']) -> int:
+        from bot.models.schedule import next_watering_dates
+
+        now = datetime.now(timezone.utc)
+        updates = [
+            UpdateOne(
+                {'_id': plant.id},
+                {
+                    '$set': {
+                        'next_watering_at': _as_datetime(next_watering_at),
+                        'updated_at': now,
+                    }
+                },
+            )
+            for plant, next_watering_at in zip(
+                plants, next_watering_dates(plants)
+            )
+            if next_watering_at is not None
+        ]
+        if not updates:
+            return 0
+        result = await cls.get_pymongo_collection().bulk_write(
+            updates, ordered=False
+        )
+        return result.modified_count
+
+    @classmethod
+    def _to_water_today_filter(cls) -> tuple:
         today = date.today()
         start = datetime.combine(today, datetime.min.time())
         end = datetime.combine(today, datetime.max.time())
-
-        return await cls.find(
+        return (
             (cls.next_watering_at >= start),  # type: ignore[operator]
             (cls.next_watering_at <= end),  # type: ignore[operator]
             ((cls.last_watered_at < start)),  # type: ignore[operator]
-        ).to_list()
+        )
 
     @classmethod
-    async def get_all_ids(cls, user_id: int) -> list[str]:
-        """Receive all ObjectId for users."""
-        plants = await cls.find(cls.user_id == user_id).sort('+_id').to_list()
-        return [str(plant.id) for plant in plants]
+    async def get_for_user(
+        cls, plant_id: PydanticObjectId | None, user_id: int
+    ) -> 'Plant | None':
+        """Receive a plant by id if it belongs to the user."""
+        if plant_id is None:
+            return None
+        plant = await cls.get(plant_id)
+        if plant is None or plant.user_id != user_id:
+            return None
+        return plant
 
     @classmethod
-    async def get_documents_by_ids(
-        cls, telegram_id: int, ids: list[str]
-    ) -> list['Plant']:
-        """Receive documents by ObjectId."""
-        object_ids = [PydanticObjectId(id_) for id_ in ids]
-        plants = await cls.find_many(
-            {"user_id": telegram_id, "_id": {"$in": object_ids}}
-        ).to_list()
-        id_map = {str(plant.id): plant for plant in plants}
-        return [id_map[i] for i in ids if i in id_map]
+    async def attach_storage_key(
+        cls, user_id: int, file_id: str, storage_key: str
+    ) -> int:
+        """Attach the uploaded object to a plant showing the photo.
+
+        One plant is updated, as it takes over the single reference held
+        on a content-addressed object.
+        """
+        result = await cls.get_pymongo_collection().update_one(
+            {'user_id': user_id, 'image': file_id, 'storage_key': None},
+            {
+                '$set': {
+                    'storage_key': storage_key,
+                    'updated_at': datetime.now(timezone.utc),
+                }
+            },
+        )
+        return result.modified_count
+
+    @classmethod
+    async def has_name(cls, user_id: int, name: str) -> bool:
+        """Check whether the user already has a plant with the name."""
+        plant = await cls.find_one(
+            cls.user_id == user_id,
+            cls.name == name,
+            projection_model=PlantSummary,
+        )
+        return plant is not None
+
+    @classmethod
+    async def get_summaries(cls, user_id: int) -> list[PlantSummary]:
+        """Receive summaries of all user plants ordered by id."""
+        return await cls.iter_summaries(user_id).to_list()
+
+    @classmethod
+    def iter_summaries(
+        cls, user_id: int, batch_size: int | None = None
+    ) -> FindMany[PlantSummary]:
+        """Stream summaries of user plants ordered by id."""
+        return cls.find(
+            cls.user_id == user_id,
+            projection_model=PlantSummary,
+            sort='+_id',
+            batch_size=batch_size,
+        )
+
+    def mark_watered(self, is_fertilized: bool):
+        """Register watering and move the schedule forward."""
+        self.last_watered_at = date.today()
+        self.next_watering_date()
+        if is_fertilized:
+            self.last_fertilized_at = date.today()
+            self.next_fertilizing_date()
+
+    async def acknowledge_watering(self, is_fertilized: bool) -> bool:
+        """Mark the plant watered with one targeted update.
+
+        Only the changed dates are written, and only while the stored next
+        watering date is still the one the plant was loaded with, so a
+        repeated or concurrent acknowledgment changes nothing.
+        """
+        expected = self.next_watering_at
+        self.mark_watered(is_fertilized)
+        self.updated_at = datetime.now(timezone.utc)
+        result = await self.get_pymongo_collection().update_one(
+            *self._acknowledgment(expected, is_fertilized)
+        )
+        return result.modified_count == 1
+
+    @classmethod
+    async def acknowledge_due(cls, user_id: int, fertilize: bool) -> int:
+        """Mark all due user plants watered with one bulk write.
+
+        Next dates of the whole batch are calculated together. Plants
+        fertilized along are those whose fertilizing is due with watering.
+        Each update carries the same guard as `acknowledge_watering`.
+        """
+        from bot.models.schedule import (
+            next_fertilizing_dates,
+            next_watering_dates,
+        )
+
+        plants = await cls.find_due_for_user(user_id)
+        if not plants:
+            return 0
+        today = date.today()
+        now = datetime.now(timezone.utc)
+        fertilized = [
+            fertilize and plant.sync_watering_and_fertilizing()
+            for plant in plants
+        ]
+        fertilizing_dates = iter(
+            next_fertilizing_dates(
+                [plant for plant, due in zip(plants, fertilized) if due]
+            )
+        )
+        updates = []
+        for plant, next_watering_at, due in zip(
+            plants, next_watering_dates(plants), fertilized
+        ):
+            expected = plant.next_watering_at
+            plant.last_watered_at = today
+            plant.next_watering_at = next_watering_at or expected
+            if due:
+                plant.last_fertilized_at = today
+                plant.next_fertilizing_at = (
+                    next(fertilizing_dates) or plant.next_fertilizing_at
+                )
+            plant.updated_at = now
+            updates.append(UpdateOne(*plant._acknowledgment(expected, due)))
+        result = await cls.get_pymongo_collection().bulk_write(
+            updates, ordered=False
+        )
+        return result.modified_count
+
+    def _acknowledgment(
+        self, expected: date | None, is_fertilized: bool
+    ) -> tuple[dict, dict]:
+        fields = {
+            'last_watered_at': self.last_watered_at,
+            'next_watering_at': self.next_watering_at,
+        }
+        if is_fertilized:
+            fields['last_fertilized_at'] = self.last_fertilized_at
+            fields['next_fertilizing_at'] = self.next_fertilizing_at
+        update = {key: _stored_date(value) for key, value in fields.items()}
+        update['updated_at'] = self.updated_at
+        return (
+            {'_id': self.id, 'next_watering_at': _stored_date(expected)},
+            {'$set': update},
+        )
 
     def next_watering_date(self) -> date:
         """Calculate next watering date."""
@@ -289,50 +561,125 @@ class Plant(Document):
 
     def sync_watering_and_fertilizing(self):
         """Check synchronization for watering and fertilizing."""
-        if (
-            self.fertilizing
-            and self.next_watering_at >= self.next_fertilizing_at
-        ):
-            return True
-        return False
+        return _is_fertilizing_due(
+            self.fertilizing, self.next_watering_at, self.next_fertilizing_at
+        )
+
+    def overdue_days(self) -> int:
+        """Days passed since the missed watering date."""
+        return _overdue_days(self.next_watering_at)
 
     def _build_rrule(
         self, schedule: WateringSchedule, start_dt: datetime
     ) -> rrule:
         """Build schedule for watering."""
-        freq = WEEKLY if schedule.type in {'weekly', 'biweekly'} else MONTHLY
-        interval = 2 if schedule.type == 'biweekly' else 1
-
-        if freq == WEEKLY:
-            weekday_value = schedule.weekday
-            if isinstance(weekday_value, int):
-                weekdays = [WEEKDAY_MAP[weekday_value]]
-            elif isinstance(weekday_value, (set, list)):
-                weekdays = [WEEKDAY_MAP[day] for day in weekday_value]
-            else:
-                raise ValueError(NO_DAYS_ERROR)
-
-            return rrule(
-                freq=WEEKLY,
-                interval=interval,
-                byweekday=weekdays,
-                dtstart=start_dt,
-            )
-
-        elif freq == MONTHLY:
-            day = schedule.monthday or start_dt.day
-            return rrule(
-                freq=MONTHLY,
-                bymonthday=day,
-                dtstart=start_dt,
-            )
-
-        raise ValueError(
-            UNDEFINED_SCHEDULE_TYPE_ERROR.format(type=schedule.type)
+        weekday: frozenset[int] | int | None
+        if isinstance(schedule.weekday, (set, list)):
+            weekday = frozenset(schedule.weekday)
+        else:
+            weekday = schedule.weekday
+        return compile_rule(
+            schedule.type, weekday, schedule.monthday, start_dt
         )
 
     class Settings:
         name = 'plants'
+        indexes = [
+            IndexModel(
+                [('user_id', ASCENDING), ('name', ASCENDING)],
+                name='user_name',
+                unique=True,
+            ),
+            IndexModel(
+                [
+                    ('next_watering_at', ASCENDING),
+                    ('last_watered_at', ASCENDING),
+                ],
+                name='due_watering',
+            ),
+            IndexModel(
+                [('user_id', ASCENDING), ('_id', ASCENDING)],
+                name='user_order',
+            ),
+        ]
+
+
+@lru_cache(maxsize=SCHEDULE_CACHE_SIZE)
+def compile_rule(
+    schedule_type: str,
+    weekday: frozenset[int] | int | None,
+    monthday: int | None,
+    start_dt: datetime,
+) -> rrule:
+    """Compile a watering rule once per schedule shape and start date.
+
+    Compiled rules are shared between plants, so they must not be changed.
+    """
+    freq = WEEKLY if schedule_type in {'weekly', 'biweekly'} else MONTHLY
+    interval = 2 if schedule_type == 'biweekly' else 1
+
+    if freq == WEEKLY:
+        if isinstance(weekday, int):
+            weekdays = [WEEKDAY_MAP[weekday]]
+        elif isinstance(weekday, frozenset):
+            weekdays = [WEEKDAY_MAP[day] for day in weekday]
+        else:
+            raise ValueError(NO_DAYS_ERROR)
+
+        return rrule(
+            freq=WEEKLY,
+            interval=interval,
+            byweekday=weekdays,
+            dtstart=start_dt,
+            cache=True,
+        )
+
+    elif freq == MONTHLY:
+        day = monthday or start_dt.day
+        return rrule(
+            freq=MONTHLY,
+            bymonthday=day,
+            dtstart=start_dt,
+            cache=True,
+        )
+
+    raise ValueError(UNDEFINED_SCHEDULE_TYPE_ERROR.format(type=schedule_type))
+
+
+def schedule_cache_info() -> dict[str, 'CacheInfo']:
+    """Hit and miss counters of the compiled rule and period caches."""
+    from bot.utils.cache import CacheInfo
+
+    return {
+        'rules': CacheInfo(*compile_rule.cache_info()),
+        'periods': CacheInfo(*_period_dates.cache_info()),
+    }
+
+
+def _is_fertilizing_due(
+    fertilizing: FertilizingPeriod | None,
+    next_watering_at: date | None,
+    next_fertilizing_at: date | None,
+) -> bool:
+    if not fertilizing or next_watering_at is None:
+        return False
+    if next_fertilizing_at is None:
+        return False
+    return next_watering_at >= next_fertilizing_at
+
+
+def _overdue_days(next_watering_at: date | None) -> int:
+    if next_watering_at is None:
+        return 0
+    return max((date.today() - next_watering_at).days, 0)
+
+
+def _as_datetime(day: date) -> datetime:
+    return datetime.combine(day, datetime.min.time())
+
+
+def _stored_date(day: date | None) -> datetime | None:
+    return None if day is None else _as_datetime(day)
 
 
 def _require_watering_period(
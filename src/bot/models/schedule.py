@@ -0,0 +1,205 @@
+from calendar import monthrange
+from collections.abc import Callable, Hashable, Mapping, Sequence
+from datetime import date, timedelta
+from types import MappingProxyType
+
+from dateutil.relativedelta import relativedelta
+
+from bot.models.plant import (
+    FertilizingPeriod,
+    FertilizingType,
+    FrequencyType,
+    MonthDay,
+    Plant,
+    WateringPeriod,
+    WateringSchedule,
+)
+
+WEEK_DAYS = 7
+MONTH_DAYS = 31
+YEAR_MONTHS = 12
+FERTILIZING_DELTAS: Mapping[
+    FertilizingType, Callable[[int], relativedelta]
+] = MappingProxyType({
+    FertilizingType.days: lambda count: relativedelta(days=count),
+    FertilizingType.weeks: lambda count: relativedelta(weeks=count),
+    FertilizingType.months: lambda count: relativedelta(months=count),
+})
+
+
+class UnsupportedScheduleError(Exception):
+    """Schedule shape without a closed form, left to the plant itself."""
+
+
+def next_watering_dates(plants: Sequence[Plant]) -> list[date | None]:
+    """Calculate next watering dates for many plants at once.
+
+    Plants sharing a schedule shape are calculated once, with plain date
+    arithmetic instead of `rrule`. The result matches
+    `Plant.next_watering_date`, with `None` where it raises `ValueError`.
+    """
+    today = date.today()
+    known: dict[Hashable, date | None] = {}
+    dates = []
+    for plant in plants:
+        key = _period_key(plant.warm_period), _period_key(plant.cold_period)
+        if key not in known:
+            known[key] = _solve(
+                plant, plant.next_watering_date, _next_watering, today
+            )
+        dates.append(known[key])
+    return dates
+
+
+def next_fertilizing_dates(plants: Sequence[Plant]) -> list[date | None]:
+    """Calculate next fertilizing dates for many plants at once.
+
+    The result matches `Plant.next_fertilizing_date`, with `None` where it
+    raises `ValueError`.
+    """
+    today = date.today()
+    known: dict[Hashable, date | None] = {}
+    dates = []
+    for plant in plants:
+        key = _fertilizing_key(plant.fertilizing)
+        if key not in known:
+            known[key] = _solve(
+                plant,
+                plant.next_fertilizing_date,
+                _next_fertilizing,
+                today,
+            )
+        dates.append(known[key])
+    return dates
+
+
+def _solve(plant: Plant, fallback, solver, today: date) -> date | None:
+    watering_at, fertilizing_at = (
+        plant.next_watering_at,
+        plant.next_fertilizing_at,
+    )
+    try:
+        return solver(plant, today)
+    except UnsupportedScheduleError:
+        return fallback()
+    except ValueError:
+        return None
+    finally:
+        plant.next_watering_at = watering_at
+        plant.next_fertilizing_at = fertilizing_at
+
+
+def _day_key(day: MonthDay | None) -> Hashable:
+    return None if day is None else (day.day, day.month)
+
+
+def _period_key(period: WateringPeriod | None) -> Hashable:
+    if period is None:
+        return None
+    schedule = period.schedule
+    if schedule is None:
+        return (_day_key(period.start), _day_key(period.end), None)
+    weekday: frozenset[int] | int | None
+    if isinstance(schedule.weekday, (set, list)):
+        weekday = frozenset(schedule.weekday)
+    else:
+        weekday = schedule.weekday
+    return (
+        _day_key(period.start),
+        _day_key(period.end),
+        (schedule.type, weekday, schedule.monthday),
+    )
+
+
+def _fertilizing_key(fertilizing: FertilizingPeriod | None) -> Hashable:
+    if fertilizing is None:
+        return None
+    return (
+        _day_key(fertilizing.start),
+        _day_key(fertilizing.end),
+        fertilizing.frequency,
+        fertilizing.type,
+    )
+
+
+def _next_watering(plant: Plant, today: date) -> date:
+    period, next_period, period_end = _current_period(plant, today)
+    next_day = _next_occurrence(period.schedule, today)
+    if next_day > period_end:
+        next_day = _next_occurrence(next_period.schedule, period_end)
+    return next_day
+
+
+def _current_period(
+    plant: Plant, today: date
+) -> tuple[WateringPeriod, WateringPeriod, date]:
+    """Period covering today, the one after it and the end of the first."""
+    warm, cold = plant.warm_period, plant.cold_period
+    if warm is None or cold is None:
+        raise ValueError()
+    warm_start, warm_end = warm.as_period()
+    _, cold_end = cold.as_period()
+    if warm_start <= today <= warm_end:
+        return warm, cold, warm_end
+    return cold, warm, cold_end
+
+
+def _next_occurrence(schedule: WateringSchedule | None, start: date) -> date:
+    """First schedule date strictly after start, as `rrule.after` does."""
+    if schedule is None:
+        raise ValueError()
+    if schedule.type in FrequencyType.get_weekly_types():
+        interval = 2 if schedule.type == FrequencyType.biweekly else 1
+        return _next_weekly(start, _weekdays(schedule.weekday), interval)
+    return _next_monthly(start, schedule.monthday or start.day)
+
+
+def _weekdays(weekday: set[int] | int | None) -> set[int]:
+    if isinstance(weekday, int):
+        return {weekday}
+    if weekday is None:
+        raise ValueError()
+    if not weekday:
+        raise UnsupportedScheduleError()
+    return weekday
+
+
+def _next_weekly(start: date, weekdays: set[int], interval: int) -> date:
+    """Weeks are counted from the Monday of the start week, like rrule."""
+    if not all(0 <= day < WEEK_DAYS for day in weekdays):
+        raise UnsupportedScheduleError()
+    week_start = start - timedelta(days=start.weekday())
+    for offset in range(1, WEEK_DAYS * interval + 1):
+        day = start + timedelta(days=offset)
+        weeks = (day - week_start).days // WEEK_DAYS
+        if day.weekday() in weekdays and weeks % interval == 0:
+            return day
+    raise UnsupportedScheduleError()
+
+
+def _next_monthly(start: date, monthday: int) -> date:
+    """Months without the requested day are skipped, like rrule."""
+    if not 1 <= monthday <= MONTH_DAYS:
+        raise UnsupportedScheduleError()
+    year, month = start.year, start.month
+    if monthday > start.day and monthday <= monthrange(year, month)[1]:
+        return date(year, month, monthday)
+    while True:
+        year += month // YEAR_MONTHS
+        month = month % YEAR_MONTHS + 1
+        if monthday <= monthrange(year, month)[1]:
+            return date(year, month, monthday)
+
+
+def _next_fertilizing(plant: Plant, today: date) -> date:
+    fertilizing = plant.fertilizing
+    if fertilizing is None:
+        raise ValueError()
+    fert_start, fert_end = fertilizing.as_period()
+    delta = FERTILIZING_DELTAS.get(fertilizing.type)
+    if fertilizing.frequency is None or delta is None:
+        raise ValueError()
+    fertilizing_date = today + delta(fertilizing.frequency)
+    if fertilizing_date > fert_end:
+        return fert_start + relativedelta(years=1)
+    return fertilizing_date
@@ -1,6 +1,13 @@
 from datetime import datetime, timezone
 
 from beanie import Document, Insert, Replace, SaveChanges, before_event
+from pydantic import BaseModel
+
+
+class UserIdItem(BaseModel):
+    """Projection of a user to the Telegram id."""
+
+    user_id: int
 
 
 class User(Document):
@@ -29,5 +36,20 @@ class User(Document):
         """Set attributes at update."""
         self.updated_at = datetime.now(timezone.utc)
 
+    @classmethod
+    async def exists(cls, user_id: int) -> bool:
+        """Check whether the Telegram user is registered."""
+        user = await cls.find_one(
+            cls.user_id == user_id, projection_model=UserIdItem
+        )
+        return user is not None
+
+    @classmethod
+    def iter_ids(cls, limit: int):
+        """Iterate over the ids of the most recently registered users."""
+        return cls.find(
+            projection_model=UserIdItem, sort='-_id', limit=limit
+        )
+
     class Settings:
         name = 'users'
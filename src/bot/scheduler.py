@@ -1,26 +1,52 @@
 import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Iterator
+from datetime import date, datetime, timedelta, timezone
+from functools import partial
 from logging import getLogger
+from uuid import uuid4
 
 from aiogram import Bot
-from apscheduler.jobstores.mongodb import MongoDBJobStore
+from aiogram.types import InputMediaPhoto, MediaUnion
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from pymongo import MongoClient
+from apscheduler.triggers.cron import CronTrigger
+from beanie import PydanticObjectId
 
-from bot.constants import JOB_ID, WATERING_SCHEDULED_MESSAGE
-from bot.keyboard import watering_kb
+from bot.constants import (
+    JOB_ID,
+    WATERING_DIGEST_FERT,
+    WATERING_DIGEST_LINE,
+    WATERING_DIGEST_MESSAGE,
+    WATERING_DIGEST_OVERDUE,
+    WATERING_OVERDUE_MESSAGE,
+    WATERING_SCHEDULED_MESSAGE,
+)
+from bot.keyboard import digest_kb, watering_kb
 from bot.log_message import (
+    EXPIRED_UPLOADS_RELEASED_LOG,
     JOB_ADDED_LOG,
+    JOB_CATCH_UP_LOG,
     JOB_EXISTS_LOG,
     MESSAGE_SEND_ERROR_LOG,
+    OVERDUE_NOTIFICATIONS_RESULT_LOG,
     PLANT_LIST_NOT_RECEIVED_LOG,
+    SCHEDULER_JOBS_REMOVED_LOG,
     SCHEDULER_START_FAILED_LOG,
     SCHEDULER_START_LOG,
     START_PRICE_UPDATE_LOG,
     WATERING_NOTIFICATIONS_SEND_RESULT,
 )
-from bot.models import Plant
+from bot.models import (
+    JobCheckpoint,
+    NotificationOutbox,
+    Plant,
+    PlantNotification,
+)
+from bot.utils import delivery_queue, photo_ingestion
+from bot.utils.leader import LeaderElector
 from config import config
 
+CAPTION_LIMIT = 1024
+
 log = getLogger(__name__)
 
 
@@ -33,33 +59,149 @@ def set_bot(bot_instance: Bot):
     bot = bot_instance
 
 
-jobstores = {
-    'default': MongoDBJobStore(
-        client=MongoClient(config.mongo_url),
-        database=config.mongodb.db,
-        collection='jobs',
-    )
-}
-scheduler = AsyncIOScheduler(jobstores=jobstores)
+CATCH_UP_JOB_ID = f'{JOB_ID} catch-up'
+LEASE_NAME = 'scheduler'
+
+scheduler = AsyncIOScheduler()
+watering_trigger = CronTrigger(
+    hour=config.scheduler.hour, minute=config.scheduler.minute
+)
 
 
 async def watering_notifications():
-    """Price update job."""
+    """Notify users about plants to water today."""
     log.info(START_PRICE_UPDATE_LOG)
 
-    plants = await Plant.find_to_water_today()
-    if not plants:
+    total, delivered = await _notify(
+        Plant.iter_to_water_today(config.notifications.batch_size)
+    )
+    if not total:
         log.error(PLANT_LIST_NOT_RECEIVED_LOG)
         return
 
-    tasks = [send_watering_notification(plant) for plant in plants]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    log.info(WATERING_NOTIFICATIONS_SEND_RESULT, delivered, total)
+
+
+async def overdue_notifications():
+    """Remind about unwatered plants and reschedule abandoned ones.
+
+    Plants are reminded again on the days of the escalation policy. Once
+    a plant is overdue longer than the policy allows, its schedule is
+    moved forward so it returns to the regular daily run.
+    """
+    policy = config.overdue
+    batch_size = config.notifications.batch_size
+    total, delivered = await _notify(
+        Plant.iter_overdue(policy.reminders, batch_size)
+    )
+    rescheduled = await Plant.reschedule_overdue(
+        date.today() - timedelta(days=policy.reschedule_after), batch_size
+    )
+    log.info(OVERDUE_NOTIFICATIONS_RESULT_LOG, delivered, total, rescheduled)
+
+
+async def _notify(plants: AsyncIterable[PlantNotification]) -> tuple[int, int]:
+    """Stream plants through a bounded worker pool.
 
-    success_count = sum(1 for result in results if result is True)
-    log.info(WATERING_NOTIFICATIONS_SEND_RESULT, success_count, len(plants))
+    Every batch is claimed in the notification outbox first, so plants
+    already notified today are skipped and a rerun, after a crash or from
+    `/send_notifications`, only delivers the rest.
+    """
+    settings = config.notifications
+    due_date = date.today()
+    owner = uuid4().hex
+    queue: asyncio.Queue[list[PlantNotification] | None] = asyncio.Queue(
+        maxsize=settings.batch_size
+    )
+    results: list[tuple[PydanticObjectId, bool]] = []
+    workers = [
+        asyncio.create_task(_notification_worker(queue, results))
+        for _ in range(settings.workers)
+    ]
+    digest_size = settings.digest_size if settings.digest else 1
+    total = 0
+    delivered = 0
+    try:
+        async for batch in _batches(plants, settings.batch_size):
+            pending = await NotificationOutbox.register(
+                batch, due_date, owner
+            )
+            for group in _group_by_user(pending, digest_size):
+                await queue.put(group)
+            total += len(batch)
+            delivered += await _flush_results(results, due_date, owner)
+    finally:
+        for _ in workers:
+            await queue.put(None)
+        await asyncio.gather(*workers)
+        delivered += await _flush_results(results, due_date, owner)
+    return total, delivered
+
+
+async def _batches(
+    plants: AsyncIterable[PlantNotification], size: int
+) -> AsyncIterator[list[PlantNotification]]:
+    """Cut the stream into batches ending on a user boundary."""
+    batch: list[PlantNotification] = []
+    async for plant in plants:
+        is_full = len(batch) >= size
+        if is_full and plant.user_id != batch[-1].user_id:
+            yield batch
+            batch = []
+        batch.append(plant)
+    if batch:
+        yield batch
+
+
+def _group_by_user(
+    plants: list[PlantNotification], size: int
+) -> Iterator[list[PlantNotification]]:
+    """Group consecutive plants of one user into chunks of given size."""
+    group: list[PlantNotification] = []
+    for plant in plants:
+        if group and (
+            plant.user_id != group[0].user_id or len(group) >= size
+        ):
+            yield group
+            group = []
+        group.append(plant)
+    if group:
+        yield group
 
 
-async def send_watering_notification(plant: Plant) -> bool:
+async def _flush_results(
+    results: list[tuple[PydanticObjectId, bool]], due_date: date, owner: str
+) -> int:
+    """Write collected delivery results to the outbox in one bulk call."""
+    flushed = list(results)
+    results.clear()
+    await NotificationOutbox.record(flushed, due_date, owner)
+    return sum(1 for _, delivered in flushed if delivered)
+
+
+async def _notification_worker(
+    queue: asyncio.Queue[list[PlantNotification] | None],
+    results: list[tuple[PydanticObjectId, bool]],
+):
+    """Send notifications from the queue until a stop marker arrives."""
+    while True:
+        plants = await queue.get()
+        if plants is None:
+            return
+        try:
+            if len(plants) == 1:
+                sent = await send_watering_notification(plants[0])
+            else:
+                sent = await send_watering_digest(plants)
+        except Exception as exc:
+            log.error(MESSAGE_SEND_ERROR_LOG, exc)
+            sent = False
+        results.extend((plant.id, sent) for plant in plants)
+
+
+async def send_watering_notification(
+    plant: Plant | PlantNotification,
+) -> bool:
     """Send watering notification."""
     if bot is None:
         log.error('Bot instance is not set.')
@@ -71,23 +213,104 @@ async def send_watering_notification(plant: Plant) -> bool:
         return False
 
     is_fert = plant.sync_watering_and_fertilizing()
-    text = WATERING_SCHEDULED_MESSAGE.format(
-        fert='и удобрить' if is_fert else '', name=plant.name
-    )
+    overdue = plant.overdue_days()
+    if overdue:
+        text = WATERING_OVERDUE_MESSAGE.format(
+            fert=' и подкормки' if is_fert else '',
+            name=plant.name,
+            days=overdue,
+        )
+    else:
+        text = WATERING_SCHEDULED_MESSAGE.format(
+            fert='и удобрить' if is_fert else '', name=plant.name
+        )
 
     params = dict(
         chat_id=plant.user_id,
         parse_mode='HTML',
         reply_markup=watering_kb(idx=plant_id, is_fertilized=is_fert),
     )
-    try:
-        if plant.image:
-            await bot.send_photo(**params, caption=text, photo=plant.image)
-        else:
-            await bot.send_message(**params, text=text)
-    except Exception as exc:
-        log.error(MESSAGE_SEND_ERROR_LOG, exc)
-    return True
+    if plant.image:
+        send = partial(
+            bot.send_photo, **params, caption=text, photo=plant.image
+        )
+    else:
+        send = partial(bot.send_message, **params, text=text)
+    return await delivery_queue.submit(plant.user_id, send)
+
+
+async def send_watering_digest(plants: list[PlantNotification]) -> bool:
+    """Send one notification about several plants of the same user."""
+    if bot is None:
+        log.error('Bot instance is not set.')
+        return False
+
+    chat_id = plants[0].user_id
+    lines = '\n'.join(_digest_line(plant) for plant in plants)
+    text = WATERING_DIGEST_MESSAGE.format(lines=lines)
+    params = dict(
+        chat_id=chat_id,
+        parse_mode='HTML',
+        reply_markup=digest_kb(plants),
+    )
+    photos = [plant for plant in plants if plant.image]
+    image = photos[0].image if len(photos) == 1 else None
+    if image and len(text) <= CAPTION_LIMIT:
+        send = partial(bot.send_photo, **params, caption=text, photo=image)
+        return await delivery_queue.submit(chat_id, send)
+    if photos and not await delivery_queue.submit(
+        chat_id, _digest_photos(bot, chat_id, photos)
+    ):
+        return False
+    send = partial(bot.send_message, **params, text=text)
+    return await delivery_queue.submit(chat_id, send)
+
+
+def _digest_photos(
+    client: Bot, chat_id: int, plants: list[PlantNotification]
+) -> partial:
+    """Send digest photos captioned with plant names, apart from the text."""
+    media: list[MediaUnion] = [
+        InputMediaPhoto(media=plant.image, caption=_caption(plant.name))
+        for plant in plants
+        if plant.image
+    ]
+    if len(media) == 1:
+        return partial(
+            client.send_photo,
+            chat_id=chat_id,
+            photo=media[0].media,
+            caption=media[0].caption,
+        )
+    return partial(client.send_media_group, chat_id=chat_id, media=media)
+
+
+def _caption(text: str) -> str:
+    return text[:CAPTION_LIMIT]
+
+
+def _digest_line(plant: PlantNotification) -> str:
+    line = WATERING_DIGEST_LINE.format(
+        name=plant.name,
+        fert=(
+            WATERING_DIGEST_FERT
+            if plant.sync_watering_and_fertilizing()
+            else ''
+        ),
+    )
+    overdue = plant.overdue_days()
+    if overdue:
+        line += WATERING_DIGEST_OVERDUE.format(days=overdue)
+    return line
+
+
+async def scheduled_watering_notifications():
+    """Run watering notifications and checkpoint the run in Mongo."""
+    await watering_notifications()
+    await overdue_notifications()
+    released = await photo_ingestion.sweep_expired()
+    log.info(EXPIRED_UPLOADS_RELEASED_LOG, released)
+    await JobCheckpoint.record_run(JOB_ID, datetime.now(timezone.utc))
 
 
 async def start_scheduler():
@@ -100,13 +323,45 @@ async def start_scheduler():
             log.info(JOB_EXISTS_LOG, JOB_ID)
         else:
             scheduler.add_job(
-                watering_notifications,
-                trigger='cron',
-                hour=10,
-                minute=00,
+                scheduled_watering_notifications,
+                trigger=watering_trigger,
                 id=JOB_ID,
+                misfire_grace_time=config.scheduler.misfire_grace_time,
                 replace_existing=False,
             )
             log.info(JOB_ADDED_LOG, JOB_ID)
+            await _catch_up_missed_run()
     except Exception as exc:
         log.error(SCHEDULER_START_FAILED_LOG, exc)
+
+
+async def stop_scheduler():
+    """Drop scheduled jobs when this replica is no longer the leader."""
+    scheduler.remove_all_jobs()
+    log.info(SCHEDULER_JOBS_REMOVED_LOG)
+
+
+async def _catch_up_missed_run():
+    """Run the job now if its fire time passed while nobody was running."""
+    now = datetime.now(timezone.utc)
+    since = now - timedelta(seconds=config.scheduler.misfire_grace_time)
+    last_run = await JobCheckpoint.get_last_run(JOB_ID)
+    if last_run is not None:
+        since = max(since, last_run)
+    missed = watering_trigger.get_next_fire_time(None, since)
+    if missed is not None and missed <= now:
+        log.info(JOB_CATCH_UP_LOG, JOB_ID, missed)
+        scheduler.add_job(
+            scheduled_watering_notifications,
+            id=CATCH_UP_JOB_ID,
+            replace_existing=True,
+        )
+
+
+leader_elector = LeaderElector(
+    name=LEASE_NAME,
+    ttl=config.scheduler.lease_ttl,
+    renew_interval=config.scheduler.lease_renew_interval,
+    on_elected=start_scheduler,
+    on_demoted=stop_scheduler,
+)
@@ -1,20 +1,29 @@
+from bot.utils.delivery import delivery_queue
 from bot.utils.filters import (
     DateFilter,
     PhotoRequiredFilter,
     TextRequiredFilter,
 )
+from bot.utils.fsm import fsm_storage
 from bot.utils.handlers import (
+    PENDING_SAVE_KEY,
+    finish_plant,
     handle_biweekly_day,
     handle_day_of_month,
     handle_frequency_choice,
     handle_weekly_days,
     handle_weekly_done,
 )
+from bot.utils.ingestion import photo_ingestion
 from bot.utils.models import save_plant
 from bot.utils.storage import storage_service
+from bot.utils.summaries import plant_summaries
+from bot.utils.users import registered_users
 
 __all__ = [
     'save_plant',
+    'finish_plant',
+    'PENDING_SAVE_KEY',
     'handle_frequency_choice',
     'handle_weekly_days',
     'handle_weekly_done',
@@ -24,4 +33,9 @@ __all__ = [
     'PhotoRequiredFilter',
     'DateFilter',
     'storage_service',
+    'photo_ingestion',
+    'delivery_queue',
+    'fsm_storage',
+    'registered_users',
+    'plant_summaries',
 ]
@@ -0,0 +1,65 @@
+import time
+from collections import OrderedDict, namedtuple
+from collections.abc import Hashable
+from typing import Any
+
+CacheInfo = namedtuple('CacheInfo', ['hits', 'misses', 'maxsize', 'currsize'])
+
+
+class TTLCache:
+    """Bounded LRU mapping whose entries expire after a time to live."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        """TTLCache initialization."""
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return a live entry and mark it as recently used."""
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] <= time.monotonic():
+            self._entries.pop(key)
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return default
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, key: Hashable, cached: Any, ttl: float | None = None):
+        """Store an entry, evicting the least recently used on overflow."""
+        if ttl is None:
+            ttl = self.ttl
+        self._entries[key] = (time.monotonic() + ttl, cached)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable):
+        """Drop an entry if present."""
+        self._entries.pop(key, None)
+
+    def clear(self):
+        """Drop all entries and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def cache_info(self) -> CacheInfo:
+        """Counters in the shape of `functools.lru_cache` statistics."""
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self))
+
+
+def hit_rate(stats: CacheInfo) -> float:
+    """Share of lookups served from the cache."""
+    lookups = stats.hits + stats.misses
+    return stats.hits / lookups if lookups else 0
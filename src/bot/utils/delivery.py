@@ -0,0 +1,269 @@
+import asyncio
+import heapq
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from contextlib import suppress
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import count
+from logging import getLogger
+from typing import Any
+
+from aiogram.exceptions import (
+    TelegramNetworkError,
+    TelegramRetryAfter,
+    TelegramServerError,
+)
+
+from bot.log_message import (
+    DELIVERY_FAILED_LOG,
+    DELIVERY_RETRY_AFTER_LOG,
+    DELIVERY_RETRY_LOG,
+)
+from bot.utils.workers import WorkerPool, backoff
+from config import config
+
+SendCallable = Callable[[], Awaitable[Any]]
+
+DRAIN_RATE_WINDOW = 60
+CHAT_SLOTS_PRUNE_SIZE = 10000
+
+
+class TokenBucket:
+    """Token bucket limiting the global send rate."""
+
+    def __init__(self, rate: float, capacity: float):
+        """TokenBucket initialization."""
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self.paused_until: float = 0
+
+    async def acquire(self):
+        """Wait until a token is available and take it."""
+        while True:
+            now = time.monotonic()
+            if now < self.paused_until:
+                await asyncio.sleep(self.paused_until - now)
+                continue
+            self.tokens = min(
+                self.capacity,
+                self.tokens + (now - self.updated_at) * self.rate,
+            )
+            self.updated_at = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+    def pause(self, seconds: float):
+        """Stop handing out tokens for the given time."""
+        self.paused_until = max(
+            self.paused_until, time.monotonic() + seconds
+        )
+        self.tokens = 0
+
+
+@dataclass(eq=False)
+class DeliveryJob:
+    """Outbound request waiting in the delivery queue."""
+
+    chat_id: int
+    send: SendCallable
+    future: asyncio.Future = field(repr=False)
+    attempts: int = 0
+
+
+class DeliveryQueue:
+    """Outbound Telegram queue respecting global and per-chat limits.
+
+    Jobs wait in one FIFO per chat, and chats wait in a heap ordered by
+    the time their next message may go out. Workers only take chats that
+    are due, so a chat with many messages never holds the pool while its
+    per-chat interval runs out.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        per_chat_interval: float,
+        max_retries: int,
+        retry_backoff: float,
+        workers: int,
+        queue_size: int,
+    ):
+        """DeliveryQueue initialization."""
+        self.bucket = TokenBucket(rate=rate, capacity=rate)
+        self.per_chat_interval = per_chat_interval
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.queue_size = queue_size
+        self.sent = 0
+        self.failed = 0
+        self.retried = 0
+        self.log = getLogger(__name__)
+        self._workers = WorkerPool(workers)
+        self._chats: dict[int, deque[DeliveryJob]] = {}
+        self._in_flight: dict[int, DeliveryJob] = {}
+        self._ready: list[tuple[float, int, int]] = []
+        self._order = count()
+        self._chat_slots: dict[int, float] = {}
+        self._sent_at: deque[float] = deque()
+        self._pending = 0
+        self._capacity: asyncio.Semaphore | None = None
+        self._wakeup: asyncio.Event | None = None
+
+    @property
+    def depth(self) -> int:
+        """Number of requests waiting to be sent."""
+        return self._pending
+
+    @property
+    def drain_rate(self) -> float:
+        """Successful sends per second over the recent window."""
+        self._prune_sent_at(time.monotonic())
+        return len(self._sent_at) / DRAIN_RATE_WINDOW
+
+    async def submit(self, chat_id: int, send: SendCallable) -> bool:
+        """Queue a request and wait for its delivery result."""
+        capacity = self._ensure_started()
+        await capacity.acquire()
+        future = asyncio.get_running_loop().create_future()
+        job = DeliveryJob(chat_id=chat_id, send=send, future=future)
+        self._pending += 1
+        chat_jobs = self._chats.get(chat_id)
+        if chat_jobs is None:
+            self._chats[chat_id] = deque([job])
+            self._schedule(chat_id)
+        else:
+            chat_jobs.append(job)
+        return await future
+
+    async def stop(self):
+        """Cancel workers and fail every request still queued or in flight."""
+        await self._workers.stop()
+        jobs = list(self._in_flight.values())
+        for chat_jobs in self._chats.values():
+            jobs.extend(chat_jobs)
+        for job in jobs:
+            if not job.future.done():
+                job.future.set_result(False)
+        self._chats = {}
+        self._in_flight = {}
+        self._ready = []
+        self._pending = 0
+        self._capacity = None
+        self._wakeup = None
+
+    def _ensure_started(self) -> asyncio.Semaphore:
+        if self._capacity is None:
+            self._capacity = asyncio.Semaphore(self.queue_size)
+            self._wakeup = asyncio.Event()
+            self._workers.start(partial(self._worker, self._wakeup))
+        return self._capacity
+
+    def _schedule(self, chat_id: int):
+        ready_at = self._chat_slots.get(chat_id, 0)
+        heapq.heappush(self._ready, (ready_at, next(self._order), chat_id))
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    async def _next_job(self, wakeup: asyncio.Event) -> DeliveryJob:
+        while True:
+            now = time.monotonic()
+            if self._ready and self._ready[0][0] <= now:
+                chat_id = heapq.heappop(self._ready)[2]
+                job = self._chats[chat_id].popleft()
+                self._in_flight[chat_id] = job
+                return job
+            timeout = self._ready[0][0] - now if self._ready else None
+            wakeup.clear()
+            with suppress(TimeoutError):
+                await asyncio.wait_for(wakeup.wait(), timeout)
+
+    async def _worker(self, wakeup: asyncio.Event):
+        while True:
+            job = await self._next_job(wakeup)
+            try:
+                delivered = await self._deliver(job)
+            except Exception as exc:
+                self.log.error(DELIVERY_FAILED_LOG, job.chat_id, exc)
+                delivered = False
+            self._in_flight.pop(job.chat_id, None)
+            if delivered is None:
+                self._chats[job.chat_id].appendleft(job)
+            else:
+                self._finish(job, delivered)
+            if self._chats.get(job.chat_id):
+                self._schedule(job.chat_id)
+            else:
+                self._chats.pop(job.chat_id, None)
+
+    async def _deliver(self, job: DeliveryJob) -> bool | None:
+        """Send the job once, returning None when it should be retried."""
+        await self.bucket.acquire()
+        try:
+            await job.send()
+        except TelegramRetryAfter as exc:
+            self.log.warning(
+                DELIVERY_RETRY_AFTER_LOG, job.chat_id, exc.retry_after
+            )
+            self.bucket.pause(exc.retry_after)
+            return self._retry(job, exc.retry_after)
+        except (TelegramNetworkError, TelegramServerError) as exc:
+            self.log.warning(DELIVERY_RETRY_LOG, job.chat_id, exc)
+            delay = backoff(self.retry_backoff, job.attempts)
+            return self._retry(job, delay)
+        self._hold_chat(job.chat_id, self.per_chat_interval)
+        return True
+
+    def _retry(self, job: DeliveryJob, delay: float) -> bool | None:
+        if job.attempts >= self.max_retries:
+            self.log.error(
+                DELIVERY_FAILED_LOG, job.chat_id, 'retries exhausted'
+            )
+            return False
+        job.attempts += 1
+        self.retried += 1
+        self._hold_chat(job.chat_id, delay)
+        return None
+
+    def _finish(self, job: DeliveryJob, delivered: bool):
+        if delivered:
+            self.sent += 1
+            now = time.monotonic()
+            self._sent_at.append(now)
+            self._prune_sent_at(now)
+        else:
+            self.failed += 1
+        self._pending -= 1
+        if self._capacity is not None:
+            self._capacity.release()
+        if not job.future.done():
+            job.future.set_result(delivered)
+
+    def _hold_chat(self, chat_id: int, delay: float):
+        now = time.monotonic()
+        self._chat_slots[chat_id] = now + delay
+        if len(self._chat_slots) > CHAT_SLOTS_PRUNE_SIZE:
+            self._chat_slots = {
+                chat_id: ready_at
+                for chat_id, ready_at in self._chat_slots.items()
+                if ready_at > now
+            }
+
+    def _prune_sent_at(self, now: float):
+        while self._sent_at and now - self._sent_at[0] > DRAIN_RATE_WINDOW:
+            self._sent_at.popleft()
+
+
+delivery_queue = DeliveryQueue(
+    rate=config.delivery.rate,
+    per_chat_interval=config.delivery.per_chat_interval,
+    max_retries=config.delivery.max_retries,
+    retry_backoff=config.delivery.retry_backoff,
+    workers=config.delivery.workers,
+    queue_size=config.delivery.queue_size,
+)
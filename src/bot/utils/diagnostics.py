@@ -0,0 +1,60 @@
+import asyncio
+from typing import Any
+
+from beanie.odm.queries.find import FindMany
+
+from bot.models import Plant
+
+COLLSCAN = 'COLLSCAN'
+
+
+def hot_queries(user_id: int) -> dict[str, FindMany]:
+    """Build the queries served on every notification run and user request."""
+    return {
+        'due_today': Plant.find(
+            *Plant._to_water_today_filter(), sort='+user_id'
+        ),
+        'user_plants': Plant.find(Plant.user_id == user_id, sort='+_id'),
+        'user_plant_by_name': Plant.find(
+            Plant.user_id == user_id, Plant.name == ''
+        ),
+    }
+
+
+async def explain_hot_queries(user_id: int) -> dict[str, str]:
+    """Return a short winning plan summary for every hot query."""
+    queries = hot_queries(user_id)
+    explains = await asyncio.gather(*map(_explain, queries.values()))
+    return {
+        name: summarize_plan(explain)
+        for name, explain in zip(queries, explains, strict=True)
+    }
+
+
+async def _explain(query: FindMany) -> dict[str, Any]:
+    cursor = Plant.get_pymongo_collection().find(query.get_filter_query())
+    if query.sort_expressions:
+        cursor = cursor.sort(query.sort_expressions)
+    return await cursor.explain()
+
+
+def summarize_plan(explain: dict[str, Any]) -> str:
+    """Flatten the winning plan into a `STAGE(index) <- STAGE` chain."""
+    planner = explain.get('queryPlanner', {})
+    plan = planner.get('winningPlan', {})
+    plan = plan.get('queryPlan', plan)
+    stages = []
+    while plan:
+        stage = plan.get('stage', '?')
+        if plan.get('indexName'):
+            stage = f'{stage}({plan["indexName"]})'
+        stages.append(stage)
+        plan = plan.get('inputStage') or next(
+            iter(plan.get('inputStages', [])), None
+        )
+    return ' <- '.join(stages) or COLLSCAN
+
+
+def is_collection_scan(summary: str) -> bool:
+    """Check whether the plan summary reads the whole collection."""
+    return COLLSCAN in summary
@@ -0,0 +1,121 @@
+import copy
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+
+from aiogram.exceptions import DataNotDictLikeError
+from aiogram.fsm.state import State
+from aiogram.fsm.storage.base import (
+    BaseStorage,
+    DefaultKeyBuilder,
+    KeyBuilder,
+    StateType,
+    StorageKey,
+)
+
+from bot.models import FSMRecord
+from config import config
+
+Record = tuple[str | None, dict[str, Any]]
+
+_update_records: ContextVar[dict[str, Record] | None] = ContextVar(
+    'fsm_update_records', default=None
+)
+
+
+class MongoStorage(BaseStorage):
+    """FSM storage shared by replicas through Mongo.
+
+    Idle conversations expire by a TTL index. Records are cached only
+    within `update_scope`, so an update never sees state older than the
+    one it started with, whichever replica wrote it.
+    """
+
+    def __init__(
+        self,
+        idle_ttl: int,
+        key_builder: KeyBuilder | None = None,
+    ):
+        """MongoStorage initialization."""
+        self.idle_ttl = idle_ttl
+        self.key_builder = key_builder or DefaultKeyBuilder()
+
+    @contextmanager
+    def update_scope(self) -> Iterator[None]:
+        """Share records read and written while one update is handled."""
+        token = _update_records.set({})
+        try:
+            yield
+        finally:
+            _update_records.reset(token)
+
+    async def set_state(self, key: StorageKey, state: StateType = None):
+        """Store the conversation state."""
+        if isinstance(state, State):
+            state = state.state
+        await self._store(key, {'state': state})
+
+    async def get_state(self, key: StorageKey) -> str | None:
+        """Receive the conversation state."""
+        state, _ = await self._record(key)
+        return state
+
+    async def set_data(self, key: StorageKey, data: Mapping[str, Any]):
+        """Store the conversation data in compact form."""
+        if not isinstance(data, dict):
+            raise DataNotDictLikeError(
+                f'Data must be a dict or dict-like object, '
+                f'got {type(data).__name__}'
+            )
+        await self._store(key, {'data': compact(data)})
+
+    async def get_data(self, key: StorageKey) -> dict[str, Any]:
+        """Receive a copy of the conversation data."""
+        _, data = await self._record(key)
+        return copy.deepcopy(data)
+
+    async def close(self):
+        """Nothing to release, the Mongo client is shared."""
+
+    async def _record(self, key: StorageKey) -> Record:
+        record_id = self.key_builder.build(key)
+        records = _update_records.get()
+        if records is not None and record_id in records:
+            return records[record_id]
+        record = await FSMRecord.load(record_id)
+        if records is not None:
+            records[record_id] = record
+        return record
+
+    async def _store(self, key: StorageKey, fields: dict[str, Any]):
+        record_id = self.key_builder.build(key)
+        record = await FSMRecord.store(record_id, fields, self.idle_ttl)
+        records = _update_records.get()
+        if records is not None:
+            records[record_id] = record
+
+
+def compact(value: Any) -> Any:
+    """Convert state data to plain BSON types without empty values.
+
+    Sets become sorted lists, which the add-plant flow reads back as is.
+    """
+    if isinstance(value, Mapping):
+        return {
+            str(key): compact(item)
+            for key, item in value.items()
+            if item is not None
+        }
+    if isinstance(value, (list, tuple)):
+        return [compact(item) for item in value]
+    if isinstance(value, (set, frozenset)):
+        items = [compact(item) for item in value]
+        try:
+            return sorted(items)
+        except TypeError:
+            return items
+    return value
+
+
+fsm_storage = MongoStorage(idle_ttl=config.fsm.idle_ttl)
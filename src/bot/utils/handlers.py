@@ -10,15 +10,25 @@ from bot.constants import (
     WATERING_FREQUENCY_CONFIG,
     add_plant,
 )
-from bot.keyboard import DayCallback, days_kb, frequency_type_kb, get_cancel_kb
+from bot.keyboard import (
+    DayCallback,
+    days_kb,
+    frequency_type_kb,
+    get_cancel_kb,
+    get_main_kb,
+)
 from bot.models import FrequencyType
 from bot.states import AddPlant
+from bot.utils.models import save_plant
 from bot.utils.telegram import (
     require_callback_data,
     require_message,
     require_text,
+    require_user,
 )
 
+PENDING_SAVE_KEY = 'pending_save_is_fert'
+
 
 def _extract_selected_days(
     state_data: Mapping[str, Any],
@@ -179,3 +189,25 @@ async def handle_day_of_month(
             reply_markup=get_cancel_kb(back=True, skip=True),
         )
         await state.set_state(AddPlant.fertilizing_start)
+
+
+async def finish_plant(
+    message: Message, state: FSMContext, is_fert: bool, done_text: str
+):
+    """Save the collected plant or ask for another name if it is taken.
+
+    The answers stay in the state, so the plant is saved as soon as a
+    free name arrives.
+    """
+    state_data = await state.get_data()
+    state_data['user_id'] = require_user(message.from_user).id
+    if await save_plant(plant_data=state_data, is_fert=is_fert):
+        await message.answer(done_text, reply_markup=get_main_kb())
+        await state.clear()
+        return
+    await state.update_data({PENDING_SAVE_KEY: is_fert})
+    await message.answer(
+        add_plant.NOT_UNIQUE_NAME_MSG,
+        reply_markup=get_cancel_kb(),
+    )
+    await state.set_state(AddPlant.name)
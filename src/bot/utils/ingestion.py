@@ -0,0 +1,165 @@
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from functools import partial
+from logging import getLogger
+
+from aiogram import Bot
+
+from bot.log_message import (
+    PHOTO_INGESTION_DROPPED_LOG,
+    PHOTO_INGESTION_FAILED_LOG,
+    PHOTO_INGESTION_RETRY_LOG,
+)
+from bot.models import PhotoUpload, Plant
+from bot.utils.storage import storage_service
+from bot.utils.workers import WorkerPool, backoff
+from config import config
+
+
+class PhotoDownloadError(Exception):
+    """Telegram refused to hand the photo out."""
+
+
+@dataclass
+class PhotoJob:
+    """Telegram photo waiting to be copied to object storage."""
+
+    bot: Bot
+    user_id: int
+    file_id: str
+
+
+class PhotoIngestionQueue:
+    """Background queue copying plant photos from Telegram to S3.
+
+    The add-plant flow only keeps the Telegram `file_id`. Once the upload
+    completes, the object is attached to the plant holding that photo, or
+    recorded until `save_plant` picks it up. Discards are recorded in
+    Mongo, so they reach the upload on whichever replica runs it.
+    """
+
+    def __init__(
+        self,
+        workers: int,
+        queue_size: int,
+        max_retries: int,
+        retry_backoff: float,
+        record_ttl: int,
+        drain_timeout: float,
+    ):
+        """PhotoIngestionQueue initialization."""
+        self.queue_size = queue_size
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.record_ttl = record_ttl
+        self.drain_timeout = drain_timeout
+        self.ingested = 0
+        self.failed = 0
+        self.log = getLogger(__name__)
+        self._queue: asyncio.Queue[PhotoJob] | None = None
+        self._workers = WorkerPool(workers)
+
+    async def submit(self, bot: Bot, user_id: int, file_id: str):
+        """Queue the photo, waiting only while the queue is full."""
+        queue = self._ensure_started()
+        await PhotoUpload.forget_discard(file_id)
+        await queue.put(PhotoJob(bot=bot, user_id=user_id, file_id=file_id))
+
+    async def discard(self, user_id: int, file_id: str):
+        """Drop the object of an abandoned photo, now or once uploaded."""
+        storage_key = await PhotoUpload.discard(
+            file_id, user_id, self.record_ttl
+        )
+        if storage_key:
+            await storage_service.release_image(storage_key)
+
+    async def sweep_expired(self) -> int:
+        """Release objects of photos whose flow ended without a plant."""
+        released = 0
+        now = datetime.now(timezone.utc)
+        async for storage_key in PhotoUpload.claim_expired(now):
+            await storage_service.release_image(storage_key)
+            released += 1
+        return released
+
+    async def join(self):
+        """Wait until every queued photo is processed."""
+        if self._queue is not None:
+            await self._queue.join()
+
+    async def stop(self):
+        """Let queued photos finish for a while, then cancel workers."""
+        queue = self._queue
+        if queue is not None and self._workers.running:
+            try:
+                await asyncio.wait_for(queue.join(), self.drain_timeout)
+            except TimeoutError:
+                self.log.warning(PHOTO_INGESTION_DROPPED_LOG, queue.qsize())
+        await self._workers.stop()
+        self._queue = None
+
+    def _ensure_started(self) -> asyncio.Queue[PhotoJob]:
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self.queue_size)
+            self._workers.start(partial(self._worker, self._queue))
+        return self._queue
+
+    async def _worker(self, queue: asyncio.Queue[PhotoJob]):
+        while True:
+            job = await queue.get()
+            try:
+                await self._process(job)
+            finally:
+                queue.task_done()
+
+    async def _process(self, job: PhotoJob):
+        for attempt in range(self.max_retries + 1):
+            try:
+                storage_key = await self._upload(job)
+            except Exception as exc:
+                if attempt == self.max_retries:
+                    self.failed += 1
+                    self.log.error(
+                        PHOTO_INGESTION_FAILED_LOG, job.file_id, exc
+                    )
+                    return
+                self.log.warning(PHOTO_INGESTION_RETRY_LOG, job.file_id, exc)
+                await asyncio.sleep(backoff(self.retry_backoff, attempt))
+            else:
+                await self._attach(job, storage_key)
+                self.ingested += 1
+                return
+
+    async def _upload(self, job: PhotoJob) -> str:
+        file = await job.bot.get_file(job.file_id)
+        storage_key = None
+        if file.file_path:
+            storage_key = await storage_service.upload_telegram_file(
+                file.file_path, job.user_id
+            )
+        if storage_key is None:
+            raise PhotoDownloadError(job.file_id)
+        return storage_key
+
+    async def _attach(self, job: PhotoJob, storage_key: str):
+        recorded = await PhotoUpload.record(
+            job.file_id, job.user_id, storage_key, self.record_ttl
+        )
+        if not recorded:
+            await storage_service.release_image(storage_key)
+            return
+        if await Plant.attach_storage_key(
+            job.user_id, job.file_id, storage_key
+        ):
+            await PhotoUpload.claim(job.file_id)
+
+
+photo_ingestion = PhotoIngestionQueue(
+    workers=config.ingestion.workers,
+    queue_size=config.ingestion.queue_size,
+    max_retries=config.ingestion.max_retries,
+    retry_backoff=config.ingestion.retry_backoff,
+    record_ttl=config.ingestion.record_ttl,
+    drain_timeout=config.ingestion.drain_timeout,
+)
@@ -0,0 +1,86 @@
+import asyncio
+import os
+import socket
+from collections.abc import Awaitable, Callable
+from logging import getLogger
+from uuid import uuid4
+
+from bot.log_message import (
+    LEADER_DEMOTED_LOG,
+    LEADER_ELECTED_LOG,
+    LEASE_RENEW_ERROR_LOG,
+)
+from bot.models import SchedulerLease
+
+LeaderCallback = Callable[[], Awaitable[None]]
+
+
+class LeaderElector:
+    """Lease-based election of the replica that runs scheduled jobs."""
+
+    def __init__(
+        self,
+        name: str,
+        ttl: int,
+        renew_interval: int,
+        on_elected: LeaderCallback,
+        on_demoted: LeaderCallback,
+    ):
+        """LeaderElector initialization."""
+        self.name = name
+        self.ttl = ttl
+        self.renew_interval = renew_interval
+        self.on_elected = on_elected
+        self.on_demoted = on_demoted
+        self.owner = _owner_id()
+        self.is_leader = False
+        self.log = getLogger(__name__)
+        self._task: asyncio.Task | None = None
+
+    async def start(self):
+        """Start campaigning for the lease in the background."""
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        """Stop campaigning and release the lease if it is held."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self.is_leader:
+            await self._demote()
+            await SchedulerLease.release(self.name, self.owner)
+
+    async def tick(self):
+        """Acquire or renew the lease once and react to the outcome."""
+        try:
+            acquired = await SchedulerLease.acquire(
+                self.name, self.owner, self.ttl
+            )
+        except Exception as exc:
+            self.log.error(LEASE_RENEW_ERROR_LOG, exc)
+            acquired = False
+        if acquired and not self.is_leader:
+            self.is_leader = True
+            self.log.info(LEADER_ELECTED_LOG, self.owner)
+            await self.on_elected()
+        elif not acquired and self.is_leader:
+            await self._demote()
+
+    async def _run(self):
+        while True:
+            await self.tick()
+            await asyncio.sleep(self.renew_interval)
+
+    async def _demote(self):
+        self.is_leader = False
+        self.log.info(LEADER_DEMOTED_LOG, self.owner)
+        await self.on_demoted()
+
+
+def _owner_id() -> str:
+    host = socket.gethostname()
+    pid = os.getpid()
+    suffix = uuid4().hex[:8]
+    return f'{host}:{pid}:{suffix}'
@@ -2,15 +2,19 @@ from collections.abc import Mapping
 from datetime import date, timedelta
 from typing import Any
 
+from pymongo.errors import DuplicateKeyError
+
 from bot.models import (
     FertilizingPeriod,
     FertilizingType,
     FrequencyType,
     MonthDay,
+    PhotoUpload,
     Plant,
     WateringPeriod,
     WateringSchedule,
 )
+from bot.utils.summaries import plant_summaries
 
 WARM_START_KEY = 'warm_start'
 WARM_END_KEY = 'warm_end'
@@ -66,8 +70,12 @@ def _get_weekday_choice(raw_choice: Any) -> set[int] | int | None:
     raise ValueError('Weekday choice has unexpected format.')
 
 
-async def save_plant(plant_data: Mapping[str, Any], is_fert: bool):
-    """Plant save method."""
+async def save_plant(plant_data: Mapping[str, Any], is_fert: bool) -> bool:
+    """Plant save method.
+
+    Returns False when the user saved another plant with the same name
+    after the name was checked.
+    """
     today = date.today()
     cold_start, cold_end = cold_period(
         warm_start=MonthDay(
@@ -164,4 +172,17 @@ async def save_plant(plant_data: Mapping[str, Any], is_fert: bool):
         plant.next_fertilizing_date()
 
     plant.next_watering_date()
-    await plant.insert()
+    try:
+        await plant.insert()
+    except DuplicateKeyError:
+        return False
+    if plant.image and not plant.storage_key:
+        await _claim_photo(plant.user_id, plant.image)
+    plant_summaries.invalidate(plant.user_id)
+    return True
+
+
+async def _claim_photo(user_id: int, file_id: str):
+    storage_key = await PhotoUpload.claim(file_id)
+    if storage_key:
+        await Plant.attach_storage_key(user_id, file_id, storage_key)
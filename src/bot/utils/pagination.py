@@ -0,0 +1,122 @@
+from dataclasses import dataclass
+from math import ceil
+from typing import Any
+
+from aiogram.fsm.context import FSMContext
+from aiogram.types import CallbackQuery
+from beanie import PydanticObjectId
+
+from bot.callback import Action
+from bot.keyboard import get_keyboard_with_navigation
+from bot.models import PlantSummary
+from bot.utils.summaries import plant_summaries
+from bot.utils.telegram import require_message, require_user
+from config import config
+
+CURSOR_KEY = 'page_cursor'
+
+
+@dataclass
+class PlantPage:
+    """One page of the plant browser."""
+
+    plants: list[PlantSummary]
+    number: int
+    has_prev: bool
+    has_next: bool
+    pages: int = 0
+
+    @property
+    def cursor(self) -> dict[str, Any]:
+        """Position of the page kept in FSM state."""
+        return {
+            'page': self.number,
+            'first': str(self.plants[0].id),
+            'last': str(self.plants[-1].id),
+        }
+
+    @property
+    def lines(self) -> str:
+        """Plant list shown in the browser message."""
+        return '\n'.join(
+            f'{plant.name} — {plant.last_watered_at}' for plant in self.plants
+        )
+
+    def keyboard(self, action: Action):
+        """Plant buttons with navigation for the page."""
+        return get_keyboard_with_navigation(
+            self.plants, self.has_prev, self.has_next, action
+        )
+
+
+def slice_page(
+    summaries: list[PlantSummary],
+    limit: int,
+    after: PydanticObjectId | None = None,
+    before: PydanticObjectId | None = None,
+) -> tuple[list[PlantSummary], bool]:
+    """Take a page of summaries next to the given id.
+
+    Summaries are ordered by id. The page follows `after` or precedes
+    `before`, and the flag tells whether more plants lie beyond it.
+    """
+    if before is not None:
+        preceding = [plant for plant in summaries if plant.id < before]
+        return preceding[-limit:], len(preceding) > limit
+    if after is not None:
+        summaries = [plant for plant in summaries if plant.id > after]
+    return summaries[:limit], len(summaries) > limit
+
+
+async def first_page(user_id: int) -> PlantPage | None:
+    """Open the browser on the first page, or None without plants."""
+    summaries = await plant_summaries.get(user_id)
+    if not summaries:
+        return None
+    page_size = config.service.page_size
+    plants, has_next = slice_page(summaries, page_size)
+    return PlantPage(
+        plants=plants,
+        number=0,
+        has_prev=False,
+        has_next=has_next,
+        pages=ceil(len(summaries) / page_size),
+    )
+
+
+async def turn_page(
+    callback: CallbackQuery,
+    state: FSMContext,
+    direction: Action,
+    item_action: Action,
+):
+    """Show the previous or next page and keep its cursor in state."""
+    user_id = require_user(callback.from_user).id
+    cursor = (await state.get_data()).get(CURSOR_KEY)
+    if not cursor:
+        await callback.answer()
+        return
+    page = await _neighbour_page(user_id, cursor, direction)
+    if not page.plants:
+        await callback.answer()
+        return
+    await state.update_data({CURSOR_KEY: page.cursor})
+    message = require_message(callback)
+    await message.edit_reply_markup(reply_markup=page.keyboard(item_action))
+    await callback.answer()
+
+
+async def _neighbour_page(
+    user_id: int, cursor: dict[str, Any], direction: Action
+) -> PlantPage:
+    page_size = config.service.page_size
+    summaries = await plant_summaries.get(user_id)
+    if direction == Action.next:
+        plants, has_next = slice_page(
+            summaries, page_size, after=PydanticObjectId(cursor['last'])
+        )
+        return PlantPage(plants, cursor['page'] + 1, True, has_next)
+    plants, has_prev = slice_page(
+        summaries, page_size, before=PydanticObjectId(cursor['first'])
+    )
+    return PlantPage(plants, cursor['page'] - 1, has_prev, True)
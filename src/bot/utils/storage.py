@@ -1,19 +1,57 @@
-from contextlib import asynccontextmanager
+import asyncio
+import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import AsyncExitStack
 from logging import getLogger
+from typing import Any, Protocol
 from uuid import uuid4
 
 import aiohttp
 from aioboto3 import Session  # type: ignore
+from aiobotocore.config import AioConfig
+from botocore.exceptions import ClientError
+from PIL import Image
 
-from bot.log_message import FILE_DOWNLOAD_ERROR_LOG, STORAGE_UTIL_STARTED_LOG
+from bot.images import (
+    ImageProfile,
+    NormalizedImage,
+    normalize_image,
+    thumbnail_key,
+)
+from bot.log_message import (
+    FILE_DOWNLOAD_ERROR_LOG,
+    IMAGE_NORMALIZE_ERROR_LOG,
+    STORAGE_CLIENT_OPENED_LOG,
+    STORAGE_UTIL_STARTED_LOG,
+)
+from bot.models import StoredPhoto
 from config import config
 
 TG_URL = 'https://api.telegram.org/file/bot{token}/{file_path}'
 STATUS_OK = 200
+PHOTO_PREFIX = 'photos'
+MISSING_OBJECT_CODES = frozenset(('404', 'NoSuchKey', 'NotFound'))
+# Forking a process running an event loop and open sockets is unsafe.
+IMAGE_POOL_START = 'forkserver'
+
+
+class ByteStream(Protocol):
+    """Source of bytes read in pieces, like `aiohttp.StreamReader`."""
+
+    async def read(self, size: int = -1, /) -> bytes:
+        """Read up to size bytes, an empty result marks the end."""
 
 
 class S3StorageService:
-    """Service for interacting with S3 storage using aioboto3."""
+    """Service for interacting with S3 storage using aioboto3.
+
+    The S3 client and the HTTP session for Telegram downloads are opened
+    once and reused, so uploads share their connection pools. Photos are
+    re-encoded in a process pool before upload, off the event loop, and
+    stored under keys derived from their content, so a photo sent again
+    is neither re-encoded nor uploaded.
+    """
 
     def __init__(self):
         """S3StorageService initialization."""
@@ -22,32 +60,98 @@ class S3StorageService:
         self.endpoint_url = config.storage.endpoint_url
         self.aws_access_key = config.secrets.aws_access_key.get_secret_value()
         self.aws_secret_key = config.secrets.aws_secret_key.get_secret_value()
+        self.pool_size = config.storage.pool_size
+        self.connect_timeout = config.storage.connect_timeout
+        self.read_timeout = config.storage.read_timeout
+        self.part_size = config.storage.part_size
+        self.transfers = asyncio.Semaphore(config.storage.max_transfers)
         self.log = getLogger(__name__)
+        self._s3: Any = None
+        self._s3_stack: AsyncExitStack | None = None
+        self._s3_lock = asyncio.Lock()
+        self._http: aiohttp.ClientSession | None = None
+        self.normalize_images = config.images.enabled
+        self.image_workers = config.images.workers
+        self.image_profile = ImageProfile(
+            format=config.images.format,
+            max_side=config.images.max_side,
+            max_bytes=config.images.max_bytes,
+            quality=config.images.quality,
+            thumbnail_side=config.images.thumbnail_side,
+        )
+        self._images: ProcessPoolExecutor | None = None
 
         self.log.info(STORAGE_UTIL_STARTED_LOG)
 
+    async def start(self):
+        """Open the S3 client and the HTTP session ahead of first use."""
+        await self._s3_client()
+        self._http_session()
+
+    async def stop(self):
+        """Close the S3 client, the HTTP session and the image workers."""
+        if self._s3_stack is not None:
+            await self._s3_stack.aclose()
+        self._s3 = None
+        self._s3_stack = None
+        if self._http is not None:
+            await self._http.close()
+        self._http = None
+        if self._images is not None:
+            self._images.shutdown(wait=False, cancel_futures=True)
+        self._images = None
+
     async def upload_file(self, storage_key: str, file_bytes: bytes):
         """Upload a file to S3 storage."""
-        async with self._s3_client() as s3:
-            await s3.put_object(
-                Bucket=self.bucket, Key=storage_key, Body=file_bytes
-            )
+        s3 = await self._s3_client()
+        await s3.put_object(
+            Bucket=self.bucket, Key=storage_key, Body=file_bytes
+        )
+
+    async def upload_stream(self, storage_key: str, stream: ByteStream):
+        """Upload a stream holding at most one part in memory.
+
+        A stream that fits in one part is sent with a single PUT, a longer
+        one as a multipart upload that is aborted on failure.
+        """
+        part = await _read_part(stream, self.part_size)
+        await self._upload_from(storage_key, part, stream)
 
     async def delete_file(self, storage_key: str):
         """Delete a file from S3 storage."""
-        async with self._s3_client() as s3:
-            await s3.delete_object(Bucket=self.bucket, Key=storage_key)
+        s3 = await self._s3_client()
+        await s3.delete_object(Bucket=self.bucket, Key=storage_key)
+
+    async def object_exists(self, storage_key: str) -> bool:
+        """Check with a HEAD request whether the object is stored."""
+        s3 = await self._s3_client()
+        try:
+            await s3.head_object(Bucket=self.bucket, Key=storage_key)
+        except ClientError as exc:
+            if exc.response['Error']['Code'] in MISSING_OBJECT_CODES:
+                return False
+            raise
+        return True
+
+    async def release_image(self, storage_key: str):
+        """Drop a reference to a photo, deleting it with the last one."""
+        if await StoredPhoto.release(storage_key):
+            await self.delete_image(storage_key)
+
+    async def delete_image(self, storage_key: str):
+        """Delete a photo from S3 storage together with its thumbnail."""
+        await self.delete_files([storage_key, thumbnail_key(storage_key)])
 
     async def delete_files(self, storage_keys: list[str]):
         """Delete files from S3 storage."""
-        async with self._s3_client() as s3:
-            await s3.delete_objects(
-                Bucket=self.bucket,
-                Delete={
-                    'Objects': [{'Key': key} for key in storage_keys],
-                    'Quiet': True,
-                },
-            )
+        s3 = await self._s3_client()
+        await s3.delete_objects(
+            Bucket=self.bucket,
+            Delete={
+                'Objects': [{'Key': key} for key in storage_keys],
+                'Quiet': True,
+            },
+        )
 
     async def upload_telegram_file(
         self,
@@ -55,13 +159,18 @@ class S3StorageService:
         user_id: int,
     ) -> str | None:
         """
-        Download file from Telegram and upload it to S3.
+        Stream file from Telegram to S3.
 
-        Returns S3 storage key.
+        Returns S3 storage key. The number of simultaneous transfers is
+        limited by `storage.max_transfers`. With `images.enabled` a photo
+        that fits in one part is normalized by `upload_image`, a longer
+        file is streamed untouched, so at most one part is held in memory
+        either way.
         """
-
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
+        extension = file_path.split('.')[-1]
+        key = f'{user_id}/{uuid4()}.{extension}'
+        async with self.transfers:
+            async with self._http_session().get(
                 TG_URL.format(
                     token=config.secrets.bot_token.get_secret_value(),
                     file_path=file_path,
@@ -70,23 +179,149 @@ class S3StorageService:
                 if resp.status != STATUS_OK:
                     self.log.info(FILE_DOWNLOAD_ERROR_LOG, user_id)
                     return None
-                file_bytes = await resp.read()
+                part = await _read_part(resp.content, self.part_size)
+                if self.normalize_images and len(part) < self.part_size:
+                    return await self.upload_image(user_id, part, extension)
+                await self._upload_from(key, part, resp.content)
 
-        key = f'{user_id}/{uuid4()}.{file_path.split('.')[-1]}'
+        return key
 
-        await self.upload_file(key, file_bytes)
+    async def upload_image(
+        self,
+        user_id: int,
+        photo: bytes,
+        extension: str,
+    ) -> str:
+        """Store a normalized photo and its thumbnail under derived keys.
 
+        The key is named after the SHA-256 of the received bytes and every
+        call takes a reference to it. The upload is skipped when the key
+        is already referenced and its object exists. A photo that cannot
+        be decoded is stored as received under a key of its own.
+        """
+        digest = hashlib.sha256(photo).hexdigest()
+        key = f'{PHOTO_PREFIX}/{digest}.{self.image_profile.extension}'
+        refs = await StoredPhoto.acquire(key)
+        if refs > 1 and await self.object_exists(key):
+            return key
+        try:
+            normalized = await self.normalize(photo)
+        except (OSError, ValueError, Image.DecompressionBombError) as exc:
+            await StoredPhoto.release(key)
+            self.log.warning(IMAGE_NORMALIZE_ERROR_LOG, user_id, exc)
+            key = f'{user_id}/{uuid4()}.{extension}'
+            await self.upload_file(key, photo)
+            return key
+        try:
+            await asyncio.gather(
+                self.upload_file(key, normalized.image),
+                self.upload_file(thumbnail_key(key), normalized.thumbnail),
+            )
+        except BaseException:
+            await StoredPhoto.release(key)
+            raise
         return key
 
-    @asynccontextmanager
+    async def normalize(self, photo: bytes) -> NormalizedImage:
+        """Re-encode a photo in the image process pool."""
+        return await asyncio.get_running_loop().run_in_executor(
+            self._image_pool(), normalize_image, photo, self.image_profile
+        )
+
+    async def _upload_from(
+        self, storage_key: str, part: bytes, stream: ByteStream
+    ):
+        if len(part) < self.part_size:
+            await self.upload_file(storage_key, part)
+            return
+        s3 = await self._s3_client()
+        upload = await s3.create_multipart_upload(
+            Bucket=self.bucket, Key=storage_key
+        )
+        upload_id = upload['UploadId']
+        try:
+            parts = await self._upload_parts(
+                storage_key, upload_id, part, stream
+            )
+            await s3.complete_multipart_upload(
+                Bucket=self.bucket,
+                Key=storage_key,
+                UploadId=upload_id,
+                MultipartUpload={'Parts': parts},
+            )
+        except BaseException:
+            await s3.abort_multipart_upload(
+                Bucket=self.bucket, Key=storage_key, UploadId=upload_id
+            )
+            raise
+
+    async def _upload_parts(
+        self, storage_key: str, upload_id: str, part: bytes, stream: ByteStream
+    ) -> list[dict[str, Any]]:
+        s3 = await self._s3_client()
+        parts: list[dict[str, Any]] = []
+        while part:
+            number = len(parts) + 1
+            uploaded = await s3.upload_part(
+                Bucket=self.bucket,
+                Key=storage_key,
+                UploadId=upload_id,
+                PartNumber=number,
+                Body=part,
+            )
+            parts.append({'ETag': uploaded['ETag'], 'PartNumber': number})
+            part = await _read_part(stream, self.part_size)
+        return parts
+
     async def _s3_client(self):
-        async with self.session.client(
-            's3',
-            endpoint_url=self.endpoint_url,
-            aws_secret_access_key=self.aws_secret_key,
-            aws_access_key_id=self.aws_access_key,
-        ) as s3:
-            yield s3
+        async with self._s3_lock:
+            if self._s3 is None:
+                stack = AsyncExitStack()
+                self._s3 = await stack.enter_async_context(
+                    self.session.client(
+                        's3',
+                        endpoint_url=self.endpoint_url,
+                        aws_secret_access_key=self.aws_secret_key,
+                        aws_access_key_id=self.aws_access_key,
+                        config=AioConfig(
+                            max_pool_connections=self.pool_size,
+                            connect_timeout=self.connect_timeout,
+                            read_timeout=self.read_timeout,
+                        ),
+                    )
+                )
+                self._s3_stack = stack
+                self.log.info(STORAGE_CLIENT_OPENED_LOG, self.pool_size)
+        return self._s3
+
+    def _image_pool(self) -> ProcessPoolExecutor:
+        if self._images is None:
+            self._images = ProcessPoolExecutor(
+                max_workers=self.image_workers,
+                mp_context=multiprocessing.get_context(IMAGE_POOL_START),
+            )
+        return self._images
+
+    def _http_session(self) -> aiohttp.ClientSession:
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.pool_size),
+                timeout=aiohttp.ClientTimeout(
+                    sock_connect=self.connect_timeout,
+                    sock_read=self.read_timeout,
+                ),
+            )
+        return self._http
+
+
+async def _read_part(stream: ByteStream, size: int) -> bytes:
+    part = bytearray()
+    while len(part) < size:
+        chunk = await stream.read(size - len(part))
+        if not chunk:
+            break
+        part.extend(chunk)
+    return bytes(part)
 
 
 storage_service = S3StorageService()
@@ -0,0 +1,61 @@
+from collections.abc import AsyncIterable, AsyncIterator, Iterator
+
+from aiogram.types import Message
+
+MESSAGE_LIMIT = 4096
+
+
+async def pack_lines(
+    lines: AsyncIterable[str], limit: int = MESSAGE_LIMIT
+) -> AsyncIterator[str]:
+    """Pack lines into newline-joined chunks no longer than the limit.
+
+    Length is measured by `text_length`, the way Telegram counts it. A
+    chunk is yielded as soon as the next line does not fit, so only one
+    chunk is held in memory. Lines longer than the limit are cut.
+    """
+    chunk: list[str] = []
+    size = 0
+    async for line in lines:
+        for piece in _cut(line, limit):
+            piece_size = text_length(piece)
+            if size + piece_size > limit:
+                yield '\n'.join(chunk)
+                chunk, size = [], 0
+            chunk.append(piece)
+            size += piece_size + 1
+    if chunk:
+        yield '\n'.join(chunk)
+
+
+async def send_chunks(
+    message: Message, chunks: AsyncIterable[str], **kwargs
+) -> int:
+    """Answer with chunks in order, straight to the chat.
+
+    Replies skip the bulk delivery queue, so a user never waits behind
+    notifications. The next chunk is pulled only after the previous one
+    was sent, and a failed chunk stops the reply instead of leaving a gap.
+    """
+    sent = 0
+    async for chunk in chunks:
+        await message.answer(chunk, **kwargs)
+        sent += 1
+    return sent
+
+
+def text_length(text: str) -> int:
+    """Length in UTF-16 code units, which Telegram limits are counted in."""
+    return len(text.encode('utf-16-le')) // 2
+
+
+def _cut(line: str, limit: int) -> Iterator[str]:
+    start = 0
+    size = 0
+    for index, char in enumerate(line):
+        width = text_length(char)
+        if size + width > limit:
+            yield line[start:index]
+            start, size = index, 0
+        size += width
+    yield line[start:]
@@ -0,0 +1,50 @@
+from collections.abc import AsyncIterator
+
+from bot.models import Plant, PlantSummary
+from bot.utils.cache import TTLCache
+from config import config
+
+
+class PlantSummaries:
+    """Per-user plant summaries kept between list requests.
+
+    Handlers that change a plant invalidate its owner, so lists only go
+    to Mongo once per conversation. Background jobs rely on the TTL.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        """PlantSummaries initialization."""
+        self.cache = TTLCache(maxsize, ttl)
+
+    async def get(self, user_id: int) -> list[PlantSummary]:
+        """Receive user plant summaries ordered by id."""
+        summaries = self.cache.get(user_id)
+        if summaries is None:
+            summaries = await Plant.get_summaries(user_id)
+            self.cache.set(user_id, summaries)
+        return summaries
+
+    async def iter(
+        self, user_id: int, batch_size: int
+    ) -> AsyncIterator[PlantSummary]:
+        """Iterate over cached summaries or stream them from a cursor.
+
+        Streaming leaves the cache as is, so a large collection is never
+        held in memory as a whole.
+        """
+        summaries = self.cache.get(user_id)
+        if summaries is not None:
+            for summary in summaries:
+                yield summary
+            return
+        async for summary in Plant.iter_summaries(user_id, batch_size):
+            yield summary
+
+    def invalidate(self, user_id: int):
+        """Drop cached summaries after the user plants changed."""
+        self.cache.pop(user_id)
+
+
+plant_summaries = PlantSummaries(
+    config.plant_cache.size, config.plant_cache.ttl
+)
@@ -1,3 +1,4 @@
+from aiogram import Bot
 from aiogram.types import CallbackQuery, Message, User
 
 
@@ -21,6 +22,13 @@ def require_callback_data(callback: CallbackQuery) -> str:
     return payload
 
 
+def require_bot(message: Message) -> Bot:
+    bot = message.bot
+    if bot is None:
+        raise ValueError('Message is not bound to a bot.')
+    return bot
+
+
 def require_text(message: Message) -> str:
     text = message.text
     if text is None:
@@ -0,0 +1,52 @@
+from logging import getLogger
+
+from bot.log_message import USER_CACHE_WARMED_LOG
+from bot.models import User
+from bot.utils.cache import TTLCache
+from config import config
+
+
+class RegisteredUsers:
+    """Registration lookups with positive and negative caching."""
+
+    def __init__(self, maxsize: int, ttl: float, negative_ttl: float):
+        """RegisteredUsers initialization."""
+        self.cache = TTLCache(maxsize, ttl)
+        self.negative_ttl = negative_ttl
+        self.log = getLogger(__name__)
+
+    async def is_registered(self, user_id: int) -> bool:
+        """Check registration, hitting Mongo only on a cache miss."""
+        registered = self.cache.get(user_id)
+        if registered is None:
+            registered = await User.exists(user_id)
+            self.cache.set(
+                user_id,
+                registered,
+                ttl=None if registered else self.negative_ttl,
+            )
+        return registered
+
+    def remember(self, user_id: int):
+        """Mark the user as registered, replacing a negative entry."""
+        self.cache.set(user_id, True)
+
+    def forget(self, user_id: int):
+        """Drop the cached registration state of the user."""
+        self.cache.pop(user_id)
+
+    async def warm(self) -> int:
+        """Fill the cache with the most recently registered users."""
+        warmed = 0
+        async for user in User.iter_ids(self.cache.maxsize):
+            self.remember(user.user_id)
+            warmed += 1
+        self.log.info(USER_CACHE_WARMED_LOG, warmed)
+        return warmed
+
+
+registered_users = RegisteredUsers(
+    config.user_cache.size,
+    config.user_cache.ttl,
+    config.user_cache.negative_ttl,
+)
@@ -0,0 +1,44 @@
+import asyncio
+import random
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+WorkerFactory = Callable[[], Coroutine[Any, Any, None]]
+
+
+class WorkerPool:
+    """Fixed number of background tasks running the same loop.
+
+    Tasks are created on first use, so queues holding a pool can be built
+    at import time, before an event loop runs.
+    """
+
+    def __init__(self, size: int):
+        """WorkerPool initialization."""
+        self.size = size
+        self._tasks: list[asyncio.Task] = []
+
+    @property
+    def running(self) -> bool:
+        """Whether the worker tasks were started and not stopped."""
+        return bool(self._tasks)
+
+    def start(self, worker: WorkerFactory):
+        """Start the workers unless they are already running."""
+        if not self._tasks:
+            self._tasks = [
+                asyncio.create_task(worker()) for _ in range(self.size)
+            ]
+
+    async def stop(self):
+        """Cancel the workers and wait until they are finished."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+
+def backoff(base: float, attempt: int) -> float:
+    """Exponential retry delay with jitter of up to the same length."""
+    delay = base * 2**attempt
+    return delay + random.uniform(0, delay)
@@ -1,7 +1,22 @@
 from datetime import date
+from types import MappingProxyType
 
 from bot.keyboard import DAYS_OF_WEEK
 from bot.models import FertilizingType, FrequencyType, Plant
+from bot.utils.cache import TTLCache
+from config import config
+
+FREQUENCY_TEXTS = MappingProxyType(FrequencyType.get_text_map())
+FERTILIZING_TEXTS = MappingProxyType(FertilizingType.get_text_map())
+FERTILIZING_UNITS = MappingProxyType(
+    {
+        FertilizingType.days: ('день', 'дня', 'дней'),
+        FertilizingType.weeks: ('неделю', 'недели', 'недель'),
+        FertilizingType.months: ('месяц', 'месяца', 'месяцев'),
+    }
+)
+
+render_cache = TTLCache(config.render_cache.size, config.render_cache.ttl)
 
 
 def format_date(date: date | None) -> str:
@@ -11,12 +26,12 @@ def format_date(date: date | None) -> str:
 
 def localize_frequency_type(type: FrequencyType) -> str:
     """Return text for user."""
-    return FrequencyType.get_text_map().get(type, str(type))
+    return FREQUENCY_TEXTS.get(type, str(type))
 
 
 def localize_fertilizing_type(type: FertilizingType) -> str:
     """Return text for fertilizing."""
-    return FertilizingType.get_text_map().get(type, str(type))
+    return FERTILIZING_TEXTS.get(type, str(type))
 
 
 def format_period(period) -> str:
@@ -63,24 +78,12 @@ def format_fertilizing(fertilizing) -> str:
     parts = []
 
     if fertilizing.frequency:
-        type_map = {
-            FertilizingType.days: (
-                'день'
-                if fertilizing.frequency == 1
-                else 'дня' if fertilizing.frequency < 5 else 'дней'
-            ),
-            FertilizingType.weeks: (
-                'неделю'
-                if fertilizing.frequency == 1
-                else 'недели' if fertilizing.frequency < 5 else 'недель'
-            ),
-            FertilizingType.months: (
-                'месяц'
-                if fertilizing.frequency == 1
-                else 'месяца' if fertilizing.frequency < 5 else 'месяцев'
-            ),
-        }
-        period_name = type_map.get(fertilizing.type, fertilizing.type.value)
+        units = FERTILIZING_UNITS.get(fertilizing.type)
+        period_name = (
+            units[_plural_form(fertilizing.frequency)]
+            if units
+            else fertilizing.type.value
+        )
         parts.append(
             f'<b>Частота:</b> раз в {fertilizing.frequency} {period_name}'
         )
@@ -99,8 +102,28 @@ def format_fertilizing(fertilizing) -> str:
     return '\n'.join(parts)
 
 
+def _plural_form(number: int) -> int:
+    return 0 if number == 1 else 1 if number < 5 else 2
+
+
 def format_plant_message_html(plant: Plant) -> str:
-    """Make HTML-message for Telegram."""
+    """Make HTML-message for Telegram.
+
+    Cards of stored plants are cached by id and update time, so a changed
+    plant is rendered again while repeated views are served from memory.
+    """
+    if plant.id is None:
+        return render_plant_card(plant)
+    key = plant.id, plant.updated_at
+    html = render_cache.get(key)
+    if html is None:
+        html = render_plant_card(plant)
+        render_cache.set(key, html)
+    return html
+
+
+def render_plant_card(plant: Plant) -> str:
+    """Render the plant card without the cache."""
     warm_period = plant.warm_period
     cold_period = plant.cold_period
     fertilizing = plant.fertilizing
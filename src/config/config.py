@@ -1,4 +1,5 @@
 from pathlib import Path
+from typing import Literal
 
 import yaml
 from pydantic import BaseModel, Field, SecretStr
@@ -14,6 +15,7 @@ class ServiceSettings(BaseModel):
     webhook_path: str
     base_webhook_url: str
     page_size: int
+    list_batch_size: int
 
 
 class StorageS3(BaseModel):
@@ -21,6 +23,91 @@ class StorageS3(BaseModel):
 
     bucket: str
     endpoint_url: str
+    pool_size: int
+    connect_timeout: float
+    read_timeout: float
+    part_size: int
+    max_transfers: int
+
+
+class ImageSettings(BaseModel):
+    """Photo normalization settings."""
+
+    enabled: bool
+    workers: int
+    format: Literal['WEBP', 'JPEG']
+    max_side: int
+    max_bytes: int
+    quality: int
+    thumbnail_side: int
+
+
+class NotificationSettings(BaseModel):
+    """Notification fan-out settings."""
+
+    batch_size: int
+    workers: int
+    digest: bool
+    digest_size: int
+
+
+class OverdueSettings(BaseModel):
+    """Escalation policy for unacknowledged watering reminders."""
+
+    reminders: list[int]
+    reschedule_after: int
+
+
+class CacheSettings(BaseModel):
+    """In-process cache settings."""
+
+    size: int
+    ttl: float
+
+
+class UserCacheSettings(CacheSettings):
+    """Registered-user cache settings."""
+
+    negative_ttl: float
+    warm: bool
+
+
+class FSMSettings(BaseModel):
+    """Conversation state storage settings."""
+
+    idle_ttl: int
+
+
+class IngestionSettings(BaseModel):
+    """Background photo ingestion settings."""
+
+    workers: int
+    queue_size: int
+    max_retries: int
+    retry_backoff: float
+    record_ttl: int
+    drain_timeout: float
+
+
+class SchedulerSettings(BaseModel):
+    """Scheduler settings."""
+
+    hour: int
+    minute: int
+    misfire_grace_time: int
+    lease_ttl: int
+    lease_renew_interval: int
+
+
+class DeliverySettings(BaseModel):
+    """Outbound Telegram delivery settings."""
+
+    rate: float
+    per_chat_interval: float
+    max_retries: int
+    retry_backoff: float
+    workers: int
+    queue_size: int
 
 
 class MongoSettings(BaseModel):
@@ -62,6 +149,16 @@ class AppConfig(BaseSettings):
     service: ServiceSettings
     mongodb: MongoSettings
     storage: StorageS3
+    images: ImageSettings
+    ingestion: IngestionSettings
+    scheduler: SchedulerSettings
+    notifications: NotificationSettings
+    overdue: OverdueSettings
+    delivery: DeliverySettings
+    user_cache: UserCacheSettings
+    plant_cache: CacheSettings
+    render_cache: CacheSettings
+    fsm: FSMSettings
     secrets: Secrets
 
     model_config = SettingsConfigDict(
@@ -3,9 +3,32 @@ import asyncio
 import pytest
 import pytest_asyncio
 from beanie import init_beanie
+from mongomock.collection import BulkOperationBuilder
 from mongomock_motor import AsyncMongoMockClient
 
-from bot.models import Plant, User
+from bot.models import (
+    FSMRecord,
+    JobCheckpoint,
+    NotificationOutbox,
+    PhotoUpload,
+    Plant,
+    SchedulerLease,
+    StoredPhoto,
+    User,
+)
+from bot.utils import plant_summaries, registered_users
+from bot.view import render_cache
+
+DOCUMENT_MODELS = (
+    User,
+    Plant,
+    JobCheckpoint,
+    SchedulerLease,
+    NotificationOutbox,
+    FSMRecord,
+    PhotoUpload,
+    StoredPhoto,
+)
 
 
 @pytest.fixture(scope='session')
@@ -15,12 +38,31 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(scope='session', autouse=True)
+def mongomock_bulk_sort_compat():
+    """Let mongomock bulk builders accept the pymongo 4.11+ sort argument."""
+    builder = BulkOperationBuilder
+    add_update, add_replace = builder.add_update, builder.add_replace
+
+    def _without_sort(method):
+        def wrapper(self, *args, sort=None, **kwargs):
+            return method(self, *args, **kwargs)
+
+        return wrapper
+
+    builder.add_update = _without_sort(add_update)
+    builder.add_replace = _without_sort(add_replace)
+    yield
+    builder.add_update = add_update
+    builder.add_replace = add_replace
+
+
 @pytest_asyncio.fixture(scope='session')
 async def beanie_client():
     client = AsyncMongoMockClient()
     await init_beanie(
         database=client['plants_bot_tests'],
-        document_models=[User, Plant],
+        document_models=list(DOCUMENT_MODELS),
     )
     yield client
     client.close()
@@ -28,6 +70,9 @@ async def beanie_client():
 
 @pytest_asyncio.fixture(autouse=True)
 async def clean_db(beanie_client):
-    await Plant.delete_all()
-    await User.delete_all()
+    for model in DOCUMENT_MODELS:
+        await model.delete_all()
+    registered_users.cache.clear()
+    plant_summaries.cache.clear()
+    render_cache.clear()
     yield
@@ -59,17 +59,20 @@ async def test_process_description_and_photo(monkeypatch):
 
     photo = SimpleNamespace(file_id='file123')
     photo_message = FakeMessage(photo=[photo])
-    async def _fake_upload(*args, **kwargs):
-        return 's3/key'
+    submitted = []
+
+    async def _fake_submit(bot, user_id, file_id):
+        submitted.append(file_id)
 
     monkeypatch.setattr(
-        add_plant.storage_service,
-        'upload_telegram_file',
-        _fake_upload,
+        add_plant.photo_ingestion,
+        'submit',
+        _fake_submit,
     )
     await add_plant.process_plant_photo(photo_message, state)
+    assert submitted == ['file123']
     assert state.data['image'] == 'file123'
-    assert state.data['storage_key'] == 's3/key'
+    assert 'storage_key' not in state.data
     assert await state.get_state() == AddPlant.warm_start.state
 
 
@@ -175,6 +178,40 @@ async def test_process_fertilizing_interval_validation(monkeypatch):
     assert plants and plants[0].name == 'Orchid'
 
 
+@pytest.mark.asyncio
+async def test_taken_name_is_asked_again_before_saving():
+    user = make_user(user_id=98)
+    state = FakeFSMContext()
+    await state.update_data(
+        {
+            'name': 'Orchid',
+            'warm_start': {'day': 1, 'month': 1},
+            'warm_end': {'day': 2, 'month': 1},
+            'warm_freq_type': 'weekly',
+            'warm_freq_day': 0,
+            'cold_freq_type': 'monthly',
+            'cold_freq_day_of_month': 15,
+            'fertilizing_start': {'day': 1, 'month': 1},
+            'fertilizing_end': {'day': 2, 'month': 1},
+            'fertilizing_frequency_type': 'days',
+        }
+    )
+    await Plant(user_id=user.id, name='Orchid').insert()
+
+    interval = FakeMessage(user=user, text='3')
+    await add_plant.process_fertilizing_interval(interval, state)
+
+    assert add_const.NOT_UNIQUE_NAME_MSG in interval.answers[-1][0]
+    assert await state.get_state() == AddPlant.name.state
+
+    rename = FakeMessage(user=user, text='Orchid 2')
+    await add_plant.process_plant_name(rename, state)
+
+    assert await state.get_state() is None
+    stored = await Plant.find_one(Plant.name == 'Orchid 2')
+    assert stored.fertilizing.frequency == 3
+
+
 @pytest.mark.asyncio
 async def test_process_plant_photo_requires_photo():
     state = FakeFSMContext()
@@ -5,12 +5,11 @@ from types import SimpleNamespace
 from typing import Any
 
 import pytest
+from beanie import PydanticObjectId
 
-from bot.callback import Action, ChoicePlantCallback
+from bot.callback import Action, ChoicePlantCallback, pack_id
 from bot.constants import check_plant
 from bot.handlers.check_plant import (
-    CURRENT_PAGE_KEY,
-    PAGES_KEY,
     cancel_handler,
     check_one_callback,
     cmd_check_one,
@@ -19,6 +18,7 @@ from bot.handlers.check_plant import (
 )
 from bot.models import Plant
 from bot.states import PlantInfo
+from bot.utils.pagination import CURSOR_KEY
 from config import config
 
 
@@ -103,8 +103,8 @@ async def test_cmd_check_one_with_plants(monkeypatch):
     await cmd_check_one(message, state)
 
     assert state.state == PlantInfo.name
-    assert PAGES_KEY in state.data
-    assert message.answers
+    assert state.data[CURSOR_KEY]['page'] == 0
+    assert '1 / 2' in message.answers[-1]
 
 
 @pytest.mark.asyncio
@@ -112,23 +112,31 @@ async def test_prev_and_next_handlers(monkeypatch):
     monkeypatch.setattr(config.service, 'page_size', 1, raising=False)
     user_id = 333
     await create_plants(user_id, ['Monstera', 'Pilea'])
-    ids = await Plant.get_all_ids(user_id)
-    pages = [[ids[0]], [ids[1]]]
     state = FakeFSMContext()
-    await state.update_data({PAGES_KEY: pages, CURRENT_PAGE_KEY: 1})
     message = FakeMessage(user_id)
     callback = FakeCallback(user_id, message)
     monkeypatch.setattr(
-        'bot.handlers.check_plant.require_message',
+        'bot.utils.pagination.require_message',
         lambda _: message,
     )
+    await cmd_check_one(message, state)
 
-    await prev_handler(callback, state)
-    assert state.data[CURRENT_PAGE_KEY] == 0
-    assert message.edited_markup
+    await next_handler(callback, state)
+    assert state.data[CURSOR_KEY]['page'] == 1
+    assert [
+        button.text
+        for row in message.edited_markup[-1].inline_keyboard
+        for button in row
+    ][:2] == ['Pilea', '⬅️ Назад']
 
     await next_handler(callback, state)
-    assert state.data[CURRENT_PAGE_KEY] == 1
+    assert state.data[CURSOR_KEY]['page'] == 1
+    assert len(message.edited_markup) == 1
+
+    await prev_handler(callback, state)
+    assert state.data[CURSOR_KEY]['page'] == 0
+    keyboard = message.edited_markup[-1].inline_keyboard
+    assert keyboard[0][0].text == 'Monstera'
 
 
 @pytest.mark.asyncio
@@ -159,7 +167,10 @@ async def test_check_one_callback_success(monkeypatch):
         lambda _: message,
     )
 
-    callback_data = ChoicePlantCallback(action=Action.check, name='Fern')
+    plant = await Plant.find_one(Plant.name == 'Fern')
+    callback_data = ChoicePlantCallback(
+        action=Action.check, idx=pack_id(plant.id)
+    )
     await check_one_callback(callback, callback_data, state)
 
     assert message.edited_text
@@ -177,8 +188,11 @@ async def test_check_one_callback_not_found(monkeypatch):
         lambda _: message,
     )
 
-    callback_data = ChoicePlantCallback(action=Action.check, name='Unknown')
-    await check_one_callback(callback, callback_data, state)
+    foreign = Plant(user_id=777, name='Foreign')
+    await foreign.insert()
+    for idx in (pack_id(foreign.id), pack_id(PydanticObjectId()), 'bad'):
+        callback_data = ChoicePlantCallback(action=Action.check, idx=idx)
+        await check_one_callback(callback, callback_data, state)
 
-    expected = check_plant.PLANT_NOT_FOUND_MESSAGE.format(plant_name='Unknown')
-    assert expected in message.answers[-1]
+        assert message.answers[-1] == check_plant.PLANT_NOT_FOUND_MESSAGE
+    assert not message.edited_text
@@ -7,6 +7,7 @@ import pytest
 
 from bot.handlers.check_plants import cmd_check_all
 from bot.models import Plant
+from bot.utils.streaming import MESSAGE_LIMIT, text_length
 
 
 class FakeMessage:
@@ -51,3 +52,21 @@ async def test_cmd_check_all_lists_plants():
     text, _ = message.answers[0]
     assert '1. Monstera' in text
     assert '2. Ficus' in text
+
+
+@pytest.mark.asyncio
+async def test_cmd_check_all_splits_long_lists():
+    message = FakeMessage(user_id=789)
+    padding = 'x' * 40
+    for index in range(120):
+        number = str(index).zfill(3)
+        name = f'Plant {number} {padding}'
+        await Plant(user_id=789, name=name).insert()
+
+    await cmd_check_all(message)
+
+    texts = [text for text, _ in message.answers]
+    assert len(texts) > 1
+    assert all(text_length(text) <= MESSAGE_LIMIT for text in texts)
+    joined = '\n'.join(texts)
+    assert joined.index('1. Plant 000') < joined.index('120. Plant 119')
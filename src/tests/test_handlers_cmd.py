@@ -17,6 +17,7 @@ from bot.handlers.cmd import (
 )
 from bot.models import User
 from bot.states import AddPlant
+from bot.utils import registered_users
 from tests.fakes import FakeFSMContext, FakeMessage, make_user
 
 
@@ -30,6 +31,7 @@ async def test_command_start_handler_creates_user():
     stored = await User.find_one(User.user_id == user.id)
     assert stored is not None
     assert 'Привет' in message.answers[-1][0]
+    assert registered_users.cache.get(user.id) is True
 
 
 @pytest.mark.asyncio
@@ -99,8 +101,9 @@ async def test_skip_handler_fertilizing_start(monkeypatch):
     async def fake_save_plant(plant_data, is_fert):
         called['data'] = plant_data
         called['is_fert'] = is_fert
+        return True
 
-    monkeypatch.setattr('bot.handlers.cmd.save_plant', fake_save_plant)
+    monkeypatch.setattr('bot.utils.handlers.save_plant', fake_save_plant)
 
     user = make_user(user_id=202)
     message = FakeMessage(user)
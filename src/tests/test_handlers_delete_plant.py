@@ -5,11 +5,9 @@ from datetime import date
 
 import pytest
 
-from bot.callback import Action, ChoicePlantCallback
+from bot.callback import Action, ChoicePlantCallback, pack_id
 from bot.constants import NO_PLANTS_MSG, PLANT_DELETED_MESSAGE
 from bot.handlers.delete_plant import (
-    CURRENT_PAGE_KEY,
-    PAGES_KEY,
     cancel_handler,
     cmd_delete_good,
     delete_handler,
@@ -18,6 +16,8 @@ from bot.handlers.delete_plant import (
 )
 from bot.models import Plant
 from bot.states import DeletePlant
+from bot.utils import plant_summaries
+from bot.utils.pagination import CURSOR_KEY
 from config import config
 from tests.fakes import FakeCallback, FakeFSMContext, FakeMessage, make_user
 
@@ -55,7 +55,7 @@ async def test_cmd_delete_good_with_plants(monkeypatch):
     await cmd_delete_good(message, state)
 
     assert await state.get_state() == DeletePlant.name.state
-    assert PAGES_KEY in state.data
+    assert state.data[CURSOR_KEY]['page'] == 0
     assert '1' in message.answers[-1][0]
 
 
@@ -64,20 +64,23 @@ async def test_prev_and_next_handlers(monkeypatch):
     monkeypatch.setattr(config.service, 'page_size', 1, raising=False)
     user = make_user(user_id=12)
     await create_plants(user.id, ['Rose', 'Tulip'])
-    ids = await Plant.get_all_ids(user.id)
-    pages = [[ids[0]], [ids[1]]]
     state = FakeFSMContext()
-    await state.update_data({PAGES_KEY: pages, CURRENT_PAGE_KEY: 1})
     message = FakeMessage(user)
     callback = FakeCallback(message)
-    monkeypatch.setattr(delete_module, 'require_message', lambda _: message)
-
-    await prev_handler(callback, state)
-    assert state.data[CURRENT_PAGE_KEY] == 0
-    assert message.edited_markup
+    monkeypatch.setattr(
+        'bot.utils.pagination.require_message', lambda _: message
+    )
+    await cmd_delete_good(message, state)
 
     await next_handler(callback, state)
-    assert state.data[CURRENT_PAGE_KEY] == 1
+    assert state.data[CURSOR_KEY]['page'] == 1
+    keyboard = message.edited_markup[-1].inline_keyboard
+    assert keyboard[0][0].text == 'Tulip'
+
+    await prev_handler(callback, state)
+    assert state.data[CURSOR_KEY]['page'] == 0
+    keyboard = message.edited_markup[-1].inline_keyboard
+    assert keyboard[0][0].text == 'Rose'
 
 
 @pytest.mark.asyncio
@@ -102,7 +105,11 @@ async def test_delete_handler(monkeypatch):
     state = FakeFSMContext()
     monkeypatch.setattr(delete_module, 'require_message', lambda _: message)
 
-    callback_data = ChoicePlantCallback(action=Action.delete, name='Lavender')
+    plant = await Plant.find_one(Plant.name == 'Lavender')
+    callback_data = ChoicePlantCallback(
+        action=Action.delete, idx=pack_id(plant.id)
+    )
+    await cmd_delete_good(message, state)
     await delete_handler(callback, callback_data, state)
 
     assert (
@@ -110,3 +117,49 @@ async def test_delete_handler(monkeypatch):
         in message.answers[-1][0]
     )
     assert await Plant.find_one(Plant.name == 'Lavender') is None
+    assert await plant_summaries.get(user.id) == []
+
+
+@pytest.mark.asyncio
+async def test_delete_handler_releases_photo(monkeypatch):
+    user = make_user(user_id=16)
+    plant = Plant(user_id=user.id, name='Fern', storage_key='photos/a.webp')
+    await plant.insert()
+    message = FakeMessage(user)
+    released = []
+
+    async def _release(storage_key):
+        released.append(storage_key)
+
+    monkeypatch.setattr(delete_module, 'require_message', lambda _: message)
+    monkeypatch.setattr(
+        delete_module.storage_service, 'release_image', _release
+    )
+    callback_data = ChoicePlantCallback(
+        action=Action.delete, idx=pack_id(plant.id)
+    )
+
+    state = FakeFSMContext()
+
+    await delete_handler(FakeCallback(message), callback_data, state)
+
+    assert released == ['photos/a.webp']
+
+
+@pytest.mark.asyncio
+async def test_delete_handler_checks_owner(monkeypatch):
+    owner = make_user(user_id=15)
+    await create_plants(owner.id, ['Basil'])
+    plant = await Plant.find_one(Plant.name == 'Basil')
+    message = FakeMessage(make_user(user_id=16))
+    callback = FakeCallback(message)
+    state = FakeFSMContext()
+    monkeypatch.setattr(delete_module, 'require_message', lambda _: message)
+
+    callback_data = ChoicePlantCallback(
+        action=Action.delete, idx=pack_id(plant.id)
+    )
+    await delete_handler(callback, callback_data, state)
+
+    assert await Plant.get(plant.id) is not None
+    assert callback.answers
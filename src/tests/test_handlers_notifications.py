@@ -1,12 +1,18 @@
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, timedelta
+from types import SimpleNamespace
 
 import pytest
 from beanie import PydanticObjectId
 
-from bot.handlers.notifications import handle_watering_callback
-from bot.keyboard import PlantActionCallback
+from bot.callback import DigestCallback, pack_id
+from bot.constants import WATER_ALL_BUTTON
+from bot.handlers.notifications import (
+    handle_digest_callback,
+    handle_watering_callback,
+)
+from bot.keyboard import PlantActionCallback, digest_kb
 from bot.models import (
     FertilizingPeriod,
     FertilizingType,
@@ -16,19 +22,32 @@ from bot.models import (
     WateringPeriod,
     WateringSchedule,
 )
+from bot.utils import plant_summaries
 
 
 class FakeCallbackMessage:
-    def __init__(self) -> None:
+    def __init__(self, reply_markup=None) -> None:
         self.captions: list[tuple[str, object]] = []
+        self.reply_markup = reply_markup
+        self.edited_markup: list[object] = []
 
     async def edit_caption(self, caption: str, reply_markup=None):
         self.captions.append((caption, reply_markup))
 
+    async def edit_reply_markup(self, reply_markup=None):
+        self.edited_markup.append(reply_markup)
+
 
 class FakeCallback:
-    def __init__(self, message: FakeCallbackMessage):
+    def __init__(
+        self,
+        message: FakeCallbackMessage,
+        user_id: int = 999,
+        data: str | None = None,
+    ):
         self.message = message
+        self.from_user = SimpleNamespace(id=user_id)
+        self.data = data
         self.answers: list[dict[str, object]] = []
 
     async def answer(self, text: str = '', show_alert: bool = False):
@@ -71,17 +90,22 @@ async def create_detailed_plant(name: str) -> Plant:
 @pytest.mark.asyncio
 async def test_handle_watering_callback_updates_dates(monkeypatch):
     plant = await create_detailed_plant('Calathea')
-    callback_data = PlantActionCallback(idx=str(plant.id), is_fertilized=False)
+    callback_data = PlantActionCallback(
+        idx=pack_id(plant.id), is_fertilized=False
+    )
     fake_message = FakeCallbackMessage()
     callback = FakeCallback(fake_message)
     monkeypatch.setattr(
         'bot.handlers.notifications.require_message',
         lambda _: fake_message,
     )
+    await plant_summaries.get(plant.user_id)
 
     await handle_watering_callback(callback, callback_data)
 
     updated = await Plant.get(plant.id)
+    summary = (await plant_summaries.get(plant.user_id))[0]
+    assert summary.last_watered_at == date.today()
     assert updated.last_watered_at == date.today()
     assert updated.next_watering_at and updated.next_watering_at > date.today()
     assert fake_message.captions[0][0] == 'Растение Calathea полито'
@@ -91,7 +115,7 @@ async def test_handle_watering_callback_updates_dates(monkeypatch):
 @pytest.mark.asyncio
 async def test_handle_watering_callback_handles_missing_plant(monkeypatch):
     callback_data = PlantActionCallback(
-        idx=str(PydanticObjectId()),
+        idx=pack_id(PydanticObjectId()),
         is_fertilized=False,
     )
     fake_message = FakeCallbackMessage()
@@ -111,7 +135,9 @@ async def test_handle_watering_callback_handles_missing_plant(monkeypatch):
 @pytest.mark.asyncio
 async def test_handle_watering_callback_updates_fertilizing(monkeypatch):
     plant = await create_detailed_plant('Philodendron')
-    callback_data = PlantActionCallback(idx=str(plant.id), is_fertilized=True)
+    callback_data = PlantActionCallback(
+        idx=pack_id(plant.id), is_fertilized=True
+    )
     fake_message = FakeCallbackMessage()
     callback = FakeCallback(fake_message)
     monkeypatch.setattr(
@@ -124,3 +150,89 @@ async def test_handle_watering_callback_updates_fertilizing(monkeypatch):
     updated = await Plant.get(plant.id)
     assert updated.last_fertilized_at == date.today()
     assert updated.next_fertilizing_at and updated.next_fertilizing_at > date.today()
+
+
+async def create_due_plants(names: list[str]) -> list[Plant]:
+    plants = []
+    for name in names:
+        plant = await create_detailed_plant(name)
+        plant.next_watering_at = date.today() - timedelta(days=1)
+        plant.next_fertilizing_at = date.today() + timedelta(days=30)
+        await plant.save()
+        plants.append(plant)
+    return plants
+
+
+@pytest.mark.asyncio
+async def test_handle_digest_callback_waters_one_plant(monkeypatch):
+    first, second = await create_due_plants(['Aloe', 'Ficus'])
+    callback_data = DigestCallback(idx=pack_id(first.id), is_fertilized=False)
+    fake_message = FakeCallbackMessage(digest_kb([first, second]))
+    callback = FakeCallback(fake_message, data=callback_data.pack())
+    monkeypatch.setattr(
+        'bot.handlers.notifications.require_message',
+        lambda _: fake_message,
+    )
+
+    await handle_digest_callback(callback, callback_data)
+
+    updated = await Plant.get(first.id)
+    assert updated.last_watered_at == date.today()
+    remaining = fake_message.edited_markup[-1].inline_keyboard
+    texts = [button.text for row in remaining for button in row]
+    assert texts == ['💧 Ficus', WATER_ALL_BUTTON]
+
+
+@pytest.mark.asyncio
+async def test_handle_digest_callback_removes_keyboard_after_last(
+    monkeypatch,
+):
+    plant = (await create_due_plants(['Aloe']))[0]
+    callback_data = DigestCallback(idx=pack_id(plant.id), is_fertilized=False)
+    fake_message = FakeCallbackMessage(digest_kb([plant]))
+    callback = FakeCallback(fake_message, data=callback_data.pack())
+    monkeypatch.setattr(
+        'bot.handlers.notifications.require_message',
+        lambda _: fake_message,
+    )
+
+    await handle_digest_callback(callback, callback_data)
+
+    assert fake_message.edited_markup == [None]
+
+
+@pytest.mark.asyncio
+async def test_handle_digest_callback_rejects_foreign_plant(monkeypatch):
+    plant = (await create_due_plants(['Aloe']))[0]
+    callback_data = DigestCallback(idx=pack_id(plant.id), is_fertilized=False)
+    fake_message = FakeCallbackMessage()
+    callback = FakeCallback(fake_message, user_id=1)
+    monkeypatch.setattr(
+        'bot.handlers.notifications.require_message',
+        lambda _: fake_message,
+    )
+
+    await handle_digest_callback(callback, callback_data)
+
+    assert callback.answers[-1]['show_alert'] is True
+    assert (await Plant.get(plant.id)).last_watered_at != date.today()
+
+
+@pytest.mark.asyncio
+async def test_handle_digest_callback_waters_all_due(monkeypatch):
+    plants = await create_due_plants(['Aloe', 'Ficus'])
+    callback_data = DigestCallback(idx=None, is_fertilized=True)
+    fake_message = FakeCallbackMessage(digest_kb(plants))
+    callback = FakeCallback(fake_message)
+    monkeypatch.setattr(
+        'bot.handlers.notifications.require_message',
+        lambda _: fake_message,
+    )
+
+    await handle_digest_callback(callback, callback_data)
+
+    for plant in plants:
+        updated = await Plant.get(plant.id)
+        assert updated.last_watered_at == date.today()
+    assert fake_message.edited_markup == [None]
+    assert callback.answers[-1]['text'] == 'Полито растений: 2'
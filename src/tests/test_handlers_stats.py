@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import pytest
+
+from bot.handlers.stats import explain_handler, stats_handler
+from tests.fakes import FakeMessage
+
+
+@pytest.mark.asyncio
+async def test_stats_handler_reports_delivery_queue():
+    message = FakeMessage()
+
+    await stats_handler(message)
+
+    assert 'Очередь отправки: 0' in message.answers[-1][0]
+    assert 'Кэш rules' in message.answers[-1][0]
+    assert 'Кэш users' in message.answers[-1][0]
+
+
+@pytest.mark.asyncio
+async def test_explain_handler_flags_collection_scans(monkeypatch):
+    async def fake_explain(user_id):
+        return {
+            'due_today': 'FETCH <- IXSCAN(due_watering)',
+            'user_plants': 'COLLSCAN',
+        }
+
+    monkeypatch.setattr('bot.handlers.stats.explain_hot_queries', fake_explain)
+    message = FakeMessage()
+
+    await explain_handler(message)
+
+    lines = message.answers[-1][0].splitlines()
+    assert lines == [
+        '🔎 due_today: FETCH <- IXSCAN(due_watering)',
+        '⚠️ user_plants: COLLSCAN',
+    ]
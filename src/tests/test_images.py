@@ -0,0 +1,56 @@
+from io import BytesIO
+
+from PIL import Image
+
+from bot.images import ImageProfile, normalize_image, thumbnail_key
+
+PROFILE = ImageProfile(
+    format='WEBP',
+    max_side=400,
+    max_bytes=50_000,
+    quality=80,
+    thumbnail_side=100,
+)
+ORIENTATION = Image.ExifTags.Base.Orientation
+ROTATED_RIGHT = 6
+
+
+def make_photo(size=(800, 600), image_format='JPEG') -> bytes:
+    image = Image.effect_noise(size, 64).convert('RGB')
+    exif = Image.Exif()
+    exif[ORIENTATION] = ROTATED_RIGHT
+    buffer = BytesIO()
+    image.save(buffer, format=image_format, exif=exif.tobytes())
+    return buffer.getvalue()
+
+
+def test_normalize_image_caps_size_and_strips_metadata():
+    normalized = normalize_image(make_photo(), PROFILE)
+
+    with Image.open(BytesIO(normalized.image)) as image:
+        assert image.format == 'WEBP'
+        assert image.size == (300, 400)
+        assert not image.getexif()
+    assert len(normalized.image) <= PROFILE.max_bytes
+
+
+def test_normalize_image_builds_thumbnail():
+    normalized = normalize_image(make_photo(), PROFILE)
+
+    with Image.open(BytesIO(normalized.thumbnail)) as thumbnail:
+        assert max(thumbnail.size) == PROFILE.thumbnail_side
+
+
+def test_normalize_image_flattens_alpha_for_jpeg():
+    profile = ImageProfile('JPEG', 400, 50_000, 80, 100)
+    buffer = BytesIO()
+    Image.new('RGBA', (10, 10), (0, 0, 0, 0)).save(buffer, format='PNG')
+
+    normalized = normalize_image(buffer.getvalue(), profile)
+
+    with Image.open(BytesIO(normalized.image)) as image:
+        assert image.mode == 'RGB'
+
+
+def test_thumbnail_key_keeps_extension():
+    assert thumbnail_key('1/photo.webp') == '1/photo.thumb.webp'
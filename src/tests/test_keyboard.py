@@ -3,11 +3,26 @@ from __future__ import annotations
 from types import SimpleNamespace
 
 from aiogram.types import InlineKeyboardMarkup, ReplyKeyboardMarkup
+from beanie import PydanticObjectId
 
-from bot.callback import Action
-from bot.constants import ADD_PLANT, BACK, CANCEL, SKIP
+from bot.callback import (
+    Action,
+    ChoicePlantCallback,
+    DigestCallback,
+    pack_id,
+    unpack_id,
+)
+from bot.constants import (
+    ADD_PLANT,
+    BACK,
+    CANCEL,
+    SKIP,
+    WATER_ALL_BUTTON,
+    WATER_FERTILIZE_ALL_BUTTON,
+)
 from bot.keyboard import (
     days_kb,
+    digest_kb,
     frequency_type_kb,
     get_cancel_kb,
     get_keyboard_with_navigation,
@@ -58,9 +73,52 @@ def test_watering_kb_has_optional_button():
 
 
 def test_get_keyboard_with_navigation():
-    plants = [SimpleNamespace(name='Plant1'), SimpleNamespace(name='Plant2')]
+    plants = [
+        SimpleNamespace(id=PydanticObjectId(), name='Plant1'),
+        SimpleNamespace(id=PydanticObjectId(), name='Plant2'),
+    ]
     kb = get_keyboard_with_navigation(
-        plants, page=0, total_pages=2, action_for_item=Action.delete
+        plants, has_prev=False, has_next=True, action_for_item=Action.delete
     )
     texts = [btn.text for row in kb.inline_keyboard for btn in row]
     assert 'Plant1' in texts and 'Plant2' in texts
+
+
+def test_plant_id_callback_round_trip():
+    idx = PydanticObjectId()
+    packed = ChoicePlantCallback(action=Action.delete, idx=pack_id(idx)).pack()
+
+    unpacked = ChoicePlantCallback.unpack(packed)
+
+    assert len(pack_id(idx)) == 16
+    assert len(packed.encode()) <= 64
+    assert unpack_id(unpacked.idx) == idx
+    assert unpack_id(str(idx)) == idx
+    assert unpack_id('not an id') is None
+    assert unpack_id(None) is None
+
+
+class DigestPlant:
+    def __init__(self, fertilizing: bool):
+        self.id = PydanticObjectId()
+        self.name = 'Fern'
+        self.fertilizing = fertilizing
+
+    def sync_watering_and_fertilizing(self) -> bool:
+        return self.fertilizing
+
+
+def test_digest_kb_waters_all_without_fertilizing():
+    kb = digest_kb([DigestPlant(fertilizing=False)])
+
+    water_all = kb.inline_keyboard[-1][0]
+    assert water_all.text == WATER_ALL_BUTTON
+    callback = DigestCallback.unpack(water_all.callback_data)
+    assert callback.is_fertilized is False
+
+
+def test_digest_kb_offers_fertilizing_when_due():
+    kb = digest_kb([DigestPlant(fertilizing=True)])
+
+    texts = [row[0].text for row in kb.inline_keyboard[-2:]]
+    assert texts == [WATER_ALL_BUTTON, WATER_FERTILIZE_ALL_BUTTON]
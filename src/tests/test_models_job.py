@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from bot.models import JobCheckpoint
+
+
+@pytest.mark.asyncio
+async def test_get_last_run_without_checkpoint():
+    assert await JobCheckpoint.get_last_run('missing') is None
+
+
+@pytest.mark.asyncio
+async def test_record_run_upserts_single_checkpoint():
+    first = datetime(2024, 1, 1, 10, tzinfo=timezone.utc)
+    second = first + timedelta(days=1)
+
+    await JobCheckpoint.record_run('job', first)
+    await JobCheckpoint.record_run('job', second)
+
+    assert await JobCheckpoint.find(JobCheckpoint.job_id == 'job').count() == 1
+    assert await JobCheckpoint.get_last_run('job') == second
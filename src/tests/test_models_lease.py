@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from bot.models import SchedulerLease
+
+
+@pytest.mark.asyncio
+async def test_acquire_free_lease_and_renew():
+    assert await SchedulerLease.acquire('jobs', 'first', 30) is True
+    assert await SchedulerLease.acquire('jobs', 'first', 30) is True
+
+    lease = await SchedulerLease.find_one(SchedulerLease.name == 'jobs')
+    assert lease.owner == 'first'
+
+
+@pytest.mark.asyncio
+async def test_acquire_held_lease_fails():
+    await SchedulerLease.acquire('jobs', 'first', 30)
+
+    assert await SchedulerLease.acquire('jobs', 'second', 30) is False
+
+
+@pytest.mark.asyncio
+async def test_acquire_expired_lease_takes_over():
+    await SchedulerLease(
+        name='jobs',
+        owner='dead',
+        expires_at=datetime.now(timezone.utc) - timedelta(seconds=1),
+    ).insert()
+
+    assert await SchedulerLease.acquire('jobs', 'second', 30) is True
+
+    lease = await SchedulerLease.find_one(SchedulerLease.name == 'jobs')
+    assert lease.owner == 'second'
+
+
+@pytest.mark.asyncio
+async def test_release_frees_lease():
+    await SchedulerLease.acquire('jobs', 'first', 30)
+
+    await SchedulerLease.release('jobs', 'first')
+
+    assert await SchedulerLease.acquire('jobs', 'second', 30) is True
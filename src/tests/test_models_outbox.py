@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from beanie import PydanticObjectId
+
+from bot.models import NotificationOutbox, OutboxStatus
+
+TODAY = date.today()
+
+
+def build_items(count: int) -> list[SimpleNamespace]:
+    return [
+        SimpleNamespace(id=PydanticObjectId(), user_id=index)
+        for index in range(count)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_register_claims_plants_once():
+    items = build_items(2)
+
+    assert await NotificationOutbox.register(items, TODAY, 'a') == items
+    assert await NotificationOutbox.register(items, TODAY, 'a') == items
+
+    records = await NotificationOutbox.find_all().to_list()
+    assert len(records) == 2
+    assert {record.status for record in records} == {OutboxStatus.sending}
+    assert {record.owner for record in records} == {'a'}
+
+
+@pytest.mark.asyncio
+async def test_register_skips_sent_plants():
+    items = build_items(3)
+    await NotificationOutbox.register(items, TODAY, 'a')
+    await NotificationOutbox.record(
+        [(items[0].id, True), (items[1].id, False)], TODAY, 'a'
+    )
+
+    pending = await NotificationOutbox.register(items, TODAY, 'b')
+
+    assert pending == items[1:]
+    failed = await NotificationOutbox.find_one(
+        NotificationOutbox.plant_id == items[1].id
+    )
+    assert failed.owner == 'b'
+    assert failed.attempts == 1
+
+
+@pytest.mark.asyncio
+async def test_register_resumes_claims_of_a_dead_run():
+    items = build_items(2)
+    await NotificationOutbox.register(items, TODAY, 'a')
+
+    assert await NotificationOutbox.register(items, TODAY, 'b') == items
+    await NotificationOutbox.record([(items[0].id, True)], TODAY, 'a')
+
+    record = await NotificationOutbox.find_one()
+    assert record.status == OutboxStatus.sending
+
+
+@pytest.mark.asyncio
+async def test_sent_status_is_per_due_date():
+    items = build_items(1)
+    await NotificationOutbox.register(items, date(2024, 1, 1), 'a')
+    await NotificationOutbox.record(
+        [(items[0].id, True)], date(2024, 1, 1), 'a'
+    )
+
+    assert await NotificationOutbox.register(items, TODAY, 'a') == items
+
+
+@pytest.mark.asyncio
+async def test_empty_calls_do_nothing():
+    assert not await NotificationOutbox.register([], TODAY, 'a')
+    await NotificationOutbox.record([], TODAY, 'a')
+
+    assert await NotificationOutbox.count() == 0
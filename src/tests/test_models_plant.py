@@ -1,10 +1,12 @@
 from __future__ import annotations
 
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from types import SimpleNamespace
 
 import pytest
 
+import bot.models.plant as plant_module
+from bot.models import PlantNotification, PlantSummary, schedule_cache_info
 from bot.models.plant import (
     FertilizingPeriod,
     FertilizingType,
@@ -78,6 +80,33 @@ def test_build_rrule_monthly():
     assert rule._freq == 1  # MONTHLY
 
 
+def test_build_rrule_reuses_compiled_rule():
+    plant, other = build_plant(), build_plant()
+    start = datetime(2026, 5, 4)
+    schedule = WateringSchedule(type=FrequencyType.weekly, weekday={0, 3})
+    plant_module.compile_rule.cache_clear()
+
+    rule = plant._build_rrule(schedule, start)
+    same = other._build_rrule(schedule.model_copy(deep=True), start)
+
+    assert same is rule
+    assert schedule_cache_info()['rules'].hits == 1
+    assert schedule_cache_info()['rules'].misses == 1
+
+
+def test_next_watering_date_uses_schedule_cache():
+    plant = build_plant()
+    plant.next_watering_date()
+    before = schedule_cache_info()
+
+    build_plant().next_watering_date()
+
+    after = schedule_cache_info()
+    assert after['rules'].hits > before['rules'].hits
+    assert after['periods'].hits > before['periods'].hits
+    assert after['rules'].misses == before['rules'].misses
+
+
 def test_require_watering_schedule_raises():
     with pytest.raises(ValueError):
         _require_watering_schedule(None)
@@ -182,6 +211,151 @@ async def test_find_to_water_today_and_update_hooks():
     assert plant.updated_at is not None
 
 
+@pytest.mark.asyncio
+async def test_iter_to_water_today_projects_notification_fields():
+    plant = Plant(
+        user_id=8,
+        name='Streamed',
+        description='Long description',
+        next_watering_at=date.today(),
+        last_watered_at=date(2024, 1, 1),
+    )
+    await plant.insert()
+    await Plant(
+        user_id=8,
+        name='Later',
+        next_watering_at=date(2099, 1, 1),
+        last_watered_at=date(2024, 1, 1),
+    ).insert()
+
+    result = [item async for item in Plant.iter_to_water_today(1)]
+
+    assert len(result) == 1
+    assert isinstance(result[0], PlantNotification)
+    assert result[0].id == plant.id
+    assert not hasattr(result[0], 'description')
+
+
+@pytest.mark.asyncio
+async def test_iter_overdue_matches_escalation_days():
+    today = date.today()
+    for name, days in (('One', 1), ('Two', 2), ('Three', 3)):
+        await Plant(
+            user_id=9,
+            name=name,
+            next_watering_at=today - timedelta(days=days),
+        ).insert()
+
+    result = [item async for item in Plant.iter_overdue([1, 3], 10)]
+
+    assert sorted(item.name for item in result) == ['One', 'Three']
+    assert {item.overdue_days() for item in result} == {1, 3}
+
+
+@pytest.mark.asyncio
+async def test_reschedule_overdue_moves_schedule_forward():
+    today = date.today()
+    stale = build_plant()
+    stale.name = 'Stale'
+    stale.next_watering_at = today - timedelta(days=20)
+    await stale.insert()
+    recent = build_plant()
+    recent.name = 'Recent'
+    recent.next_watering_at = today - timedelta(days=2)
+    await recent.insert()
+    broken = Plant(
+        user_id=401,
+        name='Broken',
+        warm_period=None,
+        next_watering_at=today - timedelta(days=20),
+    )
+    await broken.insert()
+
+    count = await Plant.reschedule_overdue(today - timedelta(days=10), 1)
+
+    assert count == 1
+    stored = await Plant.get(stale.id)
+    assert stored.next_watering_at > today
+    assert stored.overdue_days() == 0
+    for untouched in (recent, broken):
+        stored = await Plant.get(untouched.id)
+        assert stored.next_watering_at == untouched.next_watering_at
+
+
+@pytest.mark.asyncio
+async def test_acknowledge_watering_sets_only_changed_dates():
+    plant = build_plant()
+    plant.last_watered_at = date.today() - timedelta(days=7)
+    plant.next_watering_at = date.today() - timedelta(days=1)
+    await plant.insert()
+    stale = await Plant.get(plant.id)
+    await Plant.find_one(Plant.id == plant.id).update(
+        {'$set': {'description': 'Edited meanwhile'}}
+    )
+
+    assert await plant.acknowledge_watering(is_fertilized=False) is True
+
+    stored = await Plant.get(plant.id)
+    assert stored.description == 'Edited meanwhile'
+    assert stored.last_watered_at == date.today()
+    assert stored.next_watering_at == plant.next_watering_at
+    assert stored.next_watering_at > date.today()
+    assert stored.last_fertilized_at == plant.last_fertilized_at
+    assert stored.updated_at is not None
+
+    assert await stale.acknowledge_watering(is_fertilized=True) is False
+    stored = await Plant.get(plant.id)
+    assert stored.next_fertilizing_at is None
+
+
+@pytest.mark.asyncio
+async def test_acknowledge_due_waters_plants_in_one_bulk_write(monkeypatch):
+    synced, apart = build_plant(), build_plant()
+    for plant, fertilizing_in in ((synced, 0), (apart, 20)):
+        plant.name = f'Fertilized in {fertilizing_in}'
+        plant.last_watered_at = date.today() - timedelta(days=7)
+        plant.next_watering_at = date.today()
+        plant.last_fertilized_at = date.today() - timedelta(days=30)
+        plant.next_fertilizing_at = date.today() + timedelta(
+            days=fertilizing_in
+        )
+        await plant.insert()
+    await Plant(
+        user_id=402, name='Other', next_watering_at=date.today()
+    ).insert()
+    writes = []
+    collection = Plant.get_pymongo_collection()
+    bulk_write = collection.bulk_write
+
+    async def counting_bulk_write(requests, **kwargs):
+        writes.append(len(requests))
+        return await bulk_write(requests, **kwargs)
+
+    monkeypatch.setattr(collection, 'bulk_write', counting_bulk_write)
+
+    assert await Plant.acknowledge_due(401, fertilize=True) == 2
+    assert await Plant.acknowledge_due(401, fertilize=True) == 0
+
+    assert writes == [2]
+    synced, apart = await Plant.get(synced.id), await Plant.get(apart.id)
+    assert synced.last_watered_at == apart.last_watered_at == date.today()
+    assert synced.next_watering_at > date.today()
+    assert synced.last_fertilized_at == date.today()
+    assert apart.last_fertilized_at < date.today()
+
+
+@pytest.mark.asyncio
+async def test_get_summaries_returns_user_plants_by_id():
+    for name in ('A', 'B', 'C'):
+        await Plant(user_id=31, name=name).insert()
+    await Plant(user_id=32, name='Other').insert()
+
+    summaries = await Plant.get_summaries(31)
+
+    assert [plant.name for plant in summaries] == ['A', 'B', 'C']
+    assert all(isinstance(plant, PlantSummary) for plant in summaries)
+
+
 def test_next_fertilizing_with_invalid_type():
     plant = build_plant()
     plant.fertilizing.type = 'invalid'  # type: ignore[assignment]
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import random
+from datetime import date
+
+import pytest
+
+import bot.models.plant as plant_module
+import bot.models.schedule as schedule_module
+from bot.models import (
+    FertilizingPeriod,
+    FertilizingType,
+    FrequencyType,
+    MonthDay,
+    Plant,
+    WateringPeriod,
+    WateringSchedule,
+)
+from bot.models.schedule import next_fertilizing_dates, next_watering_dates
+
+
+def random_schedule(rng: random.Random) -> WateringSchedule:
+    schedule_type = rng.choice(list(FrequencyType))
+    if schedule_type == FrequencyType.monthly:
+        return WateringSchedule(
+            type=schedule_type, monthday=rng.choice([None, 1, 15, 29, 31])
+        )
+    weekdays: list[set[int] | int] = [
+        rng.randrange(7),
+        set(rng.sample(range(7), rng.randint(1, 3))),
+    ]
+    return WateringSchedule(type=schedule_type, weekday=rng.choice(weekdays))
+
+
+def random_day(rng: random.Random) -> MonthDay:
+    return MonthDay(day=rng.randint(1, 28), month=rng.randint(1, 12))
+
+
+def random_plant(rng: random.Random) -> Plant:
+    return Plant(
+        user_id=1,
+        name='Random',
+        warm_period=WateringPeriod(
+            start=random_day(rng),
+            end=random_day(rng),
+            schedule=random_schedule(rng),
+        ),
+        cold_period=WateringPeriod(
+            start=random_day(rng),
+            end=random_day(rng),
+            schedule=random_schedule(rng),
+        ),
+        fertilizing=FertilizingPeriod(
+            start=random_day(rng),
+            end=random_day(rng),
+            frequency=rng.randint(1, 6),
+            type=rng.choice(list(FertilizingType)),
+        ),
+    )
+
+
+def scalar(method):
+    try:
+        return method()
+    except ValueError:
+        return None
+
+
+class FrozenDate(date):
+    frozen = date.min
+
+    @classmethod
+    def today(cls):
+        return cls.frozen
+
+
+def freeze_today(monkeypatch, today: date):
+    monkeypatch.setattr(FrozenDate, 'frozen', today)
+    monkeypatch.setattr(plant_module, 'date', FrozenDate)
+    monkeypatch.setattr(schedule_module, 'date', FrozenDate)
+
+
+@pytest.mark.parametrize(
+    'today',
+    [
+        date(2026, 1, 1),
+        date(2026, 2, 28),
+        date(2028, 2, 29),
+        date(2026, 6, 15),
+        date(2026, 12, 31),
+    ],
+)
+def test_batch_dates_match_plant_methods(monkeypatch, today):
+    freeze_today(monkeypatch, today)
+    rng = random.Random(today.toordinal())
+    plants = [random_plant(rng) for _ in range(300)]
+
+    watering = next_watering_dates(plants)
+    fertilizing = next_fertilizing_dates(plants)
+
+    assert watering == [scalar(plant.next_watering_date) for plant in plants]
+    assert fertilizing == [
+        scalar(plant.next_fertilizing_date) for plant in plants
+    ]
+
+
+@pytest.mark.parametrize('today', [date(2026, 1, 15), date(2026, 6, 15)])
+def test_batch_dates_match_plant_with_incomplete_cold_period(
+    monkeypatch, today
+):
+    freeze_today(monkeypatch, today)
+    plant = random_plant(random.Random(0))
+    plant.warm_period = WateringPeriod(
+        start=MonthDay(day=1, month=3),
+        end=MonthDay(day=31, month=10),
+        schedule=WateringSchedule(type=FrequencyType.weekly, weekday=0),
+    )
+    plant.cold_period = WateringPeriod(
+        start=None,
+        end=None,
+        schedule=WateringSchedule(type=FrequencyType.weekly, weekday=0),
+    )
+
+    assert next_watering_dates([plant]) == [None]
+    assert scalar(plant.next_watering_date) is None
+
+
+def test_batch_dates_handle_broken_and_unusual_schedules():
+    period = WateringPeriod(
+        start=MonthDay(day=1, month=1),
+        end=MonthDay(day=31, month=12),
+        schedule=WateringSchedule(type=FrequencyType.weekly, weekday=set()),
+    )
+    unusual = Plant(
+        user_id=1, name='Empty days', warm_period=period, cold_period=period
+    )
+    broken = Plant(
+        user_id=1,
+        name='Broken',
+        warm_period=None,
+        fertilizing=None,
+    )
+
+    watering = next_watering_dates([unusual, broken])
+
+    assert unusual.next_watering_at is None
+    assert watering == [scalar(unusual.next_watering_date), None]
+    assert next_fertilizing_dates([broken]) == [None]
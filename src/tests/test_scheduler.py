@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from datetime import date
+import asyncio
+from datetime import date, datetime, timedelta, timezone
 
 import pytest
 from beanie import PydanticObjectId
@@ -8,11 +9,28 @@ from beanie import PydanticObjectId
 import bot.scheduler as scheduler
 from bot.models import (
     FrequencyType,
+    JobCheckpoint,
     MonthDay,
+    NotificationOutbox,
     Plant,
     WateringPeriod,
     WateringSchedule,
 )
+from bot.utils.delivery import DeliveryQueue
+
+
+@pytest.fixture(autouse=True)
+def fast_delivery(monkeypatch):
+    queue = DeliveryQueue(
+        rate=1000,
+        per_chat_interval=0,
+        max_retries=0,
+        retry_backoff=0,
+        workers=1,
+        queue_size=10,
+    )
+    monkeypatch.setattr(scheduler, 'delivery_queue', queue)
+    return queue
 
 
 class FakeBot:
@@ -25,6 +43,9 @@ class FakeBot:
     async def send_message(self, **kwargs):
         self.sent.append(('message', kwargs))
 
+    async def send_media_group(self, **kwargs):
+        self.sent.append(('media_group', kwargs))
+
 
 @pytest.mark.asyncio
 async def test_send_watering_notification_without_bot():
@@ -68,6 +89,19 @@ async def test_send_watering_notification_message_branch(monkeypatch):
     assert fake_bot.sent[0][0] == 'message'
 
 
+@pytest.mark.asyncio
+async def test_send_watering_notification_overdue_text(monkeypatch):
+    plant = build_plant(has_image=False)
+    plant.next_watering_at = date.today() - timedelta(days=3)
+    fake_bot = FakeBot()
+    scheduler.bot = fake_bot
+    monkeypatch.setattr(scheduler, 'watering_kb', lambda **kwargs: kwargs)
+
+    assert await scheduler.send_watering_notification(plant) is True
+
+    assert '3 дн.' in fake_bot.sent[0][1]['text']
+
+
 @pytest.mark.asyncio
 async def test_send_watering_notification_photo_branch(monkeypatch):
     plant = build_plant(has_image=True)
@@ -81,23 +115,224 @@ async def test_send_watering_notification_photo_branch(monkeypatch):
     assert fake_bot.sent[0][0] == 'photo'
 
 
+async def aiter_list(items):
+    for item in items:
+        yield item
+
+
+def fake_stream(plants):
+    async def _stream(cls, batch_size):
+        for plant in plants:
+            yield plant
+
+    return classmethod(_stream)
+
+
 @pytest.mark.asyncio
 async def test_watering_notifications(monkeypatch):
     plant = build_plant(has_image=False)
+    sent = []
+
+    async def fake_send(instance):
+        sent.append(instance)
+        return True
 
-    async def fake_find(cls):
-        return [plant]
+    monkeypatch.setattr(
+        scheduler.Plant, 'iter_to_water_today', fake_stream([plant])
+    )
+    monkeypatch.setattr(scheduler, 'send_watering_notification', fake_send)
+
+    await scheduler.watering_notifications()
+
+    assert sent == [plant]
+
+
+@pytest.mark.asyncio
+async def test_watering_notifications_bounded_concurrency(monkeypatch):
+    plants = [build_plant(has_image=False) for _ in range(20)]
+    active = 0
+    peak = 0
 
     async def fake_send(instance):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0)
+        active -= 1
         return True
 
+    monkeypatch.setattr(scheduler.config.notifications, 'digest', False)
+    monkeypatch.setattr(scheduler.config.notifications, 'workers', 3)
+    monkeypatch.setattr(scheduler.config.notifications, 'batch_size', 2)
     monkeypatch.setattr(
-        scheduler.Plant, 'find_to_water_today', classmethod(fake_find)
+        scheduler.Plant, 'iter_to_water_today', fake_stream(plants)
     )
     monkeypatch.setattr(scheduler, 'send_watering_notification', fake_send)
 
     await scheduler.watering_notifications()
 
+    assert peak <= 3
+
+
+@pytest.mark.asyncio
+async def test_watering_notifications_worker_survives_errors(monkeypatch):
+    plants = [build_plant(has_image=False) for _ in range(3)]
+    calls = []
+
+    async def failing_send(instance):
+        calls.append(instance)
+        raise RuntimeError('fail')
+
+    monkeypatch.setattr(scheduler.config.notifications, 'digest', False)
+    monkeypatch.setattr(scheduler.config.notifications, 'workers', 1)
+    monkeypatch.setattr(
+        scheduler.Plant, 'iter_to_water_today', fake_stream(plants)
+    )
+    monkeypatch.setattr(scheduler, 'send_watering_notification', failing_send)
+
+    await scheduler.watering_notifications()
+
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_watering_notifications_groups_plants_by_user(monkeypatch):
+    first = build_plant(has_image=False)
+    second = build_plant(has_image=False)
+    other = build_plant(has_image=False)
+    other.user_id = 6
+    digests = []
+    singles = []
+
+    async def fake_digest(plants):
+        digests.append(plants)
+        return True
+
+    async def fake_send(instance):
+        singles.append(instance)
+        return True
+
+    monkeypatch.setattr(scheduler.config.notifications, 'digest', True)
+    monkeypatch.setattr(
+        scheduler.Plant,
+        'iter_to_water_today',
+        fake_stream([first, second, other]),
+    )
+    monkeypatch.setattr(scheduler, 'send_watering_digest', fake_digest)
+    monkeypatch.setattr(scheduler, 'send_watering_notification', fake_send)
+
+    await scheduler.watering_notifications()
+
+    assert digests == [[first, second]]
+    assert singles == [other]
+
+
+def test_group_by_user_respects_digest_size():
+    plants = [build_plant(has_image=False) for _ in range(5)]
+
+    groups = list(scheduler._group_by_user(plants, 2))
+
+    assert [len(group) for group in groups] == [2, 2, 1]
+
+
+@pytest.mark.asyncio
+async def test_batches_end_on_user_boundary():
+    plants = [build_plant(has_image=False) for _ in range(5)]
+    plants[-1].user_id = 6
+
+    batches = [
+        batch async for batch in scheduler._batches(aiter_list(plants), 2)
+    ]
+
+    assert [len(batch) for batch in batches] == [4, 1]
+
+
+@pytest.mark.asyncio
+async def test_watering_notifications_resumes_from_outbox(monkeypatch):
+    plants = [build_plant(has_image=False) for _ in range(3)]
+    for index, plant in enumerate(plants):
+        plant.user_id = index
+    await NotificationOutbox.register(plants, date.today(), 'crashed')
+    await NotificationOutbox.record(
+        [(plants[0].id, True), (plants[1].id, False), (plants[2].id, False)],
+        date.today(),
+        'crashed',
+    )
+    sent = []
+
+    async def fake_send(instance):
+        sent.append(instance)
+        return instance is plants[1]
+
+    monkeypatch.setattr(
+        scheduler.Plant, 'iter_to_water_today', fake_stream(plants)
+    )
+    monkeypatch.setattr(scheduler, 'send_watering_notification', fake_send)
+
+    await scheduler.watering_notifications()
+    assert sent == plants[1:]
+
+    sent.clear()
+    await scheduler.watering_notifications()
+    assert sent == [plants[2]]
+
+
+@pytest.mark.asyncio
+async def test_send_watering_digest_without_photos():
+    plants = [build_plant(has_image=False) for _ in range(3)]
+    fake_bot = FakeBot()
+    scheduler.bot = fake_bot
+
+    assert await scheduler.send_watering_digest(plants) is True
+
+    assert [kind for kind, _ in fake_bot.sent] == ['message']
+    _, sent = fake_bot.sent[0]
+    assert sent['text'].count('Plant') == 3
+
+
+@pytest.mark.asyncio
+async def test_send_watering_digest_single_photo_uses_caption():
+    plants = [build_plant(has_image=True), build_plant(has_image=False)]
+    fake_bot = FakeBot()
+    scheduler.bot = fake_bot
+
+    assert await scheduler.send_watering_digest(plants) is True
+
+    assert [kind for kind, _ in fake_bot.sent] == ['photo']
+
+
+@pytest.mark.asyncio
+async def test_send_watering_digest_long_text_leaves_caption():
+    plants = [build_plant(has_image=True), build_plant(has_image=False)]
+    plants[1].name = 'Plant ' * 200
+    fake_bot = FakeBot()
+    scheduler.bot = fake_bot
+
+    assert await scheduler.send_watering_digest(plants) is True
+
+    assert [kind for kind, _ in fake_bot.sent] == ['photo', 'message']
+    photo = fake_bot.sent[0][1]
+    assert len(photo['caption']) <= scheduler.CAPTION_LIMIT
+    assert 'reply_markup' in fake_bot.sent[1][1]
+
+
+@pytest.mark.asyncio
+async def test_send_watering_digest_sends_media_group():
+    plants = [build_plant(has_image=True) for _ in range(2)]
+    fake_bot = FakeBot()
+    scheduler.bot = fake_bot
+
+    assert await scheduler.send_watering_digest(plants) is True
+
+    assert [kind for kind, _ in fake_bot.sent] == ['media_group', 'message']
+    assert len(fake_bot.sent[0][1]['media']) == 2
+
+
+@pytest.mark.asyncio
+async def test_send_watering_digest_without_bot():
+    scheduler.bot = None
+    assert await scheduler.send_watering_digest([build_plant(False)]) is False
+
 
 @pytest.mark.asyncio
 async def test_send_watering_notification_without_id(monkeypatch):
@@ -113,12 +348,36 @@ async def test_send_watering_notification_without_id(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_watering_notifications_empty_list(monkeypatch):
-    async def _empty(cls):
-        return []
+async def test_overdue_notifications_reminds_and_reschedules(monkeypatch):
+    reminded = build_plant(has_image=False)
+    reminded.next_watering_at = date.today() - timedelta(days=1)
+    stale = build_plant(has_image=False)
+    stale.name = 'Stale'
+    stale.next_watering_at = date.today() - timedelta(days=30)
+    await reminded.insert()
+    await stale.insert()
+    sent = []
+
+    async def fake_send(plant):
+        sent.append(plant.name)
+        return True
+
+    monkeypatch.setattr(scheduler, 'send_watering_notification', fake_send)
+    monkeypatch.setattr(scheduler.config.overdue, 'reminders', [1])
+    monkeypatch.setattr(scheduler.config.overdue, 'reschedule_after', 10)
 
+    await scheduler.overdue_notifications()
+    await scheduler.overdue_notifications()
+
+    assert sent == ['Plant']
+    assert (await Plant.get(stale.id)).next_watering_at > date.today()
+    assert (await Plant.get(reminded.id)).overdue_days() == 1
+
+
+@pytest.mark.asyncio
+async def test_watering_notifications_empty_list(monkeypatch):
     monkeypatch.setattr(
-        scheduler.Plant, 'find_to_water_today', classmethod(_empty)
+        scheduler.Plant, 'iter_to_water_today', fake_stream([])
     )
 
     assert await scheduler.watering_notifications() is None
@@ -141,6 +400,9 @@ class DummyScheduler:
     def add_job(self, *args, **kwargs):
         self.added_jobs.append(kwargs)
 
+    def remove_all_jobs(self):
+        self.added_jobs = []
+
 
 @pytest.mark.asyncio
 async def test_start_scheduler_adds_job(monkeypatch):
@@ -175,7 +437,7 @@ async def test_send_watering_notification_logs_error(monkeypatch):
     scheduler.bot = fake_bot
     monkeypatch.setattr(scheduler, 'watering_kb', lambda **kwargs: kwargs)
 
-    assert await scheduler.send_watering_notification(plant) is True
+    assert await scheduler.send_watering_notification(plant) is False
 
 
 @pytest.mark.asyncio
@@ -190,6 +452,75 @@ async def test_start_scheduler_handles_exception(monkeypatch):
     await scheduler.start_scheduler()
 
 
+class FixedTrigger:
+    def __init__(self, fire_time):
+        self.fire_time = fire_time
+        self.since = None
+
+    def get_next_fire_time(self, previous, now):
+        self.since = now
+        return self.fire_time if self.fire_time >= now else None
+
+
+@pytest.mark.asyncio
+async def test_scheduled_watering_notifications_records_checkpoint(
+    monkeypatch,
+):
+    async def fake_notifications():
+        await asyncio.sleep(0)
+
+    monkeypatch.setattr(
+        scheduler, 'watering_notifications', fake_notifications
+    )
+
+    await scheduler.scheduled_watering_notifications()
+
+    assert await JobCheckpoint.get_last_run(scheduler.JOB_ID) is not None
+
+
+@pytest.mark.asyncio
+async def test_start_scheduler_catches_up_missed_run(monkeypatch):
+    dummy = DummyScheduler(has_job=False)
+    missed = datetime.now(timezone.utc) - timedelta(minutes=5)
+    monkeypatch.setattr(scheduler, 'scheduler', dummy)
+    monkeypatch.setattr(scheduler, 'watering_trigger', FixedTrigger(missed))
+
+    await scheduler.start_scheduler()
+
+    assert [job['id'] for job in dummy.added_jobs] == [
+        scheduler.JOB_ID,
+        scheduler.CATCH_UP_JOB_ID,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_start_scheduler_skips_catch_up_after_recent_run(monkeypatch):
+    dummy = DummyScheduler(has_job=False)
+    missed = datetime.now(timezone.utc) - timedelta(minutes=5)
+    trigger = FixedTrigger(missed)
+    await JobCheckpoint.record_run(
+        scheduler.JOB_ID, datetime.now(timezone.utc) - timedelta(minutes=1)
+    )
+    monkeypatch.setattr(scheduler, 'scheduler', dummy)
+    monkeypatch.setattr(scheduler, 'watering_trigger', trigger)
+
+    await scheduler.start_scheduler()
+
+    assert [job['id'] for job in dummy.added_jobs] == [scheduler.JOB_ID]
+    assert trigger.since > missed
+
+
+@pytest.mark.asyncio
+async def test_stop_scheduler_removes_jobs(monkeypatch):
+    dummy = DummyScheduler(has_job=False)
+    dummy.added_jobs.append({'id': scheduler.JOB_ID})
+    monkeypatch.setattr(scheduler, 'scheduler', dummy)
+
+    await scheduler.stop_scheduler()
+
+    assert dummy.added_jobs == []
+
+
 def test_set_bot_sets_global():
     scheduler.set_bot('bot')  # type: ignore[arg-type]
     assert scheduler.bot == 'bot'
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import pytest
+
+from bot.models import User
+from bot.utils.cache import TTLCache, hit_rate
+from bot.utils.users import RegisteredUsers
+
+
+class Clock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr('bot.utils.cache.time.monotonic', clock)
+    return clock
+
+
+async def register(user_id: int) -> User:
+    user = User(user_id=user_id, first_name='Name', full_name='Full Name')
+    await user.insert()
+    return user
+
+
+def test_ttl_cache_evicts_least_recently_used(clock):
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    cache.get('a')
+
+    cache.set('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+
+
+def test_ttl_cache_expires_entries(clock):
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set('a', 1)
+    cache.set('b', 2, ttl=1)
+
+    clock.now += 5
+
+    assert cache.get('a') == 1
+    assert cache.get('b') is None
+    assert len(cache) == 1
+
+
+def test_ttl_cache_counts_hits_and_misses(clock):
+    cache = TTLCache(maxsize=2, ttl=10)
+    cache.set('a', False)
+
+    cache.get('a')
+    cache.get('missing')
+    info = cache.cache_info()
+
+    assert info._asdict() == {
+        'hits': 1,
+        'misses': 1,
+        'maxsize': 2,
+        'currsize': 1,
+    }
+    assert hit_rate(info) == pytest.approx(0.5)
+    assert not hit_rate(TTLCache(1, 1).cache_info())
+
+
+@pytest.mark.asyncio
+async def test_registered_users_saves_lookups(clock, monkeypatch):
+    await register(1)
+    users = RegisteredUsers(maxsize=10, ttl=60, negative_ttl=5)
+    lookups = []
+    exists = User.exists
+
+    async def counting_exists(user_id):
+        lookups.append(user_id)
+        return await exists(user_id)
+
+    monkeypatch.setattr(User, 'exists', counting_exists)
+
+    assert await users.is_registered(1) is True
+    assert await users.is_registered(1) is True
+    assert await users.is_registered(2) is False
+    assert await users.is_registered(2) is False
+
+    assert lookups == [1, 2]
+    assert users.cache.cache_info().hits == 2
+
+
+@pytest.mark.asyncio
+async def test_registered_users_negative_entries_expire_early(clock):
+    users = RegisteredUsers(maxsize=10, ttl=60, negative_ttl=5)
+    assert await users.is_registered(3) is False
+    await register(3)
+
+    assert await users.is_registered(3) is False
+    clock.now += 6
+    assert await users.is_registered(3) is True
+
+
+@pytest.mark.asyncio
+async def test_registered_users_remember_replaces_negative_entry(clock):
+    users = RegisteredUsers(maxsize=10, ttl=60, negative_ttl=5)
+    assert await users.is_registered(4) is False
+
+    users.remember(4)
+    assert await users.is_registered(4) is True
+
+    users.forget(4)
+    assert await users.is_registered(4) is False
+
+
+@pytest.mark.asyncio
+async def test_registered_users_warm_loads_latest_users(clock):
+    for user_id in (5, 6, 7):
+        await register(user_id)
+    users = RegisteredUsers(maxsize=2, ttl=60, negative_ttl=5)
+
+    assert await users.warm() == 2
+
+    assert users.cache.get(7) is True
+    assert users.cache.get(6) is True
+    assert users.cache.get(5) is None
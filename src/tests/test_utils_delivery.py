@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from operator import sub
+
+import pytest
+from aiogram.exceptions import (
+    TelegramBadRequest,
+    TelegramNetworkError,
+    TelegramRetryAfter,
+)
+from aiogram.methods import SendMessage
+
+from bot.utils.delivery import DeliveryQueue, TokenBucket
+
+METHOD = SendMessage(chat_id=1, text='text')
+CHAT_INTERVAL = 0.05
+
+
+def build_queue(**kwargs) -> DeliveryQueue:
+    params = dict(
+        rate=1000,
+        per_chat_interval=0,
+        max_retries=2,
+        retry_backoff=0,
+        workers=2,
+        queue_size=10,
+    )
+    params.update(kwargs)
+    return DeliveryQueue(**params)
+
+
+class FlakySender:
+    def __init__(self, errors: list[Exception]):
+        self.errors = errors
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return 'ok'
+
+
+@pytest.mark.asyncio
+async def test_submit_delivers_and_counts():
+    queue = build_queue()
+    sender = FlakySender([])
+
+    assert await queue.submit(1, sender) is True
+
+    assert sender.calls == 1
+    assert queue.sent == 1
+    assert queue.depth == 0
+    assert queue.drain_rate > 0
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_submit_honors_retry_after():
+    queue = build_queue()
+    sender = FlakySender(
+        [TelegramRetryAfter(method=METHOD, message='flood', retry_after=0)]
+    )
+
+    assert await queue.submit(1, sender) is True
+
+    assert sender.calls == 2
+    assert queue.retried == 1
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_submit_gives_up_after_max_retries():
+    queue = build_queue(max_retries=1)
+    sender = FlakySender(
+        [
+            TelegramNetworkError(method=METHOD, message='down'),
+            TelegramNetworkError(method=METHOD, message='down'),
+        ]
+    )
+
+    assert await queue.submit(1, sender) is False
+
+    assert sender.calls == 2
+    assert queue.failed == 1
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_submit_does_not_retry_client_errors():
+    queue = build_queue()
+    sender = FlakySender(
+        [TelegramBadRequest(method=METHOD, message='chat not found')]
+    )
+
+    assert await queue.submit(1, sender) is False
+
+    assert sender.calls == 1
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_busy_chat_does_not_hold_other_chats():
+    queue = build_queue(per_chat_interval=CHAT_INTERVAL)
+    delivered: dict[int, list[float]] = {}
+    started = time.monotonic()
+
+    def sender(chat_id: int):
+        async def _send():
+            delivered.setdefault(chat_id, []).append(
+                time.monotonic() - started
+            )
+
+        return _send
+
+    chats = [7, 7, 7, 7, 1, 2, 3, 4]
+    results = await asyncio.gather(
+        *(queue.submit(chat_id, sender(chat_id)) for chat_id in chats)
+    )
+    await queue.stop()
+
+    assert all(results)
+    assert max(delivered[4]) < CHAT_INTERVAL
+    busy = delivered[7]
+    assert min(map(sub, busy[1:], busy)) >= CHAT_INTERVAL * 0.9
+
+
+@pytest.mark.asyncio
+async def test_stop_fails_queued_requests():
+    queue = build_queue(per_chat_interval=10)
+    sender = FlakySender([])
+    first = asyncio.create_task(queue.submit(1, sender))
+    second = asyncio.create_task(queue.submit(1, sender))
+    assert await first is True
+
+    await queue.stop()
+
+    assert await second is False
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_pause_blocks_tokens():
+    bucket = TokenBucket(rate=100, capacity=1)
+
+    await bucket.acquire()
+    bucket.pause(0.01)
+    await bucket.acquire()
+
+    assert bucket.tokens < 1
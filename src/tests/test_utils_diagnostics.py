@@ -0,0 +1,96 @@
+import pytest
+
+from bot.db import dedupe_plant_names, verify_indexes
+from bot.models import Plant
+from bot.utils.diagnostics import (
+    hot_queries,
+    is_collection_scan,
+    summarize_plan,
+)
+
+
+def test_summarize_plan_walks_input_stages():
+    explain = {
+        'queryPlanner': {
+            'winningPlan': {
+                'stage': 'FETCH',
+                'inputStage': {'stage': 'IXSCAN', 'indexName': 'user_order'},
+            }
+        }
+    }
+
+    summary = summarize_plan(explain)
+
+    assert summary == 'FETCH <- IXSCAN(user_order)'
+    assert not is_collection_scan(summary)
+
+
+def test_summarize_plan_reads_sbe_query_plan():
+    explain = {
+        'queryPlanner': {
+            'winningPlan': {
+                'queryPlan': {
+                    'stage': 'SORT',
+                    'inputStages': [{'stage': 'COLLSCAN'}],
+                }
+            }
+        }
+    }
+
+    summary = summarize_plan(explain)
+
+    assert summary == 'SORT <- COLLSCAN'
+    assert is_collection_scan(summary)
+
+
+def test_hot_queries_filter_by_user():
+    queries = hot_queries(42)
+
+    assert queries['user_plants'].get_filter_query() == {'user_id': 42}
+    assert queries['user_plants'].sort_expressions == [('_id', 1)]
+    assert 'next_watering_at' in str(
+        queries['due_today'].get_filter_query()
+    )
+
+
+@pytest.mark.asyncio
+async def test_verify_indexes_reports_declared_indexes(monkeypatch):
+    assert await verify_indexes([Plant]) == []
+
+    collection = Plant.get_pymongo_collection()
+
+    async def no_indexes():
+        return {'_id_': {}}
+
+    monkeypatch.setattr(collection, 'index_information', no_indexes)
+    missing = await verify_indexes([Plant])
+
+    assert missing == ['user_name', 'due_watering', 'user_order']
+
+
+@pytest.mark.asyncio
+async def test_dedupe_plant_names_renames_younger_duplicates():
+    collection = Plant.get_pymongo_collection().database['legacy_plants']
+    await collection.insert_many(
+        [
+            {'_id': 1, 'user_id': 1, 'name': 'Fern'},
+            {'_id': 2, 'user_id': 1, 'name': 'Fern'},
+            {'_id': 3, 'user_id': 1, 'name': 'Fern (2)'},
+            {'_id': 4, 'user_id': 1, 'name': 'Fern'},
+            {'_id': 5, 'user_id': 2, 'name': 'Fern'},
+        ]
+    )
+
+    assert await dedupe_plant_names(collection) == 2
+
+    names = {
+        plant['_id']: plant['name'] async for plant in collection.find()
+    }
+    await collection.drop()
+    assert names == {
+        1: 'Fern',
+        2: 'Fern (3)',
+        3: 'Fern (2)',
+        4: 'Fern (4)',
+        5: 'Fern',
+    }
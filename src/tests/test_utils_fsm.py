@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import pytest
+from aiogram.fsm.storage.base import StorageKey
+
+from bot.models import FSMRecord
+from bot.states import AddPlant
+from bot.utils.fsm import MongoStorage, compact
+
+KEY = StorageKey(bot_id=1, chat_id=2, user_id=2)
+
+
+@pytest.fixture
+def storage():
+    return MongoStorage(idle_ttl=60)
+
+
+def test_compact_converts_sets_and_drops_empty_values():
+    data = {'days': {3, 1}, 'image': None, 'history': ('a', 'b')}
+
+    assert compact(data) == {'days': [1, 3], 'history': ['a', 'b']}
+
+
+@pytest.mark.asyncio
+async def test_mongo_storage_persists_state_and_data(storage):
+    await storage.set_state(KEY, AddPlant.name)
+    await storage.update_data(KEY, {'name': 'Aloe', 'warm_freq_days': {2}})
+
+    other_replica = MongoStorage(idle_ttl=60)
+    assert await other_replica.get_state(KEY) == AddPlant.name.state
+    assert await other_replica.get_data(KEY) == {
+        'name': 'Aloe',
+        'warm_freq_days': [2],
+    }
+    record = await FSMRecord.get_pymongo_collection().find_one({})
+    assert record['expires_at'] is not None
+
+
+@pytest.mark.asyncio
+async def test_mongo_storage_caches_within_update(storage, monkeypatch):
+    loads = []
+    load = FSMRecord.load
+
+    async def counting_load(key):
+        loads.append(key)
+        return await load(key)
+
+    monkeypatch.setattr(FSMRecord, 'load', counting_load)
+    with storage.update_scope():
+        await storage.set_data(KEY, {'history': ['AddPlant:name']})
+        data = await storage.get_data(KEY)
+        data['history'].append('AddPlant:description')
+
+        assert await storage.get_data(KEY) == {'history': ['AddPlant:name']}
+        assert await storage.get_state(KEY) is None
+        assert not loads
+
+    other_replica = MongoStorage(idle_ttl=60)
+    await other_replica.set_state(KEY, AddPlant.name)
+
+    assert await storage.get_state(KEY) == AddPlant.name.state
+    assert len(loads) == 1
+
+
+@pytest.mark.asyncio
+async def test_mongo_storage_removes_finished_conversations(storage):
+    await storage.set_state(KEY, AddPlant.name)
+    await storage.set_data(KEY, {'name': 'Aloe'})
+
+    await storage.set_state(KEY, None)
+    await storage.set_data(KEY, {})
+
+    assert await FSMRecord.count() == 0
+    assert await storage.get_data(KEY) == {}
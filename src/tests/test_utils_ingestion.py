@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+import pytest_asyncio
+
+from bot.models import PhotoUpload, Plant
+from bot.utils import ingestion
+
+
+class FakeBot:
+    def __init__(self, file_path: str | None = 'photos/file.jpg'):
+        self.file_path = file_path
+
+    async def get_file(self, file_id):
+        return SimpleNamespace(file_id=file_id, file_path=self.file_path)
+
+
+@pytest.fixture
+def uploads(monkeypatch):
+    state = SimpleNamespace(calls=0, failures=0, deleted=[])
+
+    async def _upload(file_path, user_id):
+        state.calls += 1
+        if state.failures:
+            state.failures -= 1
+            raise ConnectionError('storage unavailable')
+        return f'{user_id}/{state.calls}.jpg'
+
+    async def _delete(storage_key):
+        state.deleted.append(storage_key)
+
+    monkeypatch.setattr(
+        ingestion.storage_service, 'upload_telegram_file', _upload
+    )
+    monkeypatch.setattr(ingestion.storage_service, 'release_image', _delete)
+    return state
+
+
+@pytest_asyncio.fixture
+async def queue():
+    queue = ingestion.PhotoIngestionQueue(
+        workers=2,
+        queue_size=10,
+        max_retries=2,
+        retry_backoff=0,
+        record_ttl=60,
+        drain_timeout=1,
+    )
+    yield queue
+    await queue.stop()
+
+
+@pytest.mark.asyncio
+async def test_ingestion_attaches_key_to_saved_plant(queue, uploads):
+    plant = Plant(user_id=1, name='Ficus', image='file-1')
+    await plant.insert()
+
+    await queue.submit(FakeBot(), 1, 'file-1')
+    await queue.join()
+
+    stored = await Plant.get(plant.id)
+    assert stored.storage_key == '1/1.jpg'
+    assert await PhotoUpload.find_all().count() == 0
+    assert queue.ingested == 1
+
+
+@pytest.mark.asyncio
+async def test_ingestion_records_key_until_plant_is_saved(queue, uploads):
+    await queue.submit(FakeBot(), 1, 'file-1')
+    await queue.join()
+
+    assert await PhotoUpload.claim('file-1') == '1/1.jpg'
+    assert await PhotoUpload.claim('file-1') is None
+
+
+@pytest.mark.asyncio
+async def test_ingestion_retries_then_gives_up(queue, uploads):
+    uploads.failures = 1
+    await queue.submit(FakeBot(), 1, 'file-1')
+    await queue.join()
+    assert queue.ingested == 1
+    assert uploads.calls == 2
+
+    await queue.submit(FakeBot(file_path=None), 1, 'file-2')
+    await queue.join()
+    assert queue.failed == 1
+    assert await PhotoUpload.claim('file-2') is None
+
+
+@pytest.mark.asyncio
+async def test_discard_removes_uploaded_object(queue, uploads):
+    await queue.submit(FakeBot(), 1, 'file-1')
+    await queue.join()
+
+    await queue.discard(1, 'file-1')
+
+    assert uploads.deleted == ['1/1.jpg']
+    assert await PhotoUpload.find_all().count() == 0
+
+
+@pytest.mark.asyncio
+async def test_discard_before_upload_is_seen_by_any_worker(queue, uploads):
+    await queue.discard(1, 'file-1')
+    other_replica = ingestion.PhotoIngestionQueue(
+        workers=1,
+        queue_size=10,
+        max_retries=0,
+        retry_backoff=0,
+        record_ttl=60,
+        drain_timeout=1,
+    )
+    await other_replica._attach(
+        ingestion.PhotoJob(bot=FakeBot(), user_id=1, file_id='file-1'),
+        '1/1.jpg',
+    )
+
+    assert uploads.deleted == ['1/1.jpg']
+    assert await PhotoUpload.find_all().count() == 0
+
+
+@pytest.mark.asyncio
+async def test_resent_photo_is_not_discarded(queue, uploads):
+    await queue.discard(1, 'file-1')
+
+    await queue.submit(FakeBot(), 1, 'file-1')
+    await queue.join()
+
+    assert not uploads.deleted
+    assert await PhotoUpload.claim('file-1') == '1/1.jpg'
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_queued_photos(queue, uploads, monkeypatch):
+    upload = ingestion.storage_service.upload_telegram_file
+
+    async def slow_upload(file_path, user_id):
+        await asyncio.sleep(0.01)
+        return await upload(file_path, user_id)
+
+    monkeypatch.setattr(
+        ingestion.storage_service, 'upload_telegram_file', slow_upload
+    )
+    for index in range(3):
+        await queue.submit(FakeBot(), 1, f'file-{index}')
+
+    await queue.stop()
+
+    assert queue.ingested == 3
+
+
+@pytest.mark.asyncio
+async def test_sweep_releases_expired_uploads(queue, uploads):
+    await PhotoUpload.record('file-1', 1, '1/old.jpg', ttl=-1)
+    await PhotoUpload.record('file-2', 1, '1/new.jpg', ttl=60)
+    await PhotoUpload.discard('file-3', 1, ttl=-1)
+
+    assert await queue.sweep_expired() == 1
+
+    assert uploads.deleted == ['1/old.jpg']
+    assert await PhotoUpload.claim('file-2') == '1/new.jpg'
+    assert await PhotoUpload.find_all().count() == 0
+
+
+@pytest.mark.asyncio
+async def test_record_keeps_the_first_key_of_a_photo(queue, uploads):
+    assert await PhotoUpload.record('file-1', 1, '1/first.jpg', ttl=60)
+    assert not await PhotoUpload.record('file-1', 1, '1/second.jpg', ttl=60)
+
+    await queue.submit(FakeBot(), 1, 'file-1')
+    await queue.join()
+
+    assert uploads.deleted == ['1/1.jpg']
+    assert await PhotoUpload.claim('file-1') == '1/first.jpg'
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import pytest
+
+from bot.models import SchedulerLease
+from bot.utils.leader import LeaderElector
+
+
+class Recorder:
+    def __init__(self):
+        self.events: list[str] = []
+
+    async def elected(self):
+        self.events.append('elected')
+
+    async def demoted(self):
+        self.events.append('demoted')
+
+
+def build_elector(recorder: Recorder) -> LeaderElector:
+    return LeaderElector(
+        name='jobs',
+        ttl=30,
+        renew_interval=10,
+        on_elected=recorder.elected,
+        on_demoted=recorder.demoted,
+    )
+
+
+@pytest.mark.asyncio
+async def test_only_one_replica_becomes_leader():
+    first_events, second_events = Recorder(), Recorder()
+    first = build_elector(first_events)
+    second = build_elector(second_events)
+
+    await first.tick()
+    await second.tick()
+    await first.tick()
+
+    assert first.is_leader is True
+    assert second.is_leader is False
+    assert first_events.events == ['elected']
+    assert second_events.events == []
+
+
+@pytest.mark.asyncio
+async def test_stop_releases_lease_for_failover():
+    first_events, second_events = Recorder(), Recorder()
+    first = build_elector(first_events)
+    second = build_elector(second_events)
+    await first.tick()
+
+    await first.stop()
+    await second.tick()
+
+    assert first_events.events == ['elected', 'demoted']
+    assert second.is_leader is True
+
+
+@pytest.mark.asyncio
+async def test_renewal_error_demotes_leader(monkeypatch):
+    recorder = Recorder()
+    elector = build_elector(recorder)
+    await elector.tick()
+
+    async def broken_acquire(*args):
+        raise RuntimeError('mongo is down')
+
+    monkeypatch.setattr(SchedulerLease, 'acquire', broken_acquire)
+    await elector.tick()
+
+    assert elector.is_leader is False
+    assert recorder.events == ['elected', 'demoted']
+
+
+@pytest.mark.asyncio
+async def test_start_runs_election_in_background():
+    recorder = Recorder()
+    elector = build_elector(recorder)
+
+    await elector.start()
+    await elector.start()
+    await elector.stop()
+
+    assert elector._task is None
@@ -2,7 +2,7 @@ from datetime import date
 
 import pytest
 
-from bot.models import MonthDay, Plant
+from bot.models import MonthDay, PhotoUpload, Plant
 from bot.utils.models import (
     _get_weekday_choice,
     _require_int,
@@ -11,6 +11,7 @@ from bot.utils.models import (
     cold_period,
     save_plant,
 )
+from bot.utils.summaries import plant_summaries
 
 
 def test_require_mapping_accepts_mapping():
@@ -92,13 +93,37 @@ def test_cold_period_cross_year():
 @pytest.mark.asyncio
 async def test_save_plant_creates_document():
     data = build_plant_data()
-    await save_plant(data, is_fert=True)
+    assert await plant_summaries.get(data['user_id']) == []
+    assert await save_plant(data, is_fert=True) is True
     stored = await Plant.find_one(Plant.name == 'Integration')
     assert stored is not None
+    assert await Plant.has_name(data['user_id'], 'Integration')
     assert stored.warm_period.schedule.weekday == {0, 2}
     assert stored.last_watered_at == date.today()
 
 
+@pytest.mark.asyncio
+async def test_save_plant_reports_taken_name():
+    data = build_plant_data()
+    await Plant(user_id=data['user_id'], name='Integration').insert()
+
+    assert await save_plant(data, is_fert=True) is False
+    assert await Plant.find(Plant.name == 'Integration').count() == 1
+
+
+@pytest.mark.asyncio
+async def test_save_plant_claims_uploaded_photo():
+    data = build_plant_data()
+    data['image'] = 'file-1'
+    await PhotoUpload.record('file-1', data['user_id'], 's3/key', ttl=60)
+
+    await save_plant(data, is_fert=True)
+
+    stored = await Plant.find_one(Plant.name == 'Integration')
+    assert stored.storage_key == 's3/key'
+    assert await PhotoUpload.claim('file-1') is None
+
+
 @pytest.mark.asyncio
 async def test_save_plant_sets_last_fertilized_when_in_period():
     today = date.today()
@@ -0,0 +1,278 @@
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from io import BytesIO
+
+import pytest
+from botocore.exceptions import ClientError
+from PIL import Image
+
+from bot.images import thumbnail_key
+from bot.models import StoredPhoto
+from bot.utils.storage import S3StorageService
+
+
+class FakeS3:
+    def __init__(self):
+        self.objects: dict[str, bytes] = {}
+        self.uploads: dict[str, list[bytes]] = {}
+        self.aborted: list[str] = []
+        self.fail_part: int | None = None
+        self.puts = 0
+
+    async def put_object(self, Bucket, Key, Body):
+        self.puts += 1
+        self.objects[Key] = Body
+
+    async def head_object(self, Bucket, Key):
+        if Key not in self.objects:
+            raise ClientError({'Error': {'Code': '404'}}, 'HeadObject')
+        return {'ContentLength': len(self.objects[Key])}
+
+    async def create_multipart_upload(self, Bucket, Key):
+        self.uploads[Key] = []
+        return {'UploadId': Key}
+
+    async def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        if PartNumber == self.fail_part:
+            raise ConnectionError('part lost')
+        self.uploads[UploadId].append(Body)
+        return {'ETag': f'etag-{PartNumber}'}
+
+    async def complete_multipart_upload(
+        self, Bucket, Key, UploadId, MultipartUpload
+    ):
+        numbers = [part['PartNumber'] for part in MultipartUpload['Parts']]
+        assert numbers == list(range(1, len(numbers) + 1))
+        self.objects[Key] = b''.join(self.uploads.pop(UploadId))
+
+    async def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.aborted.append(UploadId)
+
+    async def delete_object(self, Bucket, Key):
+        self.objects.pop(Key, None)
+
+    async def delete_objects(self, Bucket, Delete):
+        for item in Delete['Objects']:
+            self.objects.pop(item['Key'], None)
+
+
+class FakeSession:
+    def __init__(self):
+        self.opened = 0
+        self.closed = 0
+        self.s3 = FakeS3()
+
+    def client(self, *args, **kwargs):
+        self.config = kwargs['config']
+        return self._client()
+
+    @asynccontextmanager
+    async def _client(self):
+        self.opened += 1
+        yield self.s3
+        self.closed += 1
+
+
+class FakeStream:
+    def __init__(self, data: bytes, chunk: int = 3):
+        self.data = data
+        self.chunk = chunk
+        self.largest_read = 0
+
+    async def read(self, size: int = -1) -> bytes:
+        size = min(size, self.chunk)
+        self.largest_read = max(self.largest_read, size)
+        piece = self.data[:size]
+        self.data = self.data[size:]
+        return piece
+
+
+class FakeResponse:
+    def __init__(self, stream: FakeStream):
+        self.status = 200
+        self.content = stream
+
+
+class FakeHttp:
+    def __init__(self, data: bytes):
+        self.stream = FakeStream(data, chunk=1 << 16)
+        self.closed = False
+
+    @asynccontextmanager
+    async def get(self, url):
+        yield FakeResponse(self.stream)
+
+    async def close(self):
+        self.closed = True
+
+
+@pytest.fixture
+def service():
+    service = S3StorageService()
+    service.session = FakeSession()
+    service.part_size = 8
+    return service
+
+
+@pytest.mark.asyncio
+async def test_storage_service_reuses_one_s3_client(service):
+    await service.upload_file('1/a.jpg', b'a')
+    await service.upload_file('1/b.jpg', b'b')
+    await service.delete_file('1/a.jpg')
+
+    assert service.session.opened == 1
+    assert service.session.s3.objects == {'1/b.jpg': b'b'}
+    assert service.session.config.max_pool_connections == service.pool_size
+
+
+@pytest.mark.asyncio
+async def test_storage_service_start_and_stop(service):
+    await service.start()
+    http = service._http_session()
+
+    await service.stop()
+
+    assert service.session.closed == 1
+    assert http.closed
+    await service.upload_file('1/c.jpg', b'c')
+    assert service.session.opened == 2
+    await service.stop()
+
+
+@pytest.mark.asyncio
+async def test_upload_stream_sends_small_files_in_one_put(service):
+    await service.upload_stream('1/small.jpg', FakeStream(b'tiny'))
+
+    assert service.session.s3.objects == {'1/small.jpg': b'tiny'}
+    assert service.session.s3.uploads == {}
+
+
+@pytest.mark.asyncio
+async def test_upload_stream_uses_multipart_in_fixed_parts(service):
+    data = bytes(range(20))
+    stream = FakeStream(data)
+
+    await service.upload_stream('1/large.jpg', stream)
+
+    assert service.session.s3.objects == {'1/large.jpg': data}
+    assert stream.largest_read <= service.part_size
+
+
+@pytest.mark.asyncio
+async def test_upload_stream_aborts_failed_multipart(service):
+    service.session.s3.fail_part = 2
+
+    with pytest.raises(ConnectionError):
+        await service.upload_stream('1/lost.jpg', FakeStream(bytes(20)))
+
+    assert service.session.s3.aborted == ['1/lost.jpg']
+    assert service.session.s3.objects == {}
+
+
+def make_photo(color: str = 'green') -> bytes:
+    buffer = BytesIO()
+    Image.new('RGB', (2000, 1000), color).save(buffer, format='JPEG')
+    return buffer.getvalue()
+
+
+@pytest.mark.asyncio
+async def test_upload_image_stores_photo_and_thumbnail(service):
+    key = await service.upload_image(1, make_photo(), 'jpg')
+    await service.stop()
+
+    objects = service.session.s3.objects
+    assert key.endswith('.webp')
+    assert set(objects) == {key, thumbnail_key(key)}
+    with Image.open(BytesIO(objects[key])) as image:
+        assert max(image.size) == service.image_profile.max_side
+
+    await service.release_image(key)
+    assert objects == {}
+
+
+@pytest.mark.asyncio
+async def test_upload_image_keeps_undecodable_file(service):
+    key = await service.upload_image(1, b'not an image', 'jpg')
+    await service.stop()
+
+    assert key.endswith('.jpg')
+    assert service.session.s3.objects == {key: b'not an image'}
+
+
+@pytest.mark.asyncio
+async def test_upload_image_deduplicates_by_content(service):
+    photo = make_photo()
+
+    first = await service.upload_image(1, photo, 'jpg')
+    second = await service.upload_image(2, photo, 'jpg')
+    other = await service.upload_image(1, make_photo('red'), 'jpg')
+    await service.stop()
+
+    assert first == second
+    assert first != other
+    assert service.session.s3.puts == 4
+    assert (await StoredPhoto.get(first)).refs == 2
+
+
+@pytest.mark.asyncio
+async def test_upload_image_restores_missing_object(service):
+    photo = make_photo()
+    key = await service.upload_image(1, photo, 'jpg')
+    service.session.s3.objects.clear()
+
+    assert await service.upload_image(1, photo, 'jpg') == key
+    await service.stop()
+
+    assert key in service.session.s3.objects
+
+
+@pytest.mark.asyncio
+async def test_release_image_deletes_with_last_reference(service):
+    photo = make_photo()
+    key = await service.upload_image(1, photo, 'jpg')
+    await service.upload_image(2, photo, 'jpg')
+    await service.stop()
+    objects = service.session.s3.objects
+
+    await service.release_image(key)
+    assert key in objects
+
+    await service.release_image(key)
+    assert objects == {}
+    assert await StoredPhoto.get(key) is None
+
+
+@pytest.mark.asyncio
+async def test_release_image_deletes_untracked_object(service):
+    await service.upload_file('1/legacy.jpg', b'old')
+
+    await service.release_image('1/legacy.jpg')
+
+    assert service.session.s3.objects == {}
+
+
+@pytest.mark.asyncio
+async def test_telegram_photo_in_one_part_is_normalized(service):
+    service.part_size = 1 << 20
+    service._http = FakeHttp(make_photo())
+
+    key = await service.upload_telegram_file('photos/file.jpg', 1)
+    await service.stop()
+
+    assert service.normalize_images
+    assert key.startswith('photos/')
+    assert set(service.session.s3.objects) == {key, thumbnail_key(key)}
+
+
+@pytest.mark.asyncio
+async def test_large_telegram_file_is_streamed_untouched(service):
+    http = FakeHttp(b'x' * 20)
+    service._http = http
+
+    key = await service.upload_telegram_file('photos/file.jpg', 1)
+
+    assert service.normalize_images
+    assert key.startswith('1/')
+    assert service.session.s3.objects == {key: b'x' * 20}
+    assert http.stream.largest_read <= service.part_size
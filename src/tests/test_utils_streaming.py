@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import pytest
+
+from bot.utils.streaming import (
+    MESSAGE_LIMIT,
+    pack_lines,
+    send_chunks,
+    text_length,
+)
+
+
+async def collect(lines: list[str], limit: int) -> list[str]:
+    async def source():
+        for line in lines:
+            yield line
+
+    return [chunk async for chunk in pack_lines(source(), limit)]
+
+
+@pytest.mark.asyncio
+async def test_pack_lines_fills_chunks_up_to_limit():
+    chunks = await collect(['aaa', 'bbb', 'ccc', 'd'], limit=7)
+
+    assert chunks == ['aaa\nbbb', 'ccc\nd']
+
+
+@pytest.mark.asyncio
+async def test_pack_lines_cuts_oversized_lines():
+    chunks = await collect(['ab', 'x' * 7, 'c'], limit=3)
+
+    assert chunks == ['ab', 'xxx', 'xxx', 'x\nc']
+    assert not await collect([], limit=3)
+
+
+@pytest.mark.asyncio
+async def test_pack_lines_counts_emoji_as_telegram_does():
+    fits_by_code_points = MESSAGE_LIMIT // len('🚿 Ficus 🌿\n')
+    lines = ['🚿 Ficus 🌿' for _ in range(fits_by_code_points)]
+
+    chunks = await collect(lines, limit=MESSAGE_LIMIT)
+
+    assert len(chunks) == 2
+    assert all(text_length(chunk) <= MESSAGE_LIMIT for chunk in chunks)
+    assert '\n'.join(chunks).split('\n') == lines
+    assert await collect(['🌿' * 3], limit=4) == ['🌿🌿', '🌿']
+
+
+class FailingMessage:
+    def __init__(self, fail_on: int):
+        self.fail_on = fail_on
+        self.answers: list[str] = []
+
+    async def answer(self, text: str, **kwargs):
+        if len(self.answers) == self.fail_on:
+            raise ConnectionError('telegram unavailable')
+        self.answers.append(text)
+
+
+@pytest.mark.asyncio
+async def test_send_chunks_stops_on_failed_chunk():
+    pulled = []
+
+    async def chunks():
+        for chunk in ('a', 'b', 'c'):
+            pulled.append(chunk)
+            yield chunk
+
+    message = FailingMessage(fail_on=1)
+    with pytest.raises(ConnectionError):
+        await send_chunks(message, chunks())
+
+    assert message.answers == ['a']
+    assert pulled == ['a', 'b']
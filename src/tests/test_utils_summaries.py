@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import pytest
+
+from bot.models import Plant
+from bot.utils.pagination import slice_page
+from bot.utils.summaries import PlantSummaries
+
+
+@pytest.fixture
+def reads(monkeypatch):
+    calls = []
+    get_summaries = Plant.get_summaries
+
+    async def counting_get_summaries(user_id):
+        calls.append(user_id)
+        return await get_summaries(user_id)
+
+    monkeypatch.setattr(Plant, 'get_summaries', counting_get_summaries)
+    return calls
+
+
+@pytest.mark.asyncio
+async def test_plant_summaries_read_once_until_invalidated(reads):
+    summaries = PlantSummaries(maxsize=10, ttl=60)
+    await Plant(user_id=41, name='Aloe').insert()
+
+    first = await summaries.get(41)
+    assert await summaries.get(41) is first
+    assert reads == [41]
+
+    await Plant(user_id=41, name='Ficus').insert()
+    summaries.invalidate(41)
+
+    assert [plant.name for plant in await summaries.get(41)] == [
+        'Aloe',
+        'Ficus',
+    ]
+    assert reads == [41, 41]
+
+
+@pytest.mark.asyncio
+async def test_slice_page_walks_summaries_by_id():
+    for name in ('A', 'B', 'C'):
+        await Plant(user_id=42, name=name).insert()
+    summaries = await Plant.get_summaries(42)
+
+    first, has_more = slice_page(summaries, 2)
+    assert [plant.name for plant in first] == ['A', 'B']
+    assert has_more is True
+
+    last, has_more = slice_page(summaries, 2, after=first[-1].id)
+    assert [plant.name for plant in last] == ['C']
+    assert has_more is False
+
+    back, has_more = slice_page(summaries, 1, before=last[0].id)
+    assert [plant.name for plant in back] == ['B']
+    assert has_more is True
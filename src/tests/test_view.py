@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, datetime
+
+from beanie import PydanticObjectId
 
 from bot.models import (
     FertilizingPeriod,
@@ -17,6 +19,7 @@ from bot.view import (
     format_period,
     format_plant_message_html,
     format_schedule,
+    render_cache,
 )
 
 
@@ -90,3 +93,26 @@ def test_format_schedule_with_single_day_and_empty_fertilizing():
     schedule = WateringSchedule(type=FrequencyType.weekly, weekday=0)
     assert 'День недели' in format_schedule(schedule)
     assert format_fertilizing(None) == '—'
+
+
+def test_format_fertilizing_pluralizes_units():
+    plant = build_plant()
+    plant.fertilizing.frequency = 3
+    assert 'раз в 3 недели' in format_fertilizing(plant.fertilizing)
+    plant.fertilizing.type = FertilizingType.months
+    plant.fertilizing.frequency = 6
+    assert 'раз в 6 месяцев' in format_fertilizing(plant.fertilizing)
+
+
+def test_format_plant_message_html_caches_by_update_time():
+    plant = build_plant()
+    plant.id = PydanticObjectId()
+    plant.updated_at = datetime(2024, 1, 1)
+
+    first = format_plant_message_html(plant)
+    plant.name = 'Renamed'
+    assert format_plant_message_html(plant) is first
+    assert render_cache.cache_info().hits == 1
+
+    plant.updated_at = datetime(2024, 1, 2)
+    assert '<b>Renamed</b>' in format_plant_message_html(plant)